@@ -173,6 +173,7 @@ class ScenarioResults:
     third_counts_weighted: defaultdict[str, float]
     fourth_counts_weighted: defaultdict[str, float]
     denom_weighted: float
+    pruned_weight: float = 0.0  # weight of margin-sensitive masks resolved at the default margin under odds_epsilon
 
 
 # -------------------------
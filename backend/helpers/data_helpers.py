@@ -24,6 +24,15 @@ from backend.helpers.data_classes import (
 # -------------------------
 
 SPACE_RE = re.compile(r"\s+")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# Special-case fixes applied by to_normal_case after str.title().
+_MC_PREFIX_RE = re.compile(r"\bMc([a-z])")
+_POSSESSIVE_S_RE = re.compile(r"(['’])S\b")
+_DIBER_RE = re.compile(r"\bDiber")
+_BARE_ST_RE = re.compile(r"\bSt\b(?!\.)")
+_DESOTO_RE = re.compile(r"\bDesoto\b")
+_SAINT_RE = re.compile(r"\bSaint\b")
 
 # The three patterns below assume *s* has already had internal whitespace runs
 # collapsed to single spaces (see normalize_nces_school_name), so a literal " "
@@ -239,11 +248,11 @@ def to_normal_case(s: str) -> str:
     if not s:
         return s
     t = s.title()
-    t = re.sub(r"\bMc([a-z])", lambda m: "Mc" + m.group(1).upper(), t)
-    t = re.sub(r"(['’])S\b", r"\1s", t)
-    t = re.sub(r"\bDiber", "D'Iber", t)
-    t = re.sub(r"\bSt\b(?!\.)", "St.", t)
-    t = re.sub(r"\bDesoto\b", "DeSoto", t)
+    t = _MC_PREFIX_RE.sub(lambda m: "Mc" + m.group(1).upper(), t)
+    t = _POSSESSIVE_S_RE.sub(r"\1s", t)
+    t = _DIBER_RE.sub("D'Iber", t)
+    t = _BARE_ST_RE.sub("St.", t)
+    t = _DESOTO_RE.sub("DeSoto", t)
     return t
 
 
@@ -276,7 +285,7 @@ def normalize_nces_school_name(s: str) -> str:
     s = _NCES_PREMOD_RE.sub("", s).strip()
     s = _NCES_SUFFIX_RE.sub("", s).strip()
     s = to_normal_case(s)
-    s = re.sub(r"\bSaint\b", "St.", s)
+    s = _SAINT_RE.sub("St.", s)
     s = s.replace("J Z George", "J.Z. George")
     s = s.replace("M S Palmer", "M. S. Palmer")
     s = s.replace("H W Byers", "H. W. Byers")
@@ -364,7 +373,7 @@ def _normalize_ws(t: str) -> str:
     t = unicodedata.normalize("NFKC", t)
     t = t.replace("\r\n", "\n").replace("\r", "\n").replace("\u00a0", " ")
     # collapse 3+ newlines to 2 to avoid giant gaps
-    t = re.sub(r"\n{3,}", "\n\n", t)
+    t = _BLANK_LINES_RE.sub("\n\n", t)
     return t
 
 
@@ -386,7 +395,7 @@ def to_plain_text(html: str) -> str:
 
     # 2) normalize unicode, convert NBSP to space, collapse whitespace
     text = unicodedata.normalize("NFKC", text).replace("\u00a0", " ")
-    text = re.sub(r"\s+", " ", text).strip()
+    text = SPACE_RE.sub(" ", text).strip()
     return text
 
 
@@ -584,12 +593,14 @@ def get_completed_games(raw_results: list[RawCompletedGame]) -> list[CompletedGa
 # Game status parsing
 # ---------------------------------------------------------------------------
 
-# Matches regulation clock strings like "8:00 1Q", "0:24 4Q", "11:47 2Q"
-_REG_CLOCK_RE = re.compile(r"^(?P<mm>\d{1,2}):(?P<ss>\d{2})\s+(?P<q>[1-4])Q$", re.IGNORECASE)
-# Matches OT in-progress strings: "OT", "1OT", "2OT", "3OT", …
-_OT_PROGRESS_RE = re.compile(r"^(?P<n>\d*)OT$", re.IGNORECASE)
-# Matches OT-ended strings: "End OT", "End 1OT", "End 2OT", …
-_OT_END_RE = re.compile(r"^End\s+(?P<n>\d*)OT$", re.IGNORECASE)
+# Matches every live-clock form in one pass; the group that matched selects the branch:
+#   regulation clock "8:00 1Q", "0:24 4Q", "11:47 2Q"   → mm / ss / q
+#   OT in progress   "OT", "1OT", "2OT", …               → n
+#   OT ended         "End OT", "End 1OT", "End 2OT", …   → end + n
+_GAME_CLOCK_RE = re.compile(
+    r"^(?:(?P<mm>\d{1,2}):(?P<ss>\d{2})\s+(?P<q>[1-4])Q|(?P<end>End\s+)?(?P<n>\d*)OT)$",
+    re.IGNORECASE,
+)
 
 _TERMINAL_STATUS_MAP: dict[str, GameStatus] = {
     "final": GameStatus.FINAL,
@@ -613,13 +624,10 @@ def normalize_game_status(raw: str | None) -> GameStatus:
     lower = norm.lower()
     if lower in _TERMINAL_STATUS_MAP:
         return _TERMINAL_STATUS_MAP[lower]
-    if _OT_END_RE.match(norm):
-        return GameStatus.END_OT
-    if _OT_PROGRESS_RE.match(norm):
-        return GameStatus.IN_PROGRESS
-    if _REG_CLOCK_RE.match(norm):
-        return GameStatus.IN_PROGRESS
-    return GameStatus.NOT_STARTED
+    m = _GAME_CLOCK_RE.match(norm)
+    if m is None:
+        return GameStatus.NOT_STARTED
+    return GameStatus.END_OT if m.group("end") else GameStatus.IN_PROGRESS
 
 
 def parse_game_clock(raw: str | None) -> GameClock:
@@ -632,27 +640,25 @@ def parse_game_clock(raw: str | None) -> GameClock:
     """
     norm = (raw or "").strip()
 
-    reg_m = _REG_CLOCK_RE.match(norm)
-    if reg_m:
-        mm = int(reg_m.group("mm"))
-        ss = int(reg_m.group("ss"))
+    m = _GAME_CLOCK_RE.match(norm)
+    if m is None:
+        # No live-clock form matched, so only the terminal/break map can apply.
+        return GameClock(
+            status=_TERMINAL_STATUS_MAP.get(norm.lower(), GameStatus.NOT_STARTED), quarter=None, clock=None
+        )
+
+    if m.group("q"):
+        mm = int(m.group("mm"))
+        ss = int(m.group("ss"))
         return GameClock(
             status=GameStatus.IN_PROGRESS,
-            quarter=int(reg_m.group("q")),
+            quarter=int(m.group("q")),
             clock=f"{mm}:{ss:02d}",
         )
 
-    ot_m = _OT_PROGRESS_RE.match(norm)
-    if ot_m:
-        ot_n = int(ot_m.group("n") or "1")
-        return GameClock(status=GameStatus.IN_PROGRESS, quarter=4 + ot_n, clock=None)
-
-    ot_end_m = _OT_END_RE.match(norm)
-    if ot_end_m:
-        ot_n = int(ot_end_m.group("n") or "1")
-        return GameClock(status=GameStatus.END_OT, quarter=4 + ot_n, clock=None)
-
-    return GameClock(status=normalize_game_status(raw), quarter=None, clock=None)
+    ot_n = int(m.group("n") or "1")
+    status = GameStatus.END_OT if m.group("end") else GameStatus.IN_PROGRESS
+    return GameClock(status=status, quarter=4 + ot_n, clock=None)
 
 
 def game_seconds_remaining(quarter: int, clock: str) -> int:
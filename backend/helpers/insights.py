@@ -128,6 +128,7 @@ def _verify_insight_margins(
     playoff_seeds: int = _PLAYOFF_SEEDS,
     pa_win: int = 14,
     base_margin_default: int = 7,
+    resolver=None,
 ) -> bool:
     """Return True if the insight holds for all satisfying masks and margin combos.
 
@@ -139,11 +140,16 @@ def _verify_insight_margins(
         expected_seed: If set, team must be at exactly this 1-indexed seed.
         expected_in_playoffs: If True, team must be in top playoff_seeds.
             If False, team must NOT be in top playoff_seeds.
+        resolver: Optional ``make_cached_resolver`` result for this region,
+            shared across candidates so overlapping masks resolve once.
     """
     if r_computed <= 4:
         return True
 
-    from backend.helpers.tiebreakers import resolve_standings_for_mask
+    if resolver is None:
+        from backend.helpers.tiebreakers import make_cached_resolver
+
+        resolver = make_cached_resolver(teams, completed, remaining, base_margin_default, pa_win)
 
     R = len(remaining)
     pairs = [(rg.a, rg.b) for rg in remaining]
@@ -156,9 +162,7 @@ def _verify_insight_margins(
             margins = dict(base_margins)
             for k, game_idx in enumerate(cond_indices):
                 margins[pairs[game_idx]] = margin_combo[k]
-            seeding = resolve_standings_for_mask(
-                teams, completed, remaining, mask, margins, base_margin_default, pa_win
-            )
+            seeding = resolver(mask, margins)[0]
             team_pos = seeding.index(team) if team in seeding else len(seeding)
             if expected_seed is not None:
                 if team_pos != expected_seed - 1:
@@ -186,6 +190,7 @@ def _extract_clinch_seed_insights(
     playoff_seeds: int = _PLAYOFF_SEEDS,
     pa_win: int = 14,
     base_margin_default: int = 7,
+    resolver=None,
 ) -> list[KeyInsight]:
     """Extract clinch-seed insights: atoms that guarantee a specific seed position."""
     results = []
@@ -209,6 +214,7 @@ def _extract_clinch_seed_insights(
                     playoff_seeds=playoff_seeds,
                     pa_win=pa_win,
                     base_margin_default=base_margin_default,
+                    resolver=resolver,
                 ):
                     continue
                 results.append(
@@ -236,6 +242,7 @@ def _extract_clinch_playoffs_insights(
     playoff_seeds: int = _PLAYOFF_SEEDS,
     pa_win: int = 14,
     base_margin_default: int = 7,
+    resolver=None,
 ) -> list[KeyInsight]:
     """Extract clinch-playoffs insights not already covered by a clinch-seed insight."""
     covered_by_team: dict[str, set[frozenset]] = {}
@@ -271,6 +278,7 @@ def _extract_clinch_playoffs_insights(
                     playoff_seeds=playoff_seeds,
                     pa_win=pa_win,
                     base_margin_default=base_margin_default,
+                    resolver=resolver,
                 ):
                     continue
                 results.append(
@@ -297,6 +305,7 @@ def _extract_elimination_insights(
     playoff_seeds: int = _PLAYOFF_SEEDS,
     pa_win: int = 14,
     base_margin_default: int = 7,
+    resolver=None,
 ) -> list[KeyInsight]:
     """Extract elimination insights from atoms[team][playoff_seeds+1]."""
     elim_seed = playoff_seeds + 1
@@ -319,6 +328,7 @@ def _extract_elimination_insights(
                 playoff_seeds=playoff_seeds,
                 pa_win=pa_win,
                 base_margin_default=base_margin_default,
+                resolver=resolver,
             ):
                 continue
             results.append(
@@ -394,6 +404,13 @@ def extract_insights(
     """
     if odds is None:
         odds = {}
+    # Candidates re-check many of the same masks, so above R=4 (where
+    # verification runs) one cached resolver serves all of them.
+    resolver = None
+    if r_computed > 4:
+        from backend.helpers.tiebreakers import make_cached_resolver
+
+        resolver = make_cached_resolver(teams, completed, remaining, base_margin_default, pa_win)
 
     results: list[KeyInsight] = []
 
@@ -435,6 +452,7 @@ def extract_insights(
         playoff_seeds,
         pa_win,
         base_margin_default,
+        resolver=resolver,
     )
     clinch_playoffs = _extract_clinch_playoffs_insights(
         atoms,
@@ -447,6 +465,7 @@ def extract_insights(
         playoff_seeds,
         pa_win,
         base_margin_default,
+        resolver=resolver,
     )
     elimination = _extract_elimination_insights(
         atoms,
@@ -458,6 +477,7 @@ def extract_insights(
         playoff_seeds,
         pa_win,
         base_margin_default,
+        resolver=resolver,
     )
 
     results.extend(clinch_seed)
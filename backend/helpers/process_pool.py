@@ -0,0 +1,59 @@
+"""Fan independent chunks of an enumeration across a process pool.
+
+``determine_scenarios`` and ``enumerate_outcomes`` both resolve every outcome
+mask on its own, so contiguous spans of masks can be handed to worker
+processes and the partial results combined in span order.  Resolution is pure
+Python and GIL-bound, so processes are used rather than threads.  The
+loop-invariant region inputs are installed once per worker by the pool
+initializer, so each submission only pickles its own chunk arguments.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+# ``(fn, shared_args)`` installed once per worker process by ``_init_worker``.
+_WORKER_TASK: tuple[Callable, tuple] | None = None
+
+
+def _init_worker(fn: Callable, shared_args: tuple) -> None:
+    """Process-pool initializer: stash the chunk function and its shared arguments."""
+    global _WORKER_TASK
+    _WORKER_TASK = (fn, shared_args)
+
+
+def _run_chunk(chunk_args: tuple):
+    """Process-pool entry point: call the stashed function on one chunk."""
+    fn, shared_args = _WORKER_TASK
+    return fn(*shared_args, *chunk_args)
+
+
+def split_range(total: int, n_chunks: int) -> list[tuple[int, int]]:
+    """Split ``range(total)`` into at most *n_chunks* contiguous ``(lo, hi)`` spans.
+
+    Span lengths differ by at most one, longer spans first.
+    """
+    n_chunks = max(1, min(n_chunks, total))
+    step, extra = divmod(total, n_chunks)
+    chunks: list[tuple[int, int]] = []
+    lo = 0
+    for i in range(n_chunks):
+        hi = lo + step + (1 if i < extra else 0)
+        chunks.append((lo, hi))
+        lo = hi
+    return chunks
+
+
+def map_chunks(fn: Callable, shared_args: tuple, chunk_args: Iterable[tuple], max_workers: int) -> Iterator:
+    """Yield ``fn(*shared_args, *args)`` for each ``args`` in *chunk_args*, in order.
+
+    Args:
+        fn: Module-level function to run in the workers (it is pickled by name).
+        shared_args: Leading arguments common to every chunk, sent once per worker.
+        chunk_args: Trailing arguments for each chunk, e.g. ``(mask_lo, mask_hi)``.
+        max_workers: Number of worker processes.
+
+    Yields:
+        Each chunk's result, in the order of *chunk_args*.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(fn, shared_args)) as pool:
+        yield from pool.map(_run_chunk, chunk_args)
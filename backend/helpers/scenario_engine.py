@@ -0,0 +1,110 @@
+"""Run ``determine_scenarios`` under a separate Python interpreter.
+
+The enumeration in ``backend.helpers.scenarios`` is pure Python over plain
+lists and dataclasses, with no NumPy, Prefect or database imports, so it runs
+unchanged under an alternative interpreter such as PyPy, whose JIT suits
+its small-loop, dict-heavy style.  ``determine_scenarios_external`` pickles
+the region inputs to ``<python> -m backend.helpers.scenario_engine`` on
+stdin and unpickles the ``ScenarioResults`` the child writes to a temporary
+file, so nothing the child prints can corrupt the result.  The caller keeps
+its own interpreter (and its psycopg connection) for I/O.
+
+``get_region_seeding_odds`` routes through here when the Prefect worker's
+``SCENARIO_PYTHON`` environment variable names an interpreter.  The
+interpreter is deployment config, never a flow-run parameter: it is executed
+and its output unpickled, so it must be trusted.
+
+Usage from CPython::
+
+    results = determine_scenarios_external("pypy3", teams, completed, remaining)
+"""
+
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from backend.helpers.data_classes import CompletedGame, RemainingGame, ScenarioResults, WinProbFn, equal_win_prob
+from backend.helpers.scenarios import determine_scenarios
+
+# Directory holding the ``backend`` package, put on the child's PYTHONPATH.
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+class _TableWinProb:
+    """Picklable ``WinProbFn`` that looks up precomputed per-game probabilities.
+
+    ``win_prob_fn`` is often a closure over ratings and cannot cross a process
+    boundary, but ``determine_scenarios`` only ever asks about the remaining
+    games, so their probabilities are evaluated by the caller and shipped as
+    a table keyed by ``(team_a, team_b, location_a)``.
+    """
+
+    def __init__(self, probs: dict[tuple, float]) -> None:
+        """Store the ``(team_a, team_b, location_a) -> probability`` table."""
+        self.probs = probs
+
+    def __call__(self, team_a: str, team_b: str, date_str: str | None = None, location_a: str | None = None) -> float:
+        """Return the stored probability that ``team_a`` beats ``team_b``."""
+        return self.probs[(team_a, team_b, location_a)]
+
+
+def determine_scenarios_external(
+    python: str,
+    teams: list[str],
+    completed: list[CompletedGame],
+    remaining: list[RemainingGame],
+    win_prob_fn: WinProbFn | None = None,
+    **options,
+) -> ScenarioResults:
+    """Compute ``determine_scenarios`` for one region in a child interpreter.
+
+    Args:
+        python: Interpreter to run, e.g. ``"pypy3"`` or ``sys.executable``.
+            It must be able to import this package's dependencies.
+        teams: List of all team names in the region.
+        completed: List of CompletedGame instances for finished region games.
+        remaining: List of RemainingGame instances for unplayed region games.
+        win_prob_fn: Optional win-probability callable, evaluated here for each
+            remaining game.  Defaults to ``equal_win_prob``.
+        **options: Further keyword arguments for ``determine_scenarios``
+            (``ignore_margins``, ``n_samples``, ``max_workers``, ``odds_epsilon``).
+
+    Returns:
+        The ``ScenarioResults`` computed by the child.
+
+    Raises:
+        RuntimeError: If the child interpreter exits with an error; its stderr
+            is included in the message.
+    """
+    _win_prob_fn = win_prob_fn if win_prob_fn is not None else equal_win_prob
+    probs = {(rg.a, rg.b, rg.location_a): _win_prob_fn(rg.a, rg.b, None, rg.location_a) for rg in remaining}
+    payload = pickle.dumps((teams, completed, remaining, probs, options))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(_PROJECT_ROOT), env.get("PYTHONPATH")) if p)
+    with tempfile.TemporaryDirectory() as tmp:
+        out_path = Path(tmp) / "results.pickle"
+        proc = subprocess.run(
+            [python, "-m", "backend.helpers.scenario_engine", str(out_path)],
+            input=payload,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            env=env,
+            check=False,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"{python} scenario engine failed: {proc.stderr.decode(errors='replace').strip()}")
+        return pickle.loads(out_path.read_bytes())
+
+
+def main() -> None:
+    """Read pickled region inputs from stdin and write pickled ``ScenarioResults`` to the path in ``argv[1]``."""
+    teams, completed, remaining, probs, options = pickle.load(sys.stdin.buffer)
+    results = determine_scenarios(teams, completed, remaining, win_prob_fn=_TableWinProb(probs), **options)
+    Path(sys.argv[1]).write_bytes(pickle.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 
 from dataclasses import replace
 from datetime import date
+from functools import lru_cache
 from typing import cast
 
 from backend.helpers.data_classes import (
@@ -17,8 +18,13 @@ from backend.helpers.data_classes import (
 from backend.helpers.scenario_serializers import serialize_atom, serialize_condition
 
 
+@lru_cache(maxsize=4096)
 def _render_game_result(cond: GameResult) -> str:
-    """Render a GameResult as a plain-English phrase."""
+    """Render a GameResult as a plain-English phrase.
+
+    Cached: the same frozen ``GameResult`` recurs across many atoms, teams and
+    scenarios of a division, so each distinct condition is formatted once.
+    """
     base = f"{cond.winner} beats {cond.loser}"
     if cond.min_margin == 1 and cond.max_margin is None:
         return base
@@ -721,16 +727,18 @@ def _render_pre_playoff_block(
             atoms = seed_atoms.get(team_name, {}).get(seed, [])
             remaining = conds[1:]
 
-            # Pre-render the remaining HomeGameConditions (same for every atom)
-            remaining_labels = [_substitute_team_placeholder(_render_condition_label(c), team_name) for c in remaining]
+            # Pre-render the remaining HomeGameConditions once as a joined suffix
+            # (same for every atom) so each atom costs a single f-string.
+            tail = "".join(
+                f" AND {_substitute_team_placeholder(_render_condition_label(c), team_name)}" for c in remaining
+            )
+            note = f"   [{sc.explanation}]" if sc.explanation else None
 
             for atom in atoms:
                 n += 1
-                parts = [_render_atom(atom)] + remaining_labels
-                line = f"{n}. " + " AND ".join(parts)
-                lines.append(line)
-                if sc.explanation:
-                    lines.append(f"   [{sc.explanation}]")
+                lines.append(f"{n}. {_render_atom(atom)}{tail}")
+                if note:
+                    lines.append(note)
         else:
             # Fallback: flatten all conditions to a single numbered line
             n += 1
@@ -10,6 +10,7 @@ Round-trip guarantee:
     deserialize_complete_scenarios(serialize_complete_scenarios(cs)) == cs
 """
 
+import json
 from typing import cast
 
 from backend.helpers.data_classes import (
@@ -20,6 +21,10 @@ from backend.helpers.data_classes import (
     PDRankCondition,
 )
 
+# Compact encoder for JSONB payloads: Postgres normalizes whitespace on the way
+# in, so the separators' padding would only inflate the query text.
+_COMPACT_JSON = json.JSONEncoder(separators=(",", ":"))
+
 # ---------------------------------------------------------------------------
 # Individual condition serialization
 # ---------------------------------------------------------------------------
@@ -182,21 +187,35 @@ def serialize_complete_scenarios(scenarios: list[dict]) -> list[dict]:
         "seeding": [team, ...]
     }
     """
-    result = []
-    for sc in scenarios:
-        atom = sc.get("conditions_atom")
-        result.append(
-            {
-                "scenario_num": sc["scenario_num"],
-                "sub_label": sc["sub_label"],
-                "game_winners": [list(gw) for gw in sc["game_winners"]],
-                "conditions_atom": serialize_atom(atom) if atom is not None else None,
-                "tiebreaker_groups": sc.get("tiebreaker_groups"),
-                "coinflip_groups": sc.get("coinflip_groups"),
-                "seeding": list(sc["seeding"]),
-            }
-        )
-    return result
+    return [_serialize_complete_scenario(sc) for sc in scenarios]
+
+
+def _serialize_complete_scenario(sc: dict) -> dict:
+    """Serialize one scenario dict (see ``serialize_complete_scenarios``)."""
+    atom = sc.get("conditions_atom")
+    return {
+        "scenario_num": sc["scenario_num"],
+        "sub_label": sc["sub_label"],
+        "game_winners": [list(gw) for gw in sc["game_winners"]],
+        "conditions_atom": serialize_atom(atom) if atom is not None else None,
+        "tiebreaker_groups": sc.get("tiebreaker_groups"),
+        "coinflip_groups": sc.get("coinflip_groups"),
+        "seeding": list(sc["seeding"]),
+    }
+
+
+def dumps_complete_scenarios(scenarios: list[dict]) -> str:
+    """Encode the output of enumerate_division_scenarios() as compact JSON text.
+
+    Decodes to ``serialize_complete_scenarios(scenarios)``, but each scenario
+    is serialized and encoded in turn, so only one serialized dict exists at
+    a time rather than the full list (several times the size of its JSON text
+    for a large region).  The encoded pieces are still collected before they
+    are joined.  Suitable as the ``dumps`` of a psycopg2 ``Json`` wrapping the
+    raw scenario list.
+    """
+    encode = _COMPACT_JSON.encode
+    return "[" + ",".join(encode(_serialize_complete_scenario(sc)) for sc in scenarios) + "]"
 
 
 def deserialize_complete_scenarios(data: list[dict]) -> list[dict]:
@@ -7,20 +7,32 @@ game from the conditions.  Margin-sensitive masks (where winning margins change
 the seeding) are presented as lettered sub-scenarios (6a, 6b, …).
 """
 
+from bisect import insort
 from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from itertools import permutations, product
+from operator import itemgetter
 
 from backend.helpers.data_classes import (
     CoinFlipResult,
     CompletedGame,
     GameResult,
+    MarginCondition,
     PDRankCondition,
     RemainingGame,
     StandingsOdds,
 )
+from backend.helpers.process_pool import map_chunks, split_range
 from backend.helpers.scenario_renderer import _render_atom
-from backend.helpers.tiebreakers import resolve_standings_for_mask
+from backend.helpers.tiebreakers import (
+    make_cached_resolver,
+    record_ids_for_masks,
+    resolve_standings_for_mask,
+    results_across_margin_range,
+    standings_from_mask,
+    tie_bucket_groups,
+)
 
 # ---------------------------------------------------------------------------
 # Shared enumeration result
@@ -36,9 +48,11 @@ class EnumeratedOutcomes:
     running the 12^R margin enumeration twice per pipeline invocation.
 
     Attributes:
-        groups: Maps ``(mask, full_seeding)`` to a list of margin dicts that
-            produce that seeding under that mask.  Non-sensitive masks have an
-            empty list (all margins produce the same seeding).
+        groups: Maps ``(mask, full_seeding)`` to a list of margin vectors that
+            produce that seeding under that mask.  Each vector is a tuple of
+            margins aligned with ``pairs``; ``_margin_dicts`` expands them into
+            the pair-keyed dicts the atom helpers consume.  Non-sensitive masks
+            have an empty list (all margins produce the same seeding).
         non_sensitive_masks: Set of mask integers where the full seeding is
             identical for every margin combination (corner-evaluation confirmed).
         pairs: Ordered ``(team_a, team_b)`` pairs for each remaining game.
@@ -46,7 +60,7 @@ class EnumeratedOutcomes:
         total_combos: ``12 ** R`` — the full margin combination count per mask.
     """
 
-    groups: dict  # (mask, full_seeding) -> list[dict]
+    groups: dict  # (mask, full_seeding) -> list[tuple[int, ...]]
     non_sensitive_masks: set
     pairs: list
     R: int
@@ -72,6 +86,11 @@ def _game_winners_for_mask(mask: int, remaining: list[RemainingGame]) -> list[tu
     return result
 
 
+def _margin_dicts(pairs: list[tuple[str, str]], margin_vectors: list[tuple[int, ...]]) -> list[dict]:
+    """Expand margin vectors aligned with *pairs* into ``{(team_a, team_b): margin}`` dicts."""
+    return [dict(zip(pairs, vector)) for vector in margin_vectors]
+
+
 def _common_game_winners(masks: list[int], remaining: list[RemainingGame]) -> list[tuple[str, str]]:
     """Return (winner, loser) only for games whose winner is constant across *masks*.
 
@@ -346,6 +365,11 @@ def _split_non_rectangular_atom(
     return None
 
 
+def _tied_teams(teams, wl_totals) -> set[str]:
+    """Return the teams that share a multi-team tie bucket under *wl_totals*."""
+    return {t for bucket in tie_bucket_groups(teams, wl_totals) if len(bucket) > 1 for t in bucket}
+
+
 def _is_margin_sensitive_mask(
     teams,
     completed,
@@ -354,6 +378,8 @@ def _is_margin_sensitive_mask(
     pairs: list[tuple],
     pa_win: int,
     base_margin_default: int,
+    resolver=None,
+    tied: set[str] | None = None,
 ) -> bool:
     """Return True if the mask's full seeding varies with winning margins.
 
@@ -366,13 +392,37 @@ def _is_margin_sensitive_mask(
     Checks full seeding (not just top-N) so that ``EnumeratedOutcomes`` is
     usable by both ``build_scenario_atoms`` (which truncates to top-N internally)
     and ``enumerate_division_scenarios`` (which displays the complete seeding).
+
+    Only games with a team in a multi-team tie bucket are varied.  Buckets come
+    from W/L/T records, which ignore margins, and Steps 3-5 only read the point
+    differentials and points allowed of tied teams, so every other game's margin
+    is pinned at 1 and the corner walk covers the relevant sub-cube only.
+
+    When *resolver* (from ``make_cached_resolver``) is given, corner
+    resolutions go through its cache so a following 12^R enumeration of the
+    same mask reuses them.
+
+    *tied* is the set of teams in multi-team tie buckets under this mask; it
+    depends only on the W/L/T records, so callers walking many masks can pass
+    one set per distinct record vector instead of rebuilding standings here.
     """
-    R = len(remaining)
+    if tied is None:
+        wl_totals = standings_from_mask(teams, completed, remaining, mask, pa_win, {}, base_margin_default)
+        tied = _tied_teams(teams, wl_totals)
+    relevant = [pairs[i] for i, rg in enumerate(remaining) if rg.a in tied or rg.b in tied]
+    if not relevant:
+        return False
+
+    margins = dict.fromkeys(pairs, 1)
     reference: tuple | None = None
-    for corner in product((1, 12), repeat=R):
-        margins = {pairs[i]: corner[i] for i in range(R)}
-        order = resolve_standings_for_mask(teams, completed, remaining, mask, margins, base_margin_default, pa_win)
-        full = tuple(order)
+    for corner in product((1, 12), repeat=len(relevant)):
+        margins.update(zip(relevant, corner))
+        if resolver is not None:
+            full = resolver(mask, margins)[0]
+        else:
+            full = tuple(
+                resolve_standings_for_mask(teams, completed, remaining, mask, margins, base_margin_default, pa_win)
+            )
         if reference is None:
             reference = full
         elif full != reference:
@@ -420,11 +470,13 @@ def _derive_atom(
 
     lows = [12] * R
     highs = [1] * R
-    for margins in valid_margins_list:
+    if valid_margins_list:
+        # One builtin min/max per game column instead of a Python min/max per
+        # (combo, game); itemgetter pulls each column out in C.
         for i, pair in enumerate(pairs):
-            m = margins[pair]
-            lows[i] = min(lows[i], m)
-            highs[i] = max(highs[i], m)
+            column = list(map(itemgetter(pair), valid_margins_list))
+            lows[i] = min(column)
+            highs[i] = max(column)
 
     # --- Step 2: build GameResult list ---
     atom: list = []
@@ -554,6 +606,335 @@ def _predict_valid_set_2d(
     return valid
 
 
+def _gr_pair(c: GameResult) -> tuple:
+    """Return a canonical (sorted) team-pair key for a GameResult."""
+    return tuple(sorted([c.winner, c.loser]))
+
+
+@lru_cache(maxsize=4096)
+def _complement_of(c: GameResult) -> GameResult | None:
+    """Return the GameResult that, together with *c*, covers every outcome of its game.
+
+    Only an unconstrained result (min=1, max=None) has such a complement — the
+    unconstrained result with winner and loser swapped.  Margin-qualified results
+    return None.  Cached because the minimizer asks this of the same handful of
+    conditions many thousands of times.
+    """
+    if c.min_margin != 1 or c.max_margin is not None:
+        return None
+    return GameResult(c.loser, c.winner, 1, None)
+
+
+def _may_pair(sig_a: tuple[int, int, int], sig_b: tuple[int, int, int], n_diff: int) -> bool:
+    """Cheap necessary condition for a rule needing *n_diff* differing games.
+
+    Rules 3/4 (``n_diff=2``) require the same set of game pairs and
+    exactly *n_diff* pairs whose ``GameResult`` differs, i.e. ``2 * n_diff``
+    conditions in the symmetric difference.  Exactly one of those games is
+    the complementary one with its winner flipped, so the winner masks must
+    differ in a single bit.
+    """
+    return (
+        sig_a[0] == sig_b[0]
+        and (sig_a[1] ^ sig_b[1]).bit_count() == 2 * n_diff
+        and (sig_a[2] ^ sig_b[2]).bit_count() == 1
+    )
+
+
+def _try_merge(a: list, b: list) -> list | None:
+    """Return a merged atom if a and b can be simplified in one step, else None."""
+    gr_a: dict[tuple, GameResult] = {}
+    gr_b: dict[tuple, GameResult] = {}
+    mc_a: list = []
+    mc_b: list = []
+    order: list = []  # ('gr', pair) or ('mc', index) — preserves atom-a structure
+
+    for c in a:
+        if isinstance(c, GameResult):
+            p = _gr_pair(c)
+            gr_a[p] = c
+            order.append(("gr", p))
+        else:
+            mc_a.append(c)
+            order.append(("mc", len(mc_a) - 1))
+
+    for c in b:
+        if isinstance(c, GameResult):
+            gr_b[_gr_pair(c)] = c
+        else:
+            mc_b.append(c)
+
+    # Non-GameResult conditions (MarginCondition, CoinFlipResult, …) must be
+    # identical in both atoms — use equality rather than attribute access so
+    # frozen dataclasses (like CoinFlipResult) compare correctly.
+    if len(mc_a) != len(mc_b) or any(x != y for x, y in zip(mc_a, mc_b)):
+        return None
+
+    # Same set of game pairs required
+    if set(gr_a) != set(gr_b):
+        return None
+
+    diff = [p for p in gr_a if gr_a[p] != gr_b[p]]
+    if len(diff) != 1:
+        return None  # 0 = already identical; 2+ = can't reduce in one step
+
+    p = diff[0]
+    ca, cb = gr_a[p], gr_b[p]
+
+    # --- Rule 1: same winner, adjacent / overlapping margin ranges ---
+    if ca.winner == cb.winner:
+        lo = min(ca.min_margin, cb.min_margin)
+        a_hi = ca.max_margin  # exclusive upper bound; None = unbounded
+        b_hi = cb.max_margin
+        # Sort ranges by start so we can check adjacency
+        if ca.min_margin <= cb.min_margin:
+            first_hi, second_lo = a_hi, cb.min_margin
+        else:
+            first_hi, second_lo = b_hi, ca.min_margin
+        # Ranges must be adjacent or overlapping (no gap)
+        if first_hi is not None and second_lo > first_hi:
+            return None
+        hi = None if (a_hi is None or b_hi is None) else max(a_hi, b_hi)
+        merged_gr = GameResult(ca.winner, ca.loser, lo, hi)
+        result = []
+        for kind, val in order:
+            if kind == "gr" and val == p:
+                result.append(merged_gr)
+            elif kind == "gr":
+                result.append(gr_a[val])
+            else:
+                result.append(mc_a[val])
+        return result
+
+    # --- Rule 2: opposite winners, no MarginCondition references this game ---
+    # Both conditions must be fully unconstrained (min=1, max=None) — i.e. together
+    # they cover ALL outcomes of this game.  A margin qualifier on either side means
+    # one range of outcomes is still excluded, so the game cannot be dropped.
+    if ca.loser == cb.winner:
+        if _complement_of(ca) != cb:
+            return None
+        for mc in mc_a:
+            if isinstance(mc, MarginCondition) and (p in mc.add or p in mc.sub):
+                return None
+        return [(gr_a[val] if kind == "gr" else mc_a[val]) for kind, val in order if not (kind == "gr" and val == p)]
+
+    return None
+
+
+def _merge_pass(atoms: list[list]) -> tuple[list[list], bool]:
+    """Run one greedy Rules 1/2 sweep; return ``(atoms, changed)``.
+
+    Each atom is merged with the first later, still-unused atom that
+    ``_try_merge`` accepts.  Two such atoms agree on everything except one
+    game, so they share a drop-one key (the game pair, the remaining
+    ``GameResult`` conditions and the other conditions); candidates come
+    from an index on those keys instead of a scan over every later atom.
+    """
+    index: dict[tuple, list[int]] = defaultdict(list)
+    atom_keys: list[list[tuple]] = []
+    for k, atom in enumerate(atoms):
+        gr: dict[tuple, GameResult] = {}
+        others: list = []
+        for c in atom:
+            if isinstance(c, GameResult):
+                gr[_gr_pair(c)] = c
+            else:
+                others.append(c)
+        rest = frozenset(gr.values())
+        keys = [(p, rest - {c}, tuple(others)) for p, c in gr.items()]
+        for key in keys:
+            index[key].append(k)
+        atom_keys.append(keys)
+
+    new_atoms: list[list] = []
+    used: set[int] = set()
+    for i, atom in enumerate(atoms):
+        if i in used:
+            continue
+        for j in sorted({j for key in atom_keys[i] for j in index[key] if j > i and j not in used}):
+            merged = _try_merge(atom, atoms[j])
+            if merged is not None:
+                new_atoms.append(merged)
+                used.add(j)
+                break
+        else:
+            new_atoms.append(atom)
+    return new_atoms, bool(used)
+
+
+def _subsumes(gr_a: dict[tuple, GameResult], gr_b: dict[tuple, GameResult]) -> bool:
+    """Return True if atom *a* subsumes atom *b* (b can be dropped when a exists).
+
+    Both arguments are the atoms' ``GameResult`` conditions keyed by team pair.
+    a subsumes b when every assignment satisfying b also satisfies a.  This
+    holds when:
+      - Every game pair in a also appears in b with the same winner.
+      - a's margin range for that game is a superset of (weaker than) b's range:
+        a.min_margin <= b.min_margin and (a.max_margin is None or a.max_margin >= b.max_margin).
+      - b may have additional conditions that a does not (making b strictly tighter).
+      - a has no MarginConditions (the caller never offers such atoms as *a*).
+    """
+    for p, ca in gr_a.items():
+        cb = gr_b.get(p)
+        if cb is None or ca.winner != cb.winner:
+            return False
+        if ca.min_margin > cb.min_margin:
+            return False
+        if ca.max_margin is not None:
+            if cb.max_margin is None or ca.max_margin < cb.max_margin:
+                return False
+    return True
+
+
+def _dominated(atoms: list[list]) -> set[int]:
+    """Return the indices of atoms subsumed by some other atom in *atoms*.
+
+    Rather than testing every ordered pair, each candidate subsumer is
+    indexed under its smallest game pair: a can only subsume b when all of
+    a's pairs appear in b, so b need only be checked against the atoms
+    filed under one of its own pairs (plus any unconditional atom).
+    """
+    gr_maps = [{_gr_pair(c): c for c in a if isinstance(c, GameResult)} for a in atoms]
+    by_first_pair: dict[tuple | None, list[int]] = defaultdict(list)
+    for i, a in enumerate(atoms):
+        if any(not isinstance(c, GameResult) for c in a):
+            continue  # MarginConditions in a: skip
+        by_first_pair[min(gr_maps[i]) if a else None].append(i)
+    unconditional = by_first_pair.get(None, [])
+    dominated: set[int] = set()
+    for j, gr_b in enumerate(gr_maps):
+        candidates = [*unconditional, *(i for p in gr_b for i in by_first_pair.get(p, ()))]
+        if any(i != j and _subsumes(gr_maps[i], gr_b) for i in candidates):
+            dominated.add(j)
+    return dominated
+
+
+def _try_rule3(a: list, b: list) -> list | None:
+    """Rule 3 — Complementary lifting.
+
+    If atoms a and b share identical conditions except for two game pairs —
+    one complementary (X_a / X_b, opposite unconstrained winners) and one
+    tightening (G(lo) in a, G(hi) in b with lo < hi) — then b can be
+    replaced with [G(hi)] plus all shared (non-diff) conditions.
+
+    Correctness: for any shared conditions R,
+      (X_a ∧ G_lo+ ∧ R) ∨ (X_b ∧ G_hi+ ∧ R)
+      = R ∧ ((X_a ∧ G_lo+) ∨ (X_b ∧ G_hi+))
+      = R ∧ (G_hi+ ∨ (X_a ∧ G_lo+))
+      = (G_hi+ ∧ R) ∨ (X_a ∧ G_lo+ ∧ R)
+
+    The simplified form makes it clear that G winning by hi+ (plus the
+    shared conditions R) is sufficient regardless of which team wins X.
+    """
+    gr_a = {_gr_pair(c): c for c in a if isinstance(c, GameResult)}
+    gr_b = {_gr_pair(c): c for c in b if isinstance(c, GameResult)}
+
+    if set(gr_a) != set(gr_b):
+        return None
+    # No MarginConditions in either atom (not needed for current use cases)
+    if any(not isinstance(c, GameResult) for c in a):
+        return None
+    if any(not isinstance(c, GameResult) for c in b):
+        return None
+
+    diff = [p for p in gr_a if gr_a[p] != gr_b[p]]
+    if len(diff) != 2:
+        return None
+
+    for p_comp, p_tight in [(diff[0], diff[1]), (diff[1], diff[0])]:
+        ca_c, cb_c = gr_a[p_comp], gr_b[p_comp]
+        ca_t, cb_t = gr_a[p_tight], gr_b[p_tight]
+
+        # Complementary game: opposite winners, both unconstrained
+        if _complement_of(ca_c) != cb_c:
+            continue
+
+        # Tightening game: same winner/loser, a is wider (lower min), b is tighter
+        if ca_t.winner != cb_t.winner or ca_t.loser != cb_t.loser:
+            continue
+        if ca_t.min_margin >= cb_t.min_margin:
+            continue  # a is not the wider one
+        # a must fully cover b's range (a extends to None, or a's max > b's min)
+        if ca_t.max_margin is not None and ca_t.max_margin <= cb_t.min_margin:
+            continue
+
+        # Preserve shared (non-diff) conditions so the simplified atom
+        # remains tight: (G_hi+ ∧ R) rather than just G_hi+.
+        shared = [gr_a[p] for p in gr_a if p not in {p_comp, p_tight}]
+        return [cb_t] + shared
+
+    return None
+
+
+def _lift(a: list, b: list) -> tuple[list, list] | None:
+    """Rule 3 in the ``(new_a, new_b)`` shape ``_rewrite_until_stable`` expects."""
+    new_b = _try_rule3(a, b)
+    return None if new_b is None else (a, new_b)
+
+
+def _try_rule4(a: list, b: list) -> tuple[list, list] | None:
+    """Rule 4 — Range-containment splitting.
+
+    Applies when atoms a and b differ in exactly two game pairs:
+      - p_comp: opposite unconstrained winners (a has X_a, b has X_b)
+      - p_tight: same winner in both, both starting at min_margin=1,
+        but a's range is strictly contained in b's (a.max_margin < b.max_margin,
+        where None represents ∞)
+
+    Rewrites:
+      (X_a ∧ G[1..M) ∧ R) ∨ (X_b ∧ G[1..N) ∧ R)  [M < N]
+    as the equivalent:
+      (G[1..M) ∧ R) ∨ (X_b ∧ G[M..N) ∧ R)
+
+    Returns (new_a, new_b) on success, None otherwise.
+    """
+    gr_a = {_gr_pair(c): c for c in a if isinstance(c, GameResult)}
+    gr_b = {_gr_pair(c): c for c in b if isinstance(c, GameResult)}
+
+    if set(gr_a) != set(gr_b):
+        return None
+    if any(not isinstance(c, GameResult) for c in a):
+        return None
+    if any(not isinstance(c, GameResult) for c in b):
+        return None
+
+    diff = [p for p in gr_a if gr_a[p] != gr_b[p]]
+    if len(diff) != 2:
+        return None
+
+    for p_comp, p_tight in [(diff[0], diff[1]), (diff[1], diff[0])]:
+        ca_c, cb_c = gr_a[p_comp], gr_b[p_comp]
+        ca_t, cb_t = gr_a[p_tight], gr_b[p_tight]
+
+        # p_comp: opposite unconstrained winners
+        if _complement_of(ca_c) != cb_c:
+            continue
+
+        # p_tight: same winner, same lower bound, a's range strictly narrower
+        if ca_t.winner != cb_t.winner or ca_t.loser != cb_t.loser:
+            continue
+        if ca_t.min_margin != cb_t.min_margin:
+            continue  # lower bounds must match
+        if ca_t.max_margin is None:
+            continue  # a is unbounded — not strictly narrower
+        # a.max_margin < b.max_margin (None = ∞)
+        if cb_t.max_margin is not None and ca_t.max_margin >= cb_t.max_margin:
+            continue
+
+        shared = [gr_a[p] for p in gr_a if p not in {p_comp, p_tight}]
+
+        # new_a: drop p_comp (X result irrelevant when margin is in the narrow range)
+        new_a = [ca_t] + shared
+
+        # new_b: keep X_b, narrow p_tight to [a.max_margin, b.max_margin)
+        new_tight = GameResult(cb_t.winner, cb_t.loser, ca_t.max_margin, cb_t.max_margin)
+        new_b = [cb_c, new_tight] + shared
+
+        return (new_a, new_b)
+
+    return None
+
+
 def _simplify_atom_list(atoms: list[list]) -> list[list]:
     """Minimise a list of atoms using four boolean-simplification rules.
 
@@ -589,10 +970,11 @@ def _simplify_atom_list(atoms: list[list]) -> list[list]:
         A simplified list of atoms.  May be shorter than the input.
         Returns ``[[]]`` if any atom collapses to unconditional.
     """
-    from backend.helpers.data_classes import GameResult, MarginCondition
-
     # Remove exact duplicates before running simplification rules — minimisation
     # in _minimize_game_winner_atom can collapse distinct atoms to the same form.
+    # This single hashed pass is why build_scenario_atoms appends atoms without
+    # checking for repeats: about a quarter of its atoms are duplicates on the
+    # 2025 regions, and none of them reach the pairwise rules below.
     seen_keys: set[tuple] = set()
     deduped: list[list] = []
     for a in atoms:
@@ -602,299 +984,70 @@ def _simplify_atom_list(atoms: list[list]) -> list[list]:
             deduped.append(a)
     atoms = deduped
 
-    def _pair(c: GameResult) -> tuple:
-        """Return a canonical (sorted) team-pair key for a GameResult."""
-        return tuple(sorted([c.winner, c.loser]))
+    # Bit positions for every distinct team pair and condition seen by this call,
+    # so pair-set equality and condition differences become single int ops.
+    pair_bit: dict[tuple, int] = {}
+    cond_bit: dict = {}
 
-    def _try_merge(a: list, b: list) -> list | None:
-        """Return a merged atom if a and b can be simplified in one step, else None."""
-        gr_a: dict[tuple, GameResult] = {}
-        gr_b: dict[tuple, GameResult] = {}
-        mc_a: list = []
-        mc_b: list = []
-        order: list = []  # ('gr', pair) or ('mc', index) — preserves atom-a structure
+    def _signature(atom: list) -> tuple[int, int, int]:
+        """Return ``(pair_mask, cond_mask, winner_mask)`` bitmasks for *atom*.
 
-        for c in a:
-            if isinstance(c, GameResult):
-                p = _pair(c)
-                gr_a[p] = c
-                order.append(("gr", p))
-            else:
-                mc_a.append(c)
-                order.append(("mc", len(mc_a) - 1))
-
-        for c in b:
+        ``pair_mask`` has one bit per game pair; ``cond_mask`` one bit per
+        distinct condition (``GameResult`` keyed by pair as the rules see it,
+        plus every non-``GameResult`` condition); ``winner_mask`` sets a
+        pair's bit when the pair's first team wins it.
+        """
+        gr: dict[tuple, GameResult] = {}
+        cond_mask = 0
+        for c in atom:
             if isinstance(c, GameResult):
-                gr_b[_pair(c)] = c
+                gr[_gr_pair(c)] = c
             else:
-                mc_b.append(c)
-
-        # Non-GameResult conditions (MarginCondition, CoinFlipResult, …) must be
-        # identical in both atoms — use equality rather than attribute access so
-        # frozen dataclasses (like CoinFlipResult) compare correctly.
-        if len(mc_a) != len(mc_b) or any(x != y for x, y in zip(mc_a, mc_b)):
-            return None
-
-        # Same set of game pairs required
-        if set(gr_a) != set(gr_b):
-            return None
-
-        diff = [p for p in gr_a if gr_a[p] != gr_b[p]]
-        if len(diff) != 1:
-            return None  # 0 = already identical; 2+ = can't reduce in one step
-
-        p = diff[0]
-        ca, cb = gr_a[p], gr_b[p]
-
-        # --- Rule 1: same winner, adjacent / overlapping margin ranges ---
-        if ca.winner == cb.winner:
-            lo = min(ca.min_margin, cb.min_margin)
-            a_hi = ca.max_margin  # exclusive upper bound; None = unbounded
-            b_hi = cb.max_margin
-            # Sort ranges by start so we can check adjacency
-            if ca.min_margin <= cb.min_margin:
-                first_hi, second_lo = a_hi, cb.min_margin
-            else:
-                first_hi, second_lo = b_hi, ca.min_margin
-            # Ranges must be adjacent or overlapping (no gap)
-            if first_hi is not None and second_lo > first_hi:
-                return None
-            hi = None if (a_hi is None or b_hi is None) else max(a_hi, b_hi)
-            merged_gr = GameResult(ca.winner, ca.loser, lo, hi)
-            result = []
-            for kind, val in order:
-                if kind == "gr" and val == p:
-                    result.append(merged_gr)
-                elif kind == "gr":
-                    result.append(gr_a[val])
-                else:
-                    result.append(mc_a[val])
-            return result
-
-        # --- Rule 2: opposite winners, no MarginCondition references this game ---
-        # Both conditions must be fully unconstrained (min=1, max=None) — i.e. together
-        # they cover ALL outcomes of this game.  A margin qualifier on either side means
-        # one range of outcomes is still excluded, so the game cannot be dropped.
-        if ca.loser == cb.winner:
-            if ca.min_margin != 1 or ca.max_margin is not None:
-                return None
-            if cb.min_margin != 1 or cb.max_margin is not None:
-                return None
-            for mc in mc_a:
-                if isinstance(mc, MarginCondition) and (p in mc.add or p in mc.sub):
-                    return None
-            return [
-                (gr_a[val] if kind == "gr" else mc_a[val]) for kind, val in order if not (kind == "gr" and val == p)
-            ]
-
-        return None
-
-    def _subsumes(a: list, b: list) -> bool:
-        """Return True if atom *a* subsumes atom *b* (b can be dropped when a exists).
-
-        a subsumes b when every assignment satisfying b also satisfies a.  This
-        holds when:
-          - Every game pair in a also appears in b with the same winner.
-          - a's margin range for that game is a superset of (weaker than) b's range:
-            a.min_margin <= b.min_margin and (a.max_margin is None or a.max_margin >= b.max_margin).
-          - b may have additional conditions that a does not (making b strictly tighter).
-          - a has no MarginConditions (not needed for current use cases).
-        """
-        if not a:  # unconditional atom subsumes everything
-            return True
-        if any(not isinstance(c, GameResult) for c in a):
-            return False  # MarginConditions in a: skip
-        gr_a = {_pair(c): c for c in a}
-        gr_b = {_pair(c): c for c in b if isinstance(c, GameResult)}
-        if not set(gr_a).issubset(set(gr_b)):
-            return False
-        for p in gr_a:
-            ca, cb = gr_a[p], gr_b[p]
-            if ca.winner != cb.winner:
-                return False
-            if ca.min_margin > cb.min_margin:
-                return False
-            if ca.max_margin is not None:
-                if cb.max_margin is None or ca.max_margin < cb.max_margin:
-                    return False
-        return True
-
-    def _try_rule3(a: list, b: list) -> list | None:
-        """Rule 3 — Complementary lifting.
-
-        If atoms a and b share identical conditions except for two game pairs —
-        one complementary (X_a / X_b, opposite unconstrained winners) and one
-        tightening (G(lo) in a, G(hi) in b with lo < hi) — then b can be
-        replaced with [G(hi)] plus all shared (non-diff) conditions.
-
-        Correctness: for any shared conditions R,
-          (X_a ∧ G_lo+ ∧ R) ∨ (X_b ∧ G_hi+ ∧ R)
-          = R ∧ ((X_a ∧ G_lo+) ∨ (X_b ∧ G_hi+))
-          = R ∧ (G_hi+ ∨ (X_a ∧ G_lo+))
-          = (G_hi+ ∧ R) ∨ (X_a ∧ G_lo+ ∧ R)
-
-        The simplified form makes it clear that G winning by hi+ (plus the
-        shared conditions R) is sufficient regardless of which team wins X.
+                cond_mask |= 1 << cond_bit.setdefault(c, len(cond_bit))
+        pair_mask = winner_mask = 0
+        for p, c in gr.items():
+            bit = 1 << pair_bit.setdefault(p, len(pair_bit))
+            pair_mask |= bit
+            if c.winner == p[0]:
+                winner_mask |= bit
+            cond_mask |= 1 << cond_bit.setdefault(c, len(cond_bit))
+        return pair_mask, cond_mask, winner_mask
+
+    def _rewrite_until_stable(atoms: list[list], rule) -> bool:
+        """Apply a two-atom *rule* to *atoms* in place until no ordered pair fires.
+
+        Rules 3/4 only fire between atoms over the same set of game pairs, so
+        atoms are bucketed by ``pair_mask`` and each one is tried only against
+        its own bucket, in index order, so the first pair to fire is the same
+        as in a full scan.  Rewritten atoms get fresh signatures and move
+        bucket when their pair set changes.  Returns True if the rule fired.
         """
-        gr_a = {_pair(c): c for c in a if isinstance(c, GameResult)}
-        gr_b = {_pair(c): c for c in b if isinstance(c, GameResult)}
-
-        if set(gr_a) != set(gr_b):
-            return None
-        # No MarginConditions in either atom (not needed for current use cases)
-        if any(not isinstance(c, GameResult) for c in a):
-            return None
-        if any(not isinstance(c, GameResult) for c in b):
-            return None
-
-        diff = [p for p in gr_a if gr_a[p] != gr_b[p]]
-        if len(diff) != 2:
-            return None
-
-        for p_comp, p_tight in [(diff[0], diff[1]), (diff[1], diff[0])]:
-            ca_c, cb_c = gr_a[p_comp], gr_b[p_comp]
-            ca_t, cb_t = gr_a[p_tight], gr_b[p_tight]
-
-            # Complementary game: opposite winners, both unconstrained
-            if ca_c.loser != cb_c.winner:
-                continue
-            if ca_c.min_margin != 1 or ca_c.max_margin is not None:
-                continue
-            if cb_c.min_margin != 1 or cb_c.max_margin is not None:
-                continue
-
-            # Tightening game: same winner/loser, a is wider (lower min), b is tighter
-            if ca_t.winner != cb_t.winner or ca_t.loser != cb_t.loser:
-                continue
-            if ca_t.min_margin >= cb_t.min_margin:
-                continue  # a is not the wider one
-            # a must fully cover b's range (a extends to None, or a's max > b's min)
-            if ca_t.max_margin is not None and ca_t.max_margin <= cb_t.min_margin:
-                continue
-
-            # Preserve shared (non-diff) conditions so the simplified atom
-            # remains tight: (G_hi+ ∧ R) rather than just G_hi+.
-            shared = [gr_a[p] for p in gr_a if p not in {p_comp, p_tight}]
-            return [cb_t] + shared
-
-        return None
-
-    # Iterative minimisation
-    changed = True
-    while changed:
-        changed = False
-        # Short-circuit: an unconditional atom subsumes everything
-        if any(len(atom) == 0 for atom in atoms):
-            return [[]]
-        new_atoms: list[list] = []
-        used: set[int] = set()
-        for i in range(len(atoms)):
-            if i in used:
-                continue
-            found_pair = False
-            for j in range(i + 1, len(atoms)):
-                if j in used:
-                    continue
-                merged = _try_merge(atoms[i], atoms[j])
-                if merged is not None:
-                    new_atoms.append(merged)
-                    used.add(i)
-                    used.add(j)
-                    changed = True
-                    found_pair = True
-                    break
-            if not found_pair:
-                new_atoms.append(atoms[i])
-        atoms = new_atoms
-
-    # Subsumption: remove any atom strictly subsumed by a simpler atom.
-    # One pass is sufficient; subsumption only removes atoms, never adds them.
-    dominated = {j for i in range(len(atoms)) for j in range(len(atoms)) if i != j and _subsumes(atoms[i], atoms[j])}
-    if dominated:
-        atoms = [atom for k, atom in enumerate(atoms) if k not in dominated]
-
-    # Rule 3: complementary lifting — separate pass, runs after Rules 1/2
-    # Iterates until stable since one application may expose another.
-    r3_changed = True
-    while r3_changed:
-        r3_changed = False
-        for i in range(len(atoms)):
-            for j in range(len(atoms)):
-                if i == j:
-                    continue
-                new_b = _try_rule3(atoms[i], atoms[j])
-                if new_b is not None:
-                    atoms = [new_b if k == j else atom for k, atom in enumerate(atoms)]
-                    r3_changed = True
+        sigs = [_signature(atom) for atom in atoms]
+        buckets: dict[int, list[int]] = defaultdict(list)
+        for k, sig in enumerate(sigs):
+            buckets[sig[0]].append(k)
+        fired = False
+        changed = True
+        while changed:
+            changed = False
+            for i in range(len(atoms)):
+                for j in buckets[sigs[i][0]]:
+                    if i == j or not _may_pair(sigs[i], sigs[j], 2):
+                        continue
+                    result = rule(atoms[i], atoms[j])
+                    if result is not None:
+                        atoms[i], atoms[j] = result
+                        for k in (i, j):
+                            old_pairs = sigs[k][0]
+                            sigs[k] = _signature(atoms[k])
+                            if sigs[k][0] != old_pairs:
+                                buckets[old_pairs].remove(k)
+                                insort(buckets[sigs[k][0]], k)
+                        changed = fired = True
+                        break
+                if changed:
                     break
-            if r3_changed:
-                break
-
-    def _try_rule4(a: list, b: list) -> tuple[list, list] | None:
-        """Rule 4 — Range-containment splitting.
-
-        Applies when atoms a and b differ in exactly two game pairs:
-          - p_comp: opposite unconstrained winners (a has X_a, b has X_b)
-          - p_tight: same winner in both, both starting at min_margin=1,
-            but a's range is strictly contained in b's (a.max_margin < b.max_margin,
-            where None represents ∞)
-
-        Rewrites:
-          (X_a ∧ G[1..M) ∧ R) ∨ (X_b ∧ G[1..N) ∧ R)  [M < N]
-        as the equivalent:
-          (G[1..M) ∧ R) ∨ (X_b ∧ G[M..N) ∧ R)
-
-        Returns (new_a, new_b) on success, None otherwise.
-        """
-        gr_a = {_pair(c): c for c in a if isinstance(c, GameResult)}
-        gr_b = {_pair(c): c for c in b if isinstance(c, GameResult)}
-
-        if set(gr_a) != set(gr_b):
-            return None
-        if any(not isinstance(c, GameResult) for c in a):
-            return None
-        if any(not isinstance(c, GameResult) for c in b):
-            return None
-
-        diff = [p for p in gr_a if gr_a[p] != gr_b[p]]
-        if len(diff) != 2:
-            return None
-
-        for p_comp, p_tight in [(diff[0], diff[1]), (diff[1], diff[0])]:
-            ca_c, cb_c = gr_a[p_comp], gr_b[p_comp]
-            ca_t, cb_t = gr_a[p_tight], gr_b[p_tight]
-
-            # p_comp: opposite unconstrained winners
-            if ca_c.loser != cb_c.winner:
-                continue
-            if ca_c.min_margin != 1 or ca_c.max_margin is not None:
-                continue
-            if cb_c.min_margin != 1 or cb_c.max_margin is not None:
-                continue
-
-            # p_tight: same winner, same lower bound, a's range strictly narrower
-            if ca_t.winner != cb_t.winner or ca_t.loser != cb_t.loser:
-                continue
-            if ca_t.min_margin != cb_t.min_margin:
-                continue  # lower bounds must match
-            if ca_t.max_margin is None:
-                continue  # a is unbounded — not strictly narrower
-            # a.max_margin < b.max_margin (None = ∞)
-            if cb_t.max_margin is not None and ca_t.max_margin >= cb_t.max_margin:
-                continue
-
-            shared = [gr_a[p] for p in gr_a if p not in {p_comp, p_tight}]
-
-            # new_a: drop p_comp (X result irrelevant when margin is in the narrow range)
-            new_a = [ca_t] + shared
-
-            # new_b: keep X_b, narrow p_tight to [a.max_margin, b.max_margin)
-            new_tight = GameResult(cb_t.winner, cb_t.loser, ca_t.max_margin, cb_t.max_margin)
-            new_b = [cb_c, new_tight] + shared
-
-            return (new_a, new_b)
-
-        return None
+        return fired
 
     # ---------------------------------------------------------------------------
     # Outer stability loop — repeats until no rule fires in a full pass.
@@ -910,74 +1063,37 @@ def _simplify_atom_list(atoms: list[list]) -> list[list]:
             r12_changed = False
             if any(len(atom) == 0 for atom in atoms):
                 return [[]]
-            new_atoms: list[list] = []
-            used: set[int] = set()
-            for i in range(len(atoms)):
-                if i in used:
-                    continue
-                found_pair = False
-                for j in range(i + 1, len(atoms)):
-                    if j in used:
-                        continue
-                    merged = _try_merge(atoms[i], atoms[j])
-                    if merged is not None:
-                        new_atoms.append(merged)
-                        used.add(i)
-                        used.add(j)
-                        r12_changed = True
-                        globally_changed = True
-                        found_pair = True
-                        break
-                if not found_pair:
-                    new_atoms.append(atoms[i])
-            atoms = new_atoms
+            atoms, r12_changed = _merge_pass(atoms)
+            globally_changed = globally_changed or r12_changed
 
         # Subsumption: remove atoms strictly subsumed by a simpler atom
-        dominated = {
-            j for i in range(len(atoms)) for j in range(len(atoms)) if i != j and _subsumes(atoms[i], atoms[j])
-        }
+        dominated = _dominated(atoms)
         if dominated:
             atoms = [atom for k, atom in enumerate(atoms) if k not in dominated]
             globally_changed = True
 
         # Rule 3: complementary lifting
-        r3_changed = True
-        while r3_changed:
-            r3_changed = False
-            for i in range(len(atoms)):
-                for j in range(len(atoms)):
-                    if i == j:
-                        continue
-                    new_b = _try_rule3(atoms[i], atoms[j])
-                    if new_b is not None:
-                        atoms = [new_b if k == j else atom for k, atom in enumerate(atoms)]
-                        r3_changed = True
-                        globally_changed = True
-                        break
-                if r3_changed:
-                    break
+        if _rewrite_until_stable(atoms, _lift):
+            globally_changed = True
 
         # Rule 4: range-containment splitting — try all ordered pairs
-        r4_changed = True
-        while r4_changed:
-            r4_changed = False
-            for i in range(len(atoms)):
-                for j in range(len(atoms)):
-                    if i == j:
-                        continue
-                    result = _try_rule4(atoms[i], atoms[j])
-                    if result is not None:
-                        new_a, new_b = result
-                        atoms = [(new_a if k == i else (new_b if k == j else atom)) for k, atom in enumerate(atoms)]
-                        r4_changed = True
-                        globally_changed = True
-                        break
-                if r4_changed:
-                    break
+        if _rewrite_until_stable(atoms, _try_rule4):
+            globally_changed = True
 
     return atoms
 
 
+def _cube_masks(base: int, free_bm: int) -> set[int]:
+    """Return every mask in the cube that fixes *base* and lets the *free_bm* bits vary."""
+    out = set()
+    sub = free_bm
+    while True:
+        out.add(base | sub)
+        if not sub:
+            return out
+        sub = (sub - 1) & free_bm
+
+
 def _valid_merge_groups(masks: list[int]) -> list[list[int]]:
     """Partition masks into maximal valid merge groups via prime implicant covering.
 
@@ -992,50 +1108,62 @@ def _valid_merge_groups(masks: list[int]) -> list[list[int]]:
         return [list(masks)]
 
     mask_set = frozenset(masks)
+    width = max(mask_set).bit_length()
 
     # QMC iterative merge.
-    # Each entry: (base_mask, free_bitmask) → frozenset of covered masks.
-    # base_mask has 0s at all free bit positions; free_bitmask tracks which bits vary.
-    current: dict[tuple[int, int], frozenset[int]] = {(m, 0): frozenset([m]) for m in mask_set}
-    all_pis: list[frozenset[int]] = []
+    # Each entry is a cube key (base_mask, free_bitmask): base_mask has 0s at all
+    # free bit positions; free_bitmask tracks which bits vary.  A cube only forms
+    # when all of its masks are in mask_set, so the key alone determines what it
+    # covers — dicts are used as ordered sets of keys and the covered masks are
+    # only materialised for prime implicants the greedy cover inspects.
+    current: dict[tuple[int, int], None] = dict.fromkeys((m, 0) for m in mask_set)
+    all_pis: list[tuple[int, int]] = []
 
     while current:
-        by_free: dict[int, list[tuple[int, frozenset[int]]]] = {}
-        for (base, free_bm), covered in current.items():
-            by_free.setdefault(free_bm, []).append((base, covered))
+        by_free: dict[int, list[int]] = {}
+        for base, free_bm in current:
+            by_free.setdefault(free_bm, []).append(base)
 
-        next_level: dict[tuple[int, int], frozenset[int]] = {}
+        next_level: dict[tuple[int, int], None] = {}
         used: set[tuple[int, int]] = set()
 
-        for free_bm, groups in by_free.items():
-            for i in range(len(groups)):
-                base_i, cov_i = groups[i]
-                for j in range(i + 1, len(groups)):
-                    base_j, cov_j = groups[j]
-                    diff = base_i ^ base_j
-                    # Must differ by exactly one bit that is not already free.
-                    if diff == 0 or (diff & (diff - 1)) or (diff & free_bm):
-                        continue
-                    new_key = (base_i & base_j, free_bm | diff)
-                    prev = next_level.get(new_key, frozenset())
-                    next_level[new_key] = prev | cov_i | cov_j
-                    used.add((base_i, free_bm))
-                    used.add((base_j, free_bm))
-
-        for key, covered in current.items():
-            if key not in used:
-                all_pis.append(covered)
-
+        for free_bm, bases in by_free.items():
+            # Mergeable partners differ in exactly one non-free bit, so each
+            # bit's pairs are found by probing from the side where it is 0
+            # instead of testing every pair in the group.  Pairs are then
+            # visited in group order (lower index first, partners ascending)
+            # to keep next_level (and therefore the greedy cover) deterministic.
+            position = {base: idx for idx, base in enumerate(bases)}
+            pairs: list[tuple[int, int]] = []
+            for b in range(width):
+                bit = 1 << b
+                if free_bm & bit:
+                    continue
+                pairs.extend(
+                    (i, position[base | bit])
+                    for i, base in enumerate(bases)
+                    if not base & bit and base | bit in position
+                )
+            pairs = sorted((i, j) if i < j else (j, i) for i, j in pairs)
+            for i, j in pairs:
+                base_i = bases[i]
+                base_j = bases[j]
+                next_level[(base_i & base_j, free_bm | (base_i ^ base_j))] = None
+                used.add((base_i, free_bm))
+                used.add((base_j, free_bm))
+
+        all_pis.extend(key for key in current if key not in used)
         current = next_level
 
     # Greedy partition: largest prime implicants first so each atom has the
     # fewest conditions.  Every mask is guaranteed coverage because each
     # individual mask is its own size-1 prime implicant.
-    all_pis.sort(key=len, reverse=True)
+    all_pis.sort(key=lambda key: key[1].bit_count(), reverse=True)
     remaining = set(mask_set)
     result: list[list[int]] = []
 
-    for pi in all_pis:
+    for base, free_bm in all_pis:
+        pi = _cube_masks(base, free_bm)
         if pi <= remaining:
             result.append(sorted(pi))
             remaining -= pi
@@ -1059,25 +1187,41 @@ def _minimize_game_winner_atom(
     *always_covered_set*.  Iterates until stable so multiple redundant
     conditions can be removed in sequence.
     """
-    pairs = [(rg.a, rg.b) for rg in remaining]
+    # (winner, loser) -> (game index, mask bit for that result); the first
+    # game listing the pair wins, as in ``remaining`` order.
+    game_bits: dict[tuple[str, str], tuple[int, int]] = {}
+    for i, rg in enumerate(remaining):
+        game_bits.setdefault((rg.a, rg.b), (i, 1))
+        game_bits.setdefault((rg.b, rg.a), (i, 0))
+    all_games_bm = (1 << num_games) - 1
 
-    def covered(conds: list) -> set[int]:
-        """Return the set of masks covered by the given game-winner conditions."""
-        fixed: dict[int, int] = {}
+    def covered_within(conds: list) -> bool:
+        """Return True if every mask covered by the given game-winner conditions is in *always_covered_set*.
+
+        Bails out before enumerating when the covered hypercube has more masks
+        than *always_covered_set*, and otherwise walks the cube's masks (as in
+        ``_cube_masks``) and stops at the first one outside it.
+        """
+        base = 0
+        fixed_bm = 0
         for c in conds:
             if not isinstance(c, GameResult):
                 continue
-            for i, (a, b) in enumerate(pairs):
-                if c.winner == a and c.loser == b:
-                    fixed[i] = 1
-                    break
-                elif c.winner == b and c.loser == a:
-                    fixed[i] = 0
-                    break
-        base = sum(v << i for i, v in fixed.items())
-        free = [i for i in range(num_games) if i not in fixed]
-        n = len(free)
-        return {base | sum(((fc >> j) & 1) << free[j] for j in range(n)) for fc in range(1 << n)}
+            hit = game_bits.get((c.winner, c.loser))
+            if hit is not None:
+                i, bit = hit
+                fixed_bm |= 1 << i
+                base = (base & ~(1 << i)) | (bit << i)
+        free_bm = all_games_bm & ~fixed_bm
+        if (1 << free_bm.bit_count()) > len(always_covered_set):
+            return False
+        sub = free_bm
+        while True:
+            if base | sub not in always_covered_set:
+                return False
+            if not sub:
+                return True
+            sub = (sub - 1) & free_bm
 
     changed = True
     while changed:
@@ -1086,7 +1230,7 @@ def _minimize_game_winner_atom(
             if not isinstance(c, GameResult) or c.min_margin != 1 or c.max_margin is not None:
                 continue
             candidate = atom[:i] + atom[i + 1 :]
-            if covered(candidate) <= always_covered_set:
+            if covered_within(candidate):
                 atom = candidate
                 changed = True
                 break
@@ -1170,7 +1314,7 @@ def compute_odds_from_precomputed(
     Much faster than ``determine_scenarios()`` because all seedings are already
     in ``eo.groups`` — no additional calls to ``resolve_standings_for_mask``
     are needed.  Coin-flip masks are distributed evenly across all permutations
-    of each tied group, identical to ``_accumulate_slots`` in scenarios.py.
+    of each tied group, identical to ``_seed_rows`` in scenarios.py.
 
     Args:
         eo: Pre-computed enumeration from ``enumerate_outcomes()``.
@@ -1267,6 +1411,98 @@ def _find_tiebreaker_groups(order_ref: list[str], order_lo: list[str]) -> list[l
     return groups
 
 
+def _enumerate_outcome_range(
+    teams: list[str],
+    completed: list[CompletedGame],
+    remaining: list[RemainingGame],
+    pa_win: int,
+    base_margin_default: int,
+    ignore_margins: bool,
+    mask_lo: int,
+    mask_hi: int,
+) -> tuple[dict, set, dict, dict]:
+    """Enumerate outcome masks ``mask_lo`` .. ``mask_hi - 1`` for ``enumerate_outcomes``.
+
+    Returns:
+        ``(groups, non_sensitive_masks, coin_flips, margin_tiebreaker_masks)``
+        restricted to the masks in range, with ``groups`` keys inserted in
+        ascending mask order so contiguous ranges concatenate cleanly.
+    """
+    R = len(remaining)
+    pairs = [(rg.a, rg.b) for rg in remaining]
+
+    groups: dict = {}
+    non_sensitive_masks: set = set()
+    coin_flips: dict = {}  # mask -> list[list[str]] of tied groups resolved by coin flip
+    margin_tiebreaker_masks: dict = {}  # populated only when ignore_margins=True
+
+    ref_margins = {pairs[i]: base_margin_default for i in range(R)}
+    lo_margins = {pairs[i]: 1 for i in range(R)}
+    # Shared across the corner check and the full enumeration of each mask so
+    # the 2^R corner resolutions are not repeated inside the 12^R product.
+    resolve = make_cached_resolver(teams, completed, remaining, base_margin_default, pa_win)
+    # Tied teams depend only on the W/L/T records, so masks sharing a record
+    # vector (ids from one win-count pass) share one tied set.
+    record_ids = None if ignore_margins else record_ids_for_masks(teams, completed, remaining, mask_lo, mask_hi)
+    tied_by_record: dict[int, set[str]] = {}
+
+    for mask in range(mask_lo, mask_hi):
+        if not ignore_margins:
+            record_key = record_ids[mask - mask_lo]
+            tied = tied_by_record.get(record_key)
+            if tied is None:
+                wl_totals = standings_from_mask(teams, completed, remaining, mask, pa_win, {}, base_margin_default)
+                tied = tied_by_record[record_key] = _tied_teams(teams, wl_totals)
+        if ignore_margins or not _is_margin_sensitive_mask(
+            teams, completed, remaining, mask, pairs, pa_win, base_margin_default, resolver=resolve, tied=tied
+        ):
+            order, flips = resolve(mask, ref_margins)
+            groups[(mask, order)] = []
+            non_sensitive_masks.add(mask)
+            if flips:
+                coin_flips[mask] = [list(g) for g in flips]
+            elif ignore_margins:
+                # Check if this mask would be margin-sensitive under full enumeration.
+                # Compare seeding at margin=1 vs the default; if they differ, the
+                # tiebreaker is PD-sensitive and we record the affected team groups.
+                order_lo = resolve(mask, lo_margins)[0]
+                if order_lo != order:
+                    tg = _find_tiebreaker_groups(list(order), list(order_lo))
+                    if tg:
+                        margin_tiebreaker_masks[mask] = tg
+        else:
+            # Only margins of games with a tied team can move the seeding (see
+            # ``_is_margin_sensitive_mask``), so each sub-vector of those
+            # margins is resolved once and shared by every value of the rest.
+            relevant_margins = itemgetter(*(i for i, rg in enumerate(remaining) if rg.a in tied or rg.b in tied))
+            resolved: dict = {}
+
+            def resolve_combo(margin_combo, mask=mask, relevant_margins=relevant_margins, resolved=resolved):
+                """Resolve *margin_combo*, reusing any combo with the same relevant margins."""
+                relevant_key = relevant_margins(margin_combo)
+                result = resolved.get(relevant_key)
+                if result is None:
+                    result = resolved[relevant_key] = resolve.by_vector(mask, margin_combo)
+                return result
+
+            # The last game's margin runs fastest, as in ``product``; its 12
+            # results are bisected out of the change points, and the combos are
+            # still recorded in ``product`` order.
+            for outer_combo in product(range(1, 13), repeat=R - 1):
+                results = results_across_margin_range(
+                    lambda m, outer_combo=outer_combo: resolve_combo(outer_combo + (m,))
+                )
+                for last_margin, (order, flips) in enumerate(results, start=1):
+                    key = (mask, order)
+                    groups.setdefault(key, []).append(outer_combo + (last_margin,))
+                    # Store coin flips for this mask (same groups for every margin combo
+                    # since coin flips are determined by win/loss record, not margins).
+                    if flips and mask not in coin_flips:
+                        coin_flips[mask] = [list(g) for g in flips]
+
+    return groups, non_sensitive_masks, coin_flips, margin_tiebreaker_masks
+
+
 def enumerate_outcomes(
     teams: list[str],
     completed: list[CompletedGame],
@@ -1274,6 +1510,7 @@ def enumerate_outcomes(
     pa_win: int = 14,
     base_margin_default: int = 7,
     ignore_margins: bool = False,
+    max_workers: int | None = None,
 ) -> EnumeratedOutcomes:
     """Enumerate all (mask, margin) outcomes once, returning a shared result.
 
@@ -1296,6 +1533,10 @@ def enumerate_outcomes(
             non-sensitive. Use for R≥5 initial display or R≥7 permanent mode.
             Callers must not use the resulting atoms for margin-sensitive
             sub-scenario conditions — they will be absent.
+        max_workers: When greater than 1, split the 2^R masks into contiguous
+            chunks and enumerate them in a process pool of this size.  Masks
+            are independent, so the result is identical to the single-process
+            loop (the default).
 
     Returns:
         ``EnumeratedOutcomes`` containing the full ``(mask, seeding) → margins``
@@ -1306,65 +1547,25 @@ def enumerate_outcomes(
     R = len(remaining)
     pairs = [(rg.a, rg.b) for rg in remaining]
     total_combos = 12**R
-
-    groups: dict = {}
-    non_sensitive_masks: set = set()
-    coin_flips: dict = {}  # mask -> list[list[str]] of tied groups resolved by coin flip
-    margin_tiebreaker_masks: dict = {}  # populated only when ignore_margins=True
-
-    ref_margins = {pairs[i]: base_margin_default for i in range(R)}
-    lo_margins = {pairs[i]: 1 for i in range(R)}
-
-    for mask in range(1 << R):
-        if ignore_margins or not _is_margin_sensitive_mask(
-            teams, completed, remaining, mask, pairs, pa_win, base_margin_default
-        ):
-            flip_collector: list = []
-            order = resolve_standings_for_mask(
-                teams,
-                completed,
-                remaining,
-                mask,
-                ref_margins,
-                base_margin_default,
-                pa_win,
-                coin_flip_collector=flip_collector,
-            )
-            groups[(mask, tuple(order))] = []
-            non_sensitive_masks.add(mask)
-            if flip_collector:
-                coin_flips[mask] = flip_collector
-            elif ignore_margins:
-                # Check if this mask would be margin-sensitive under full enumeration.
-                # Compare seeding at margin=1 vs the default; if they differ, the
-                # tiebreaker is PD-sensitive and we record the affected team groups.
-                order_lo = resolve_standings_for_mask(
-                    teams, completed, remaining, mask, lo_margins, base_margin_default, pa_win
-                )
-                if tuple(order_lo) != tuple(order):
-                    tg = _find_tiebreaker_groups(list(order), list(order_lo))
-                    if tg:
-                        margin_tiebreaker_masks[mask] = tg
-        else:
-            for margin_combo in product(range(1, 13), repeat=R):
-                margins = {pairs[i]: margin_combo[i] for i in range(R)}
-                flip_collector = []
-                order = resolve_standings_for_mask(
-                    teams,
-                    completed,
-                    remaining,
-                    mask,
-                    margins,
-                    base_margin_default,
-                    pa_win,
-                    coin_flip_collector=flip_collector,
-                )
-                key = (mask, tuple(order))
-                groups.setdefault(key, []).append(margins)
-                # Store coin flips for this mask (same groups for every margin combo
-                # since coin flips are determined by win/loss record, not margins).
-                if flip_collector and mask not in coin_flips:
-                    coin_flips[mask] = flip_collector
+    total_masks = 1 << R
+    if max_workers is None or max_workers <= 1 or total_masks == 1:
+        groups, non_sensitive_masks, coin_flips, margin_tiebreaker_masks = _enumerate_outcome_range(
+            teams, completed, remaining, pa_win, base_margin_default, ignore_margins, 0, total_masks
+        )
+    else:
+        groups = {}
+        non_sensitive_masks = set()
+        coin_flips = {}
+        margin_tiebreaker_masks = {}
+        # Sensitive masks cost far more than the rest, so over-split the range
+        # to keep every worker busy until the end.
+        region = (teams, completed, remaining, pa_win, base_margin_default, ignore_margins)
+        chunks = split_range(total_masks, max_workers * 4)
+        for part in map_chunks(_enumerate_outcome_range, region, chunks, max_workers):
+            groups.update(part[0])
+            non_sensitive_masks |= part[1]
+            coin_flips.update(part[2])
+            margin_tiebreaker_masks.update(part[3])
 
     return EnumeratedOutcomes(
         groups=groups,
@@ -1490,7 +1691,7 @@ def build_scenario_atoms(
         coin_flips = precomputed.coin_flips
         # Derive top-N keys by slicing full seeding from the shared groups dict.
         # Also save full canonical seedings for flip-affected masks.
-        groups: dict[tuple, list[dict]] = {}
+        groups: dict[tuple, list[tuple[int, ...]]] = {}
         non_sensitive_keys: set[tuple] = set()
         flip_mask_full_seedings: dict[int, tuple] = {}
         for (mask, full_seeding), margins_list in precomputed.groups.items():
@@ -1510,44 +1711,28 @@ def build_scenario_atoms(
         non_sensitive_keys = set()
         coin_flips: dict[int, list] = {}
         flip_mask_full_seedings: dict[int, tuple] = {}
+        # Combos differing only in games without a tied team share one cached
+        # resolution (see ``make_cached_resolver``).
+        resolve = make_cached_resolver(teams, completed, remaining, base_margin_default, pa_win)
+        ref_vector = (1,) * R
 
         for mask in range(1 << R):
-            if not _is_margin_sensitive_mask(teams, completed, remaining, mask, pairs, pa_win, base_margin_default):
-                ref_margins = {pairs[i]: 1 for i in range(R)}
-                flip_collector: list = []
-                order = resolve_standings_for_mask(
-                    teams,
-                    completed,
-                    remaining,
-                    mask,
-                    ref_margins,
-                    base_margin_default,
-                    pa_win,
-                    coin_flip_collector=flip_collector,
-                )
-                non_sensitive_keys.add((mask, tuple(order[:playoff_seeds])))
+            if not _is_margin_sensitive_mask(
+                teams, completed, remaining, mask, pairs, pa_win, base_margin_default, resolver=resolve
+            ):
+                order, flips = resolve.by_vector(mask, ref_vector)
+                non_sensitive_keys.add((mask, order[:playoff_seeds]))
                 non_sensitive_masks.add(mask)
-                if flip_collector:
-                    coin_flips[mask] = flip_collector
-                    flip_mask_full_seedings[mask] = tuple(order)
+                if flips:
+                    coin_flips[mask] = [list(g) for g in flips]
+                    flip_mask_full_seedings[mask] = order
             else:
                 for margin_combo in product(range(1, 13), repeat=R):
-                    margins = {pairs[i]: margin_combo[i] for i in range(R)}
-                    flip_collector = []
-                    order = resolve_standings_for_mask(
-                        teams,
-                        completed,
-                        remaining,
-                        mask,
-                        margins,
-                        base_margin_default,
-                        pa_win,
-                        coin_flip_collector=flip_collector,
-                    )
-                    key = (mask, tuple(order[:playoff_seeds]))
-                    groups.setdefault(key, []).append(margins)
-                    if flip_collector and mask not in coin_flips:
-                        coin_flips[mask] = flip_collector
+                    order, flips = resolve.by_vector(mask, margin_combo)
+                    key = (mask, order[:playoff_seeds])
+                    groups.setdefault(key, []).append(margin_combo)
+                    if flips and mask not in coin_flips:
+                        coin_flips[mask] = [list(g) for g in flips]
 
     # Compute flip-sensitive metadata: which masks have coin flips affecting playoff seeds,
     # which teams in those masks are flip-affected, and what the relevant groups are.
@@ -1653,6 +1838,9 @@ def build_scenario_atoms(
     # For each (mask, top4) group that is not already fully covered, derive margin
     # atoms and add them only for the teams that still need them (i.e. those whose
     # (team, seed) is NOT already handled by an always-at-seed atom above).
+    # Derived atoms are memoised by (mask, contributing top-N seedings) so Step 5
+    # does not re-expand and re-derive a margin set that was already handled.
+    derived_atoms: dict[tuple, list[list]] = {}
     for (mask, top4), valid_margins_list in groups.items():
         uncovered_positions = [
             (seed_idx, team)
@@ -1661,7 +1849,9 @@ def build_scenario_atoms(
         ]
         if not uncovered_positions:
             continue
-        for atom in _derive_atom(mask, valid_margins_list, remaining, pairs):
+        derived = _derive_atom(mask, _margin_dicts(pairs, valid_margins_list), remaining, pairs)
+        derived_atoms[(mask, (top4,))] = derived
+        for atom in derived:
             for seed_idx, team in uncovered_positions:
                 result.setdefault(team, {}).setdefault(seed_idx + 1, []).append(atom)
 
@@ -1682,16 +1872,27 @@ def build_scenario_atoms(
     # Non-sensitive masks: seeding is fixed for all margins, so a team is either always
     # in top-N or never — they never appear in sometimes_elim_only_masks.
     team_sometimes_elim_masks: dict[str, set[int]] = {}
-    for mask, top4 in groups.keys():
+    groups_by_mask: dict[int, list[tuple[tuple, list]]] = defaultdict(list)
+    for (mask, top4), margin_list in groups.items():
+        groups_by_mask[mask].append((top4, margin_list))
         for team in teams:
             if team not in top4:
                 team_sometimes_elim_masks.setdefault(team, set()).add(mask)
 
+    # Stream the always-eliminated masks per team in one ascending pass over the
+    # masks, visiting only the teams absent from each mask's top-N union.
+    team_set = set(teams)
+    team_always_elim_masks: dict[str, list[int]] = {team: [] for team in teams}
+    for m in range(1 << R):
+        for team in team_set - teams_in_any_top4[m]:
+            team_always_elim_masks[team].append(m)
+
     elim_seed = playoff_seeds + 1
 
     for team in teams:
-        always_elim_masks = [m for m in range(1 << R) if team not in teams_in_any_top4[m]]
-        sometimes_elim_only_masks = team_sometimes_elim_masks.get(team, set()) - set(always_elim_masks)
+        always_elim_masks = team_always_elim_masks[team]
+        always_elim_set = set(always_elim_masks)
+        sometimes_elim_only_masks = team_sometimes_elim_masks.get(team, set()) - always_elim_set
 
         if not always_elim_masks and not sometimes_elim_only_masks:
             continue
@@ -1700,7 +1901,6 @@ def build_scenario_atoms(
         # into compact game-winner conditions upfront.  This mirrors Step 3 for
         # always-at-seed masks and avoids feeding O(2^R) raw atoms into boolean
         # minimisation — critical for large R (e.g. R=15 with ~16 K elim masks).
-        always_elim_set = set(always_elim_masks)
         for group in _valid_merge_groups(always_elim_masks):
             game_winners = _common_game_winners(group, remaining)
             atom = [GameResult(w, l, 1, None) for w, l in game_winners]
@@ -1708,14 +1908,22 @@ def build_scenario_atoms(
             result.setdefault(team, {}).setdefault(elim_seed, []).append(atom)
 
         # Constrained atoms: masks where team is eliminated only for specific margin ranges
+        # Teams missing from the same seedings of a mask share one margin set, so
+        # each distinct set is expanded and derived once.
         for mask in sometimes_elim_only_masks:
-            absent_margins: list[dict] = []
-            for (mk, top4), margin_list in groups.items():
-                if mk == mask and team not in top4:
-                    absent_margins.extend(margin_list)
-            if absent_margins:
-                for atom in _derive_atom(mask, absent_margins, remaining, pairs):
-                    result.setdefault(team, {}).setdefault(elim_seed, []).append(atom)
+            absent = [(top4, margin_list) for top4, margin_list in groups_by_mask[mask] if team not in top4]
+            if not absent:
+                continue
+            key = (mask, tuple(top4 for top4, _ in absent))
+            derived = derived_atoms.get(key)
+            if derived is None:
+                absent_margins = [margins for _, margin_list in absent for margins in margin_list]
+                if not absent_margins:
+                    continue
+                derived = _derive_atom(mask, _margin_dicts(pairs, absent_margins), remaining, pairs)
+                derived_atoms[key] = derived
+            for atom in derived:
+                result.setdefault(team, {}).setdefault(elim_seed, []).append(atom)
 
     # --- Step 6: Boolean minimisation then deterministic sort ---
     # First collapse redundant margin ranges and drop irrelevant game conditions,
@@ -1773,7 +1981,7 @@ def enumerate_division_scenarios(
             }
         ]
 
-    # (mask, seeding_tuple) → list of margin dicts for that combination.
+    # (mask, seeding_tuple) → list of margin vectors (aligned with pairs) for that combination.
     # Use precomputed EnumeratedOutcomes when available; otherwise enumerate here.
     if precomputed is not None:
         mask_seeding_margins = defaultdict(list, {k: list(v) for k, v in precomputed.groups.items()})
@@ -1783,42 +1991,24 @@ def enumerate_division_scenarios(
         mask_seeding_margins = defaultdict(list)
         non_sensitive_masks = set()
         coin_flips = {}
+        resolve = make_cached_resolver(teams, completed, remaining, base_margin_default, pa_win)
+        ref_vector = (1,) * R
 
         for mask in range(1 << R):
-            if not _is_margin_sensitive_mask(teams, completed, remaining, mask, pairs, pa_win, base_margin_default):
-                ref_margins = {pairs[i]: 1 for i in range(R)}
-                flip_collector: list = []
-                order = resolve_standings_for_mask(
-                    teams,
-                    completed,
-                    remaining,
-                    mask,
-                    ref_margins,
-                    base_margin_default,
-                    pa_win,
-                    coin_flip_collector=flip_collector,
-                )
-                mask_seeding_margins[(mask, tuple(order))]  # touch key so it exists
+            if not _is_margin_sensitive_mask(
+                teams, completed, remaining, mask, pairs, pa_win, base_margin_default, resolver=resolve
+            ):
+                order, flips = resolve.by_vector(mask, ref_vector)
+                mask_seeding_margins[(mask, order)]  # touch key so it exists
                 non_sensitive_masks.add(mask)
-                if flip_collector:
-                    coin_flips[mask] = flip_collector
+                if flips:
+                    coin_flips[mask] = [list(g) for g in flips]
             else:
                 for margin_combo in product(_MARGIN_RANGE, repeat=R):
-                    margins = {pairs[i]: margin_combo[i] for i in range(R)}
-                    flip_collector = []
-                    order = resolve_standings_for_mask(
-                        teams,
-                        completed,
-                        remaining,
-                        mask,
-                        margins,
-                        base_margin_default,
-                        pa_win,
-                        coin_flip_collector=flip_collector,
-                    )
-                    mask_seeding_margins[(mask, tuple(order))].append(margins)
-                    if flip_collector and mask not in coin_flips:
-                        coin_flips[mask] = flip_collector
+                    order, flips = resolve.by_vector(mask, margin_combo)
+                    mask_seeding_margins[(mask, order)].append(margin_combo)
+                    if flips and mask not in coin_flips:
+                        coin_flips[mask] = [list(g) for g in flips]
 
     # Compute flip-sensitive metadata for coin-flip scenario expansion.
     # Keyed by mask; only includes masks with flips that affect playoff seeds.
@@ -1961,7 +2151,7 @@ def enumerate_division_scenarios(
             scenario_num += 1
             sub_list_sorted = sorted(
                 sub_list,
-                key=lambda x: tuple(min(m[pair] for m in x[1]) for pair in pairs),
+                key=lambda x: tuple(min(m[i] for m in x[1]) for i in range(R)),
             )
             mask_game_winners = _game_winners_for_mask(mask, remaining)
             for k, (seeding, margins_list) in enumerate(sub_list_sorted):
@@ -1972,7 +2162,7 @@ def enumerate_division_scenarios(
                         seeding,
                         playoff_seeds,
                         mask,
-                        margins_list[0],
+                        dict(zip(pairs, margins_list[0])),
                         scenario_atoms,
                         remaining,
                     )
@@ -5,9 +5,11 @@ for each using margin-sensitive threshold detection, and accumulates per-team
 per-seed counts. No Prefect or database dependencies.
 """
 
-import logging
 import random
-from collections import defaultdict
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from itertools import permutations, product
 
 from backend.helpers.data_classes import (
@@ -19,11 +21,17 @@ from backend.helpers.data_classes import (
     WinProbFn,
     equal_win_prob,
 )
+from backend.helpers.process_pool import map_chunks, split_range
 from backend.helpers.tiebreakers import (
-    rank_to_slots,
+    build_h2h_maps,
+    build_vs_index,
+    make_cached_resolver,
+    record_ids_for_masks,
     resolve_standings_for_mask,
+    results_across_margin_range,
     sensitive_boundary_games,
     standings_from_mask,
+    teams_tied_after_margin_free_steps,
     tie_bucket_groups,
     unique_intra_bucket_games,
 )
@@ -53,56 +61,33 @@ def pct_str(x: float) -> str:
 # -------------------------
 
 
-def _accumulate_slots(
-    final_order: list[str],
-    flip_groups: list[list[str]],
-    unweighted: float,
-    weighted: float,
-    first_counts: defaultdict[str, float],
-    second_counts: defaultdict[str, float],
-    third_counts: defaultdict[str, float],
-    fourth_counts: defaultdict[str, float],
-    first_counts_weighted: defaultdict[str, float],
-    second_counts_weighted: defaultdict[str, float],
-    third_counts_weighted: defaultdict[str, float],
-    fourth_counts_weighted: defaultdict[str, float],
-) -> None:
-    """Accumulate seed counts into counters, distributing evenly over coin-flip permutations.
+def _seed_rows(
+    final_order: Sequence[str],
+    flip_groups: Sequence[Sequence[str]],
+    team_idx: dict[str, int],
+) -> tuple[tuple[int, ...], ...]:
+    """Expand one resolved ordering into the seed 1-4 team indices of every coin-flip outcome.
 
-    When ``flip_groups`` is empty the full ``unweighted`` / ``weighted`` amounts are
-    credited to the single ordering returned by the resolver.  When one or more coin-flip
-    groups are present, the weight is split equally across all permutations of each
-    independent group (cartesian product across groups), so every flip outcome gets its
-    fair share rather than 100% going to the alphabetically-first proxy ordering.
+    When ``flip_groups`` is empty the single ordering returned by the resolver is
+    the only row.  When one or more coin-flip groups are present, every
+    permutation of each independent group (cartesian product across groups) is
+    its own row, so every flip outcome gets its fair share rather than 100%
+    going to the alphabetically-first proxy ordering.
 
     Args:
         final_order: The ordered team list returned by ``resolve_standings_for_mask``.
         flip_groups: Tied groups that were resolved by coin flip (from the collector).
-        unweighted: Unweighted credit for this (mask, margin-combo) branch.
-        weighted: Win-probability-weighted credit for this branch.
-        first_counts … fourth_counts_weighted: Counters to update in-place.
-    """
-    if not flip_groups:
-        slots = rank_to_slots(final_order)
-        for team, (lo, hi) in slots.items():
-            if lo <= 1 <= hi:
-                first_counts[team] += unweighted
-                first_counts_weighted[team] += weighted
-            if lo <= 2 <= hi:
-                second_counts[team] += unweighted
-                second_counts_weighted[team] += weighted
-            if lo <= 3 <= hi:
-                third_counts[team] += unweighted
-                third_counts_weighted[team] += weighted
-            if lo <= 4 <= hi:
-                fourth_counts[team] += unweighted
-                fourth_counts_weighted[team] += weighted
-        return
+        team_idx: Maps each team name to its slot in the counter arrays.
 
+    Returns:
+        One tuple per flip outcome holding the counter indices of seeds 1-4
+        (fewer in a region with fewer than four teams).  Tuples are returned
+        so the result can be cached and shared between branches.
+    """
     # Build all orderings by permuting each flip group independently.
-    orderings: list[list[str]] = [list(final_order)]
+    orderings: list[Sequence[str]] = [final_order]
     for group in flip_groups:
-        expanded: list[list[str]] = []
+        expanded: list[Sequence[str]] = []
         for current in orderings:
             positions = [current.index(t) for t in group]
             for perm in permutations(group):
@@ -112,24 +97,520 @@ def _accumulate_slots(
                 expanded.append(new)
         orderings = expanded
 
-    n = len(orderings)
-    u_share = unweighted / n
-    w_share = weighted / n
-    for ordering in orderings:
-        slots = rank_to_slots(ordering)
-        for team, (lo, hi) in slots.items():
-            if lo <= 1 <= hi:
-                first_counts[team] += u_share
-                first_counts_weighted[team] += w_share
-            if lo <= 2 <= hi:
-                second_counts[team] += u_share
-                second_counts_weighted[team] += w_share
-            if lo <= 3 <= hi:
-                third_counts[team] += u_share
-                third_counts_weighted[team] += w_share
-            if lo <= 4 <= hi:
-                fourth_counts[team] += u_share
-                fourth_counts_weighted[team] += w_share
+    # Seeds are strict ranks, so seed k is simply ordering[k - 1].
+    return tuple(tuple(team_idx[team] for team in ordering[:4]) for ordering in orderings)
+
+
+class _SeedTally:
+    """Per-seed counters accumulated over a span of outcome masks.
+
+    Counts live in flat ``array('d')`` buffers indexed by team position, which
+    avoids hashing a team name on every credited branch.  Each worker in a
+    parallel enumeration fills its own tally; the parent merges them with
+    ``merge`` once every chunk has finished.
+    """
+
+    def __init__(self, teams: Sequence[str]) -> None:
+        """Allocate zeroed seed 1-4 counters for *teams*."""
+        self.teams = list(teams)
+        self.team_idx = {team: i for i, team in enumerate(self.teams)}
+        zeros = [0.0] * len(self.teams)
+        self.counts_by_seed = tuple(array("d", zeros) for _ in range(4))
+        self.counts_weighted_by_seed = tuple(array("d", zeros) for _ in range(4))
+        self.denom_weighted = 0.0
+        self.pruned_weight = 0.0
+        self.coinflip_teams: set[str] = set()
+        # Many margin combos resolve to the same ordering, so the flip expansion
+        # is done once per distinct (order, coin_flips) pair.  Each entry holds
+        # the number of flip outcomes and one ``(counts, counts_weighted, team)``
+        # cell per credited seed, so a branch is credited with plain indexed
+        # adds.
+        self._cells_by_order: dict[tuple, tuple[int, tuple[tuple[array, array, int], ...]]] = {}
+
+    def accumulate(
+        self,
+        final_order: tuple[str, ...],
+        flip_groups: tuple[tuple[str, ...], ...],
+        unweighted: float,
+        weighted: float,
+    ) -> None:
+        """Credit one resolved ordering and record its coin flips.
+
+        The branch credit is split evenly over the coin-flip outcomes of
+        ``_seed_rows``.  Both arguments must be tuples, as returned by
+        ``make_cached_resolver``, because they key the per-tally cache of
+        expanded seed rows.
+
+        Args:
+            final_order: The resolved team order, seed 1 first.
+            flip_groups: Tied groups that were resolved by coin flip.
+            unweighted: Unweighted credit for this (mask, margin-combo) branch.
+            weighted: Win-probability-weighted credit for this branch.
+        """
+        key = (final_order, flip_groups)
+        entry = self._cells_by_order.get(key)
+        if entry is None:
+            for group in flip_groups:
+                self.coinflip_teams.update(group)
+            rows = _seed_rows(final_order, flip_groups, self.team_idx)
+            cells = tuple(cell for row in rows for cell in zip(self.counts_by_seed, self.counts_weighted_by_seed, row))
+            entry = self._cells_by_order[key] = (len(rows), cells)
+        n, cells = entry
+        u_share = unweighted / n
+        w_share = weighted / n
+        for counts, counts_weighted, i in cells:
+            counts[i] += u_share
+            counts_weighted[i] += w_share
+
+    def __getstate__(self) -> dict:
+        """Drop the cell cache when a worker ships its tally back to the parent."""
+        state = dict(self.__dict__)
+        state["_cells_by_order"] = {}
+        return state
+
+    def merge(self, other: "_SeedTally") -> None:
+        """Add every counter in *other* (built for the same teams) into this tally."""
+        for mine, theirs in zip(
+            self.counts_by_seed + self.counts_weighted_by_seed,
+            other.counts_by_seed + other.counts_weighted_by_seed,
+        ):
+            for i, value in enumerate(theirs):
+                mine[i] += value
+        self.denom_weighted += other.denom_weighted
+        self.pruned_weight += other.pruned_weight
+        self.coinflip_teams |= other.coinflip_teams
+
+    def seed_counts(self) -> tuple[list[defaultdict[str, float]], list[defaultdict[str, float]]]:
+        """Return the unweighted and weighted seed 1-4 counters keyed by team name.
+
+        A team is keyed only in the seeds it was actually credited with, matching
+        the ``defaultdict`` counters callers of ``determine_scenarios`` expect.
+        """
+        unweighted: list[defaultdict[str, float]] = []
+        weighted: list[defaultdict[str, float]] = []
+        for counts, counts_weighted in zip(self.counts_by_seed, self.counts_weighted_by_seed):
+            by_team: defaultdict[str, float] = defaultdict(float)
+            by_team_weighted: defaultdict[str, float] = defaultdict(float)
+            for i, team in enumerate(self.teams):
+                if counts[i] > 0.0:
+                    by_team[team] = counts[i]
+                    by_team_weighted[team] = counts_weighted[i]
+            unweighted.append(by_team)
+            weighted.append(by_team_weighted)
+        return unweighted, weighted
+
+
+def _contending_buckets(tie_buckets: list[list[str]], playoff_seeds: int = 4) -> list[list[str]]:
+    """Return the multi-team tie buckets that start within the playoff seeds.
+
+    Buckets arrive in base seeding order, so a bucket whose first position is
+    beyond ``playoff_seeds`` can only be reordered among non-playoff places.
+
+    Args:
+        tie_buckets: Tie bucket groups in base seeding order (from ``tie_bucket_groups``).
+        playoff_seeds: Number of seeds that qualify for the playoffs.
+
+    Returns:
+        The non-singleton buckets that overlap seeds ``1..playoff_seeds``.
+    """
+    out: list[list[str]] = []
+    position = 0
+    for bucket in tie_buckets:
+        if position >= playoff_seeds:
+            break
+        if len(bucket) > 1:
+            out.append(bucket)
+        position += len(bucket)
+    return out
+
+
+@dataclass
+class _MaskContext:
+    """Loop invariants shared by every outcome mask of one ``_enumerate_mask_range`` span.
+
+    Attributes:
+        teams: List of all team names in the region.
+        completed: List of CompletedGame instances for finished region games.
+        remaining: List of RemainingGame instances for unplayed region games.
+        resolve: Memoized resolver from ``make_cached_resolver``.
+        base_margins: Default margins dict keyed by ``(team_a, team_b)``.
+        base_vector: Default margins as a vector aligned with ``remaining``.
+        game_idx: Maps ``(team_a, team_b)`` to the game's position in ``remaining``.
+        pa_win: Points assumed scored against the winner of a remaining game.
+    """
+
+    teams: list[str]
+    completed: list[CompletedGame]
+    remaining: list[RemainingGame]
+    resolve: Callable
+    base_margins: dict[tuple[str, str], int]
+    base_vector: tuple[int, ...]
+    game_idx: dict[tuple[str, str], int]
+    pa_win: int
+
+
+@dataclass
+class _RecordBuckets:
+    """Tie-bucket data shared by every outcome mask with the same W/L/T record vector.
+
+    Attributes:
+        tie_buckets: Every tie bucket, in base seeding order.
+        all_intra: Games between two teams that each sit in a multi-team bucket.
+        contending_intra: The ``all_intra`` games with a team in a bucket that
+            reaches the playoff seeds.
+        contending_remaining: Remaining games with a team in such a bucket.
+        idle: Multi-team tie buckets that start below the playoff seeds.
+        idle_remaining: Remaining games with a team in ``idle``.
+        wl_totals: Per-team W/L/T totals for the record vector.
+    """
+
+    tie_buckets: list[list[str]]
+    all_intra: list[RemainingGame]
+    contending_intra: list[RemainingGame]
+    contending_remaining: list[RemainingGame]
+    idle: list[list[str]]
+    idle_remaining: list[RemainingGame]
+    wl_totals: dict
+
+    @property
+    def margin_sensitive(self) -> bool:
+        """Whether some margin combination is credited for masks with this record.
+
+        Credited combinations cover the contending intra-bucket games plus any
+        sensitive boundary games, which are drawn from ``contending_remaining``
+        and only looked for when the record has an intra-bucket game.
+        """
+        return bool(self.all_intra and self.contending_remaining)
+
+
+def _record_buckets(ctx: _MaskContext, outcome_mask: int) -> _RecordBuckets:
+    """Build the ``_RecordBuckets`` for *outcome_mask*'s W/L/T record vector.
+
+    Margins only reorder teams within a bucket, so games that touch no bucket
+    reaching the playoff seeds cannot move any seed count; the remaining
+    ("idle") buckets are kept apart so they are only checked for coin flips.
+    """
+    wl_totals = standings_from_mask(
+        ctx.teams, ctx.completed, ctx.remaining, outcome_mask, ctx.pa_win, ctx.base_margins, base_margin_default=7
+    )
+    tie_buckets = tie_bucket_groups(ctx.teams, wl_totals)
+    all_intra = unique_intra_bucket_games(tie_buckets, ctx.remaining)
+    contending_teams = {t for bucket in _contending_buckets(tie_buckets) for t in bucket}
+    idle = [b for b in tie_buckets if len(b) > 1 and b[0] not in contending_teams]
+    idle_teams = {t for bucket in idle for t in bucket}
+    return _RecordBuckets(
+        tie_buckets=tie_buckets,
+        all_intra=all_intra,
+        contending_intra=[rg for rg in all_intra if rg.a in contending_teams or rg.b in contending_teams],
+        contending_remaining=[rg for rg in ctx.remaining if rg.a in contending_teams or rg.b in contending_teams],
+        idle=idle,
+        idle_remaining=[rg for rg in ctx.remaining if rg.a in idle_teams or rg.b in idle_teams],
+        wl_totals=wl_totals,
+    )
+
+
+def _for_each_margin_combo(
+    ctx: _MaskContext,
+    outcome_mask: int,
+    games: list[int],
+    on_result: Callable[[tuple, tuple], bool | None],
+) -> None:
+    """Resolve *outcome_mask* under every 1-12 margin combination of *games*.
+
+    Every other game stays at its default margin.  The last game's margin runs
+    fastest, as in ``product``; its 12 results are bisected out of the change
+    points by ``results_across_margin_range`` instead of being resolved one by
+    one.
+
+    Args:
+        ctx: Loop invariants for the span being enumerated.
+        outcome_mask: The outcome mask being resolved.
+        games: Positions in ``remaining`` of the games whose margins vary
+            (at least one).
+        on_result: Called as ``on_result(final_order, local_flips)`` once per
+            combination, in enumeration order; returning True stops early.
+    """
+    # Every combo overwrites all of *games*, and the resolver keys on a tuple
+    # snapshot of the margins, so one vector can be updated in place.
+    vector = list(ctx.base_vector)
+    *outer_games, last_game = games
+
+    def resolve_last(m):
+        """Resolve the current outer combo with the last game won by *m*."""
+        vector[last_game] = m
+        return ctx.resolve.by_vector(outcome_mask, tuple(vector))
+
+    for outer_combo in product(range(1, 13), repeat=len(outer_games)):
+        for i, m in zip(outer_games, outer_combo):
+            vector[i] = m
+        for final_order, local_flips in results_across_margin_range(resolve_last):
+            if on_result(final_order, local_flips):
+                return
+
+
+def _record_idle_coin_flips(tally: _SeedTally, ctx: _MaskContext, buckets: _RecordBuckets, outcome_mask: int) -> None:
+    """Record coin flips in tie buckets that sit below the playoff seeds.
+
+    Such buckets are left out of the credited margin product because their
+    order cannot move a seed count, but a tie among them may still need a coin
+    flip at some margin, and ``coinflip_teams`` must report it.  The games
+    their teams play (against other tied teams, plus sensitive boundary games)
+    are enumerated here with every other game at the default margin, recording
+    flips only.
+
+    A bucket's order depends only on games one of its teams plays, so this
+    finds the same flips as enumerating those games jointly with the credited
+    ones.  A bucket is skipped when Steps 1-2, which read no margin, already
+    separate it, and the enumeration stops once every team it could flip is
+    recorded.
+
+    Args:
+        tally: Tally whose ``coinflip_teams`` is updated.
+        ctx: Loop invariants for the span being enumerated.
+        buckets: Tie-bucket data for *outcome_mask*'s record vector.
+        outcome_mask: The outcome mask being resolved.
+    """
+    tied = teams_tied_after_margin_free_steps(
+        ctx.teams, ctx.completed, ctx.remaining, outcome_mask, ctx.base_margins, buckets.wl_totals, buckets.idle
+    )
+    undecided = tied - tally.coinflip_teams
+    if not undecided:
+        return
+    members = {t for bucket in buckets.idle if undecided.intersection(bucket) for t in bucket}
+    games = [rg for rg in buckets.all_intra if rg.a in members or rg.b in members]
+    candidates = [rg for rg in buckets.idle_remaining if rg.a in members or rg.b in members]
+    games += sensitive_boundary_games(
+        buckets.tie_buckets,
+        candidates,
+        buckets.all_intra,
+        ctx.teams,
+        ctx.completed,
+        outcome_mask,
+        ctx.base_margins,
+        ctx.pa_win,
+        resolver=ctx.resolve,
+    )
+    if not games:
+        # Every game these teams play stays at the default margin, where the
+        # credited resolutions have already recorded their flips.
+        return
+
+    def record_flips(final_order, local_flips):
+        """Record *local_flips*; stop once every undecided team is recorded."""
+        for group in local_flips:
+            tally.coinflip_teams.update(group)
+        return undecided <= tally.coinflip_teams
+
+    _for_each_margin_combo(ctx, outcome_mask, [ctx.game_idx[(rg.a, rg.b)] for rg in games], record_flips)
+
+
+def _mask_weights(game_probs: list[float], mask_lo: int, mask_hi: int) -> list[float]:
+    """Return the outcome probability of every mask in ``[mask_lo, mask_hi)``.
+
+    The table for ``k + 1`` games is the table for ``k`` games scaled by the
+    new game's loss probability, followed by the same table scaled by its win
+    probability.  The span is split into aligned blocks of ``2^k`` masks,
+    which share every bit from ``k`` up; each block is the ``k``-game table
+    scaled by those fixed games' factors one at a time.  A chunk of a
+    parallel run therefore builds only tables as large as its own blocks,
+    and a mask costs one multiply for its table entry plus one per fixed
+    game of its block, rather than a product over every game.
+    Every weight is still the product of its per-game factors taken in game
+    order, so the values match a per-mask product exactly.
+
+    Args:
+        game_probs: Probability that ``remaining[i].a`` wins, per game.
+        mask_lo: First outcome mask (inclusive).
+        mask_hi: Last outcome mask (exclusive).
+
+    Returns:
+        The weights of ``mask_lo`` .. ``mask_hi - 1`` in mask order.
+    """
+    tables = [[1.0]]  # tables[k]: weights of the 2^k outcomes of the first k games
+    weights: list[float] = []
+    block_lo = mask_lo
+    while block_lo < mask_hi:
+        # The largest aligned block that starts at block_lo and fits the span.
+        k = (block_lo & -block_lo).bit_length() - 1 if block_lo else len(game_probs)
+        while block_lo + (1 << k) > mask_hi:
+            k -= 1
+        while len(tables) <= k:
+            p_win = game_probs[len(tables) - 1]
+            p_loss = 1.0 - p_win
+            tables.append([w * p_loss for w in tables[-1]] + [w * p_win for w in tables[-1]])
+        block = tables[k]
+        for bit_index in range(k, len(game_probs)):
+            p_win = game_probs[bit_index]
+            factor = p_win if (block_lo >> bit_index) & 1 else 1.0 - p_win
+            block = [w * factor for w in block]
+        weights.extend(block)
+        block_lo += 1 << k
+    return weights
+
+
+def _enumerate_mask_range(
+    teams: list[str],
+    completed: list[CompletedGame],
+    remaining: list[RemainingGame],
+    game_probs: list[float],
+    ignore_margins: bool,
+    odds_epsilon: float,
+    mask_lo: int,
+    mask_hi: int,
+) -> _SeedTally:
+    """Resolve every outcome mask in ``[mask_lo, mask_hi)`` and tally seed counts.
+
+    Masks are independent of one another, so any contiguous span can be
+    processed on its own and the resulting tallies summed.
+
+    Args:
+        teams: List of all team names in the region.
+        completed: List of CompletedGame instances for finished region games.
+        remaining: List of RemainingGame instances for unplayed region games.
+        game_probs: Probability that ``remaining[i].a`` wins, per game.
+        ignore_margins: Resolve each mask once at the default margin.
+        odds_epsilon: Masks whose weight is below this are resolved once at the
+            default margin; the weight of those whose record would have
+            enumerated margins is added to ``tally.pruned_weight``.  Unused
+            with ``ignore_margins``, which skips margins for every mask.
+        mask_lo: First outcome mask (inclusive).
+        mask_hi: Last outcome mask (exclusive).
+
+    Returns:
+        A ``_SeedTally`` holding the counts for this span of masks.
+    """
+    tally = _SeedTally(teams)
+    pa_for_winner = 14
+    # The hot loops address games by position: margins live in a vector
+    # aligned with ``remaining`` rather than a dict keyed by team-name pairs.
+    ctx = _MaskContext(
+        teams=teams,
+        completed=completed,
+        remaining=remaining,
+        resolve=make_cached_resolver(teams, completed, remaining, base_margin_default=7, pa_win=pa_for_winner),
+        base_margins={(rem_game.a, rem_game.b): 7 for rem_game in remaining},
+        base_vector=(7,) * len(remaining),
+        game_idx={(rem_game.a, rem_game.b): i for i, rem_game in enumerate(remaining)},
+        pa_win=pa_for_winner,
+    )
+    resolve = ctx.resolve
+    base_vector = ctx.base_vector
+    # Tie buckets depend only on each team's W/L/T record and the intra-bucket
+    # games only on those buckets, so masks that share a record vector share both.
+    buckets_by_record: dict[int, _RecordBuckets] = {}
+    # Record ids for the whole span come from one win-count pass.
+    record_ids = None if ignore_margins else record_ids_for_masks(teams, completed, remaining, mask_lo, mask_hi)
+    mask_weights = _mask_weights(game_probs, mask_lo, mask_hi)
+
+    for outcome_mask, mask_weight in zip(range(mask_lo, mask_hi), mask_weights):
+        tally.denom_weighted += mask_weight
+
+        if ignore_margins:
+            # Fast path: resolve once at the default margin, skip 12^N enumeration.
+            # Odds are approximate (margin tiebreakers not tracked), consistent with
+            # ignore_margins rendering mode.
+            final_order, local_flips = resolve.by_vector(outcome_mask, base_vector)
+            tally.accumulate(final_order, local_flips, 1.0, mask_weight)
+            continue
+
+        record_key = record_ids[outcome_mask - mask_lo]
+        buckets = buckets_by_record.get(record_key)
+        if buckets is None:
+            buckets = buckets_by_record[record_key] = _record_buckets(ctx, outcome_mask)
+        if mask_weight < odds_epsilon:
+            # A pruned mask carries too little probability for its margin split
+            # to matter, so it takes the same fast path.  Its weight is reported
+            # only when it would otherwise have enumerated margins.
+            final_order, local_flips = resolve.by_vector(outcome_mask, base_vector)
+            tally.accumulate(final_order, local_flips, 1.0, mask_weight)
+            if buckets.margin_sensitive:
+                tally.pruned_weight += mask_weight
+            continue
+        intra_bucket_games = buckets.contending_intra
+        if buckets.all_intra:
+            # Also include boundary games (bucket team vs. outside team) whose
+            # margin is sensitive to the tiebreaker outcome under 12^N enumeration.
+            boundary = sensitive_boundary_games(
+                buckets.tie_buckets,
+                buckets.contending_remaining,
+                buckets.all_intra,
+                teams,
+                completed,
+                outcome_mask,
+                ctx.base_margins,
+                pa_for_winner,
+                resolver=resolve,
+            )
+            if boundary:
+                intra_bucket_games = intra_bucket_games + boundary
+            if buckets.idle:
+                _record_idle_coin_flips(tally, ctx, buckets, outcome_mask)
+        if not intra_bucket_games:
+            final_order, local_flips = resolve.by_vector(outcome_mask, base_vector)
+            tally.accumulate(final_order, local_flips, 1.0, mask_weight)
+        else:
+            # Enumerate all 12^N margin combinations for intra-bucket games.
+            # This correctly captures multi-game threshold interactions that the
+            # old one-game-at-a-time isolation approach could miss (e.g. a
+            # tiebreaker that only flips when Game A wins by 12+ AND Game B wins
+            # by 1–6 simultaneously).
+            branch_weight = 1.0 / 12 ** len(intra_bucket_games)
+            effective_weight = mask_weight * branch_weight
+            _for_each_margin_combo(
+                ctx,
+                outcome_mask,
+                [ctx.game_idx[(rg.a, rg.b)] for rg in intra_bucket_games],
+                lambda final_order, local_flips: tally.accumulate(
+                    final_order, local_flips, branch_weight, effective_weight
+                ),
+            )
+
+    return tally
+
+
+def _tally_sampled_masks(
+    teams: list[str],
+    completed: list[CompletedGame],
+    remaining: list[RemainingGame],
+    mask_counts: Sequence[tuple[int, int]],
+) -> _SeedTally:
+    """Resolve each distinct sampled mask once and credit it with its draw count.
+
+    Sampling implies ``ignore_margins``, so every mask resolves at the default
+    margin and a mask drawn *k* times contributes *k* identical samples.
+
+    Args:
+        teams: List of all team names in the region.
+        completed: List of CompletedGame instances for finished region games.
+        remaining: List of RemainingGame instances for unplayed region games.
+        mask_counts: ``(outcome_mask, times_drawn)`` pairs.
+
+    Returns:
+        A ``_SeedTally`` holding the counts for these samples.
+    """
+    tally = _SeedTally(teams)
+    base_margins = {(rem_game.a, rem_game.b): 7 for rem_game in remaining}
+    # Sampled masks rarely repeat a margin vector, so they are resolved
+    # directly rather than through ``make_cached_resolver``.
+    completed_h2h = build_h2h_maps(completed, [], 0, {})
+    vs_index = build_vs_index(completed, remaining)
+    for outcome_mask, times_drawn in mask_counts:
+        local_flips: list[list[str]] = []
+        final_order = resolve_standings_for_mask(
+            teams,
+            completed,
+            remaining,
+            outcome_mask,
+            margins=base_margins,
+            base_margin_default=7,
+            pa_win=14,
+            coin_flip_collector=local_flips,
+            completed_h2h=completed_h2h,
+            vs_index=vs_index,
+        )
+        tally.accumulate(tuple(final_order), tuple(map(tuple, local_flips)), float(times_drawn), float(times_drawn))
+        tally.denom_weighted += times_drawn
+    return tally
 
 
 def determine_scenarios(
@@ -139,6 +620,8 @@ def determine_scenarios(
     win_prob_fn: WinProbFn | None = None,
     ignore_margins: bool = False,
     n_samples: int | None = None,
+    max_workers: int | None = None,
+    odds_epsilon: float = 0.0,
 ) -> ScenarioResults:
     """Enumerate all seeding scenarios for a region and compute seed-count totals.
 
@@ -172,38 +655,33 @@ def determine_scenarios(
             ``ignore_margins`` rendering mode.
         n_samples: When set, use Monte Carlo sampling with this many draws
             instead of exhaustive 2^R enumeration.  Forces ``ignore_margins``.
+        max_workers: When greater than 1, split the exhaustive 2^R enumeration
+            (or, when sampling, the distinct sampled masks) into contiguous
+            chunks and resolve them in a process pool of this size.  Defaults
+            to a single-process loop; the region pipeline passes its
+            ``SCENARIO_MAX_WORKERS`` setting.  Margin combinations within a
+            mask are not threaded: resolution is pure Python and would
+            serialise behind the GIL.
+        odds_epsilon: Outcome masks whose win-probability weight is below this
+            value skip the 12^N margin enumeration and are resolved once at the
+            default margin.  The total weight of those that would otherwise
+            have enumerated margins is reported as ``pruned_weight``, which
+            bounds the error in the weighted odds.  Has no effect with
+            ``ignore_margins``, which already resolves every mask at the
+            default margin.  Defaults to 0.0 (exact); no pipeline caller
+            sets it.
 
     Returns:
         A ``ScenarioResults`` instance with unweighted and weighted seed counts,
         the scenario denominator, and the set of team names that required a
         coin flip in at least one outcome.
     """
-    try:
-        from prefect import get_run_logger
-
-        logger = get_run_logger()
-    except Exception:
-        logger = logging.getLogger("scenarios")
-        if not logger.handlers:
-            logger.addHandler(logging.NullHandler())
-
     _win_prob_fn = win_prob_fn if win_prob_fn is not None else equal_win_prob
 
     num_remaining = len(remaining)
-
-    first_counts: defaultdict[str, float] = defaultdict(float)
-    second_counts: defaultdict[str, float] = defaultdict(float)
-    third_counts: defaultdict[str, float] = defaultdict(float)
-    fourth_counts: defaultdict[str, float] = defaultdict(float)
-    first_counts_weighted: defaultdict[str, float] = defaultdict(float)
-    second_counts_weighted: defaultdict[str, float] = defaultdict(float)
-    third_counts_weighted: defaultdict[str, float] = defaultdict(float)
-    fourth_counts_weighted: defaultdict[str, float] = defaultdict(float)
-    denom_weighted: float = 0.0
+    tally = _SeedTally(teams)
 
     pa_for_winner = 14
-    base_margins = {(rem_game.a, rem_game.b): 7 for rem_game in remaining}
-    all_coinflip_events: list[list[str]] = []
 
     if num_remaining == 0:
         local_flips: list[list[str]] = []
@@ -217,218 +695,68 @@ def determine_scenarios(
             pa_win=pa_for_winner,
             coin_flip_collector=local_flips,
         )
-        all_coinflip_events.extend(local_flips)
-        _accumulate_slots(
-            final_order,
-            local_flips,
-            1.0,
-            1.0,
-            first_counts,
-            second_counts,
-            third_counts,
-            fourth_counts,
-            first_counts_weighted,
-            second_counts_weighted,
-            third_counts_weighted,
-            fourth_counts_weighted,
-        )
+        tally.accumulate(tuple(final_order), tuple(map(tuple, local_flips)), 1.0, 1.0)
         denom = 1.0
-        denom_weighted = 1.0
+        tally.denom_weighted = 1.0
 
     elif n_samples is not None:
         # Monte Carlo path: sample outcomes from the Elo joint distribution.
         # Each game is drawn Bernoulli(p); sample frequency is Elo-weighted by
         # construction, so weighted and unweighted counts are both accumulated
         # uniformly (each sample contributes weight 1.0 / n_samples).
+        game_probs = [_win_prob_fn(rg.a, rg.b, None, rg.location_a) for rg in remaining]
+        # Every draw happens here, before any worker starts, so the sampled
+        # masks do not depend on ``max_workers``.
+        draws: Counter[int] = Counter()
         for _ in range(n_samples):
             outcome_mask = 0
-            for bit_index, rem_game in enumerate(remaining):
-                p = _win_prob_fn(rem_game.a, rem_game.b, None, rem_game.location_a)
+            for bit_index, p in enumerate(game_probs):
                 # Statistical Monte Carlo sampling only — not security-sensitive.
                 if random.random() < p:  # NOSONAR
                     outcome_mask |= 1 << bit_index
-            local_flips: list[list[str]] = []
-            final_order = resolve_standings_for_mask(
-                teams,
-                completed,
-                remaining,
-                outcome_mask,
-                margins=base_margins,
-                base_margin_default=7,
-                pa_win=pa_for_winner,
-                coin_flip_collector=local_flips,
-            )
-            all_coinflip_events.extend(local_flips)
-            _accumulate_slots(
-                final_order,
-                local_flips,
-                1.0,
-                1.0,
-                first_counts,
-                second_counts,
-                third_counts,
-                fourth_counts,
-                first_counts_weighted,
-                second_counts_weighted,
-                third_counts_weighted,
-                fourth_counts_weighted,
-            )
-            denom_weighted += 1.0
+            draws[outcome_mask] += 1
+        mask_counts = sorted(draws.items())
+        if max_workers is None or max_workers <= 1 or len(mask_counts) == 1:
+            tally = _tally_sampled_masks(teams, completed, remaining, mask_counts)
+        else:
+            chunks = [(mask_counts[lo:hi],) for lo, hi in split_range(len(mask_counts), max_workers * 4)]
+            for partial in map_chunks(_tally_sampled_masks, (teams, completed, remaining), chunks, max_workers):
+                tally.merge(partial)
         denom = float(n_samples)
 
     else:
         total_masks = 1 << num_remaining
-        for outcome_mask in range(total_masks):
-            mask_weight = 1.0
-            for bit_index, rem_game in enumerate(remaining):
-                bit_value = (outcome_mask >> bit_index) & 1
-                p = _win_prob_fn(rem_game.a, rem_game.b, None, rem_game.location_a)
-                mask_weight *= p if bit_value else (1.0 - p)
-
-            denom_weighted += mask_weight
-
-            if ignore_margins:
-                # Fast path: resolve once at the default margin, skip 12^N enumeration.
-                # Odds are approximate (margin tiebreakers not tracked), consistent with
-                # ignore_margins rendering mode.
-                local_flips: list[list[str]] = []
-                final_order = resolve_standings_for_mask(
-                    teams,
-                    completed,
-                    remaining,
-                    outcome_mask,
-                    margins=base_margins,
-                    base_margin_default=7,
-                    pa_win=pa_for_winner,
-                    coin_flip_collector=local_flips,
-                )
-                all_coinflip_events.extend(local_flips)
-                _accumulate_slots(
-                    final_order,
-                    local_flips,
-                    1.0,
-                    mask_weight,
-                    first_counts,
-                    second_counts,
-                    third_counts,
-                    fourth_counts,
-                    first_counts_weighted,
-                    second_counts_weighted,
-                    third_counts_weighted,
-                    fourth_counts_weighted,
-                )
-                continue
-
-            wl_totals = standings_from_mask(
-                teams,
-                completed,
-                remaining,
-                outcome_mask,
-                pa_for_winner,
-                base_margins,
-                base_margin_default=7,
+        # Win probabilities are resolved up front so the worker processes never
+        # need to pickle ``win_prob_fn`` (often a closure over ratings).
+        game_probs = [_win_prob_fn(rg.a, rg.b, None, rg.location_a) for rg in remaining]
+        if max_workers is None or max_workers <= 1 or total_masks == 1:
+            tally = _enumerate_mask_range(
+                teams, completed, remaining, game_probs, ignore_margins, odds_epsilon, 0, total_masks
             )
-            tie_buckets = tie_bucket_groups(teams, wl_totals)
-            intra_bucket_games = unique_intra_bucket_games(tie_buckets, remaining)
-            if intra_bucket_games:
-                # Also include boundary games (bucket team vs. outside team) whose
-                # margin is sensitive to the tiebreaker outcome under 12^N enumeration.
-                boundary = sensitive_boundary_games(
-                    tie_buckets,
-                    remaining,
-                    intra_bucket_games,
-                    teams,
-                    completed,
-                    outcome_mask,
-                    base_margins,
-                    pa_for_winner,
-                )
-                if boundary:
-                    intra_bucket_games = intra_bucket_games + boundary
-            if not intra_bucket_games:
-                local_flips = []
-                final_order = resolve_standings_for_mask(
-                    teams,
-                    completed,
-                    remaining,
-                    outcome_mask,
-                    margins=base_margins,
-                    base_margin_default=7,
-                    pa_win=pa_for_winner,
-                    coin_flip_collector=local_flips,
-                )
-                all_coinflip_events.extend(local_flips)
-                _accumulate_slots(
-                    final_order,
-                    local_flips,
-                    1.0,
-                    mask_weight,
-                    first_counts,
-                    second_counts,
-                    third_counts,
-                    fourth_counts,
-                    first_counts_weighted,
-                    second_counts_weighted,
-                    third_counts_weighted,
-                    fourth_counts_weighted,
-                )
-            else:
-                # Enumerate all 12^N margin combinations for intra-bucket games.
-                # This correctly captures multi-game threshold interactions that the
-                # old one-game-at-a-time isolation approach could miss (e.g. a
-                # tiebreaker that only flips when Game A wins by 12+ AND Game B wins
-                # by 1–6 simultaneously).
-                intra_pairs = [(rg.a, rg.b) for rg in intra_bucket_games]
-                n_intra = len(intra_pairs)
-                total_combos = 12**n_intra
-                for margin_combo in product(range(1, 13), repeat=n_intra):
-                    branch_margins = dict(base_margins)
-                    for (a, b), m in zip(intra_pairs, margin_combo):
-                        branch_margins[(a, b)] = m
-                    branch_weight = 1.0 / total_combos
-                    effective_weight = mask_weight * branch_weight
-                    local_flips = []
-                    final_order = resolve_standings_for_mask(
-                        teams,
-                        completed,
-                        remaining,
-                        outcome_mask,
-                        margins=branch_margins,
-                        base_margin_default=7,
-                        pa_win=pa_for_winner,
-                        coin_flip_collector=local_flips,
-                    )
-                    all_coinflip_events.extend(local_flips)
-                    _accumulate_slots(
-                        final_order,
-                        local_flips,
-                        branch_weight,
-                        effective_weight,
-                        first_counts,
-                        second_counts,
-                        third_counts,
-                        fourth_counts,
-                        first_counts_weighted,
-                        second_counts_weighted,
-                        third_counts_weighted,
-                        fourth_counts_weighted,
-                    )
+        else:
+            # Sensitive masks cost far more than the rest, so over-split the range
+            # to keep every worker busy until the end.
+            region = (teams, completed, remaining, game_probs, ignore_margins, odds_epsilon)
+            chunks = split_range(total_masks, max_workers * 4)
+            for partial in map_chunks(_enumerate_mask_range, region, chunks, max_workers):
+                tally.merge(partial)
 
         denom = float(1 << num_remaining)
 
-    coinflip_teams: set[str] = {team for group in all_coinflip_events for team in group}
+    (first, second, third, fourth), (first_w, second_w, third_w, fourth_w) = tally.seed_counts()
     return ScenarioResults(
-        first_counts=first_counts,
-        second_counts=second_counts,
-        third_counts=third_counts,
-        fourth_counts=fourth_counts,
+        first_counts=first,
+        second_counts=second,
+        third_counts=third,
+        fourth_counts=fourth,
         denom=denom,
-        coinflip_teams=coinflip_teams,
-        first_counts_weighted=first_counts_weighted,
-        second_counts_weighted=second_counts_weighted,
-        third_counts_weighted=third_counts_weighted,
-        fourth_counts_weighted=fourth_counts_weighted,
-        denom_weighted=denom_weighted,
+        coinflip_teams=tally.coinflip_teams,
+        first_counts_weighted=first_w,
+        second_counts_weighted=second_w,
+        third_counts_weighted=third_w,
+        fourth_counts_weighted=fourth_w,
+        denom_weighted=tally.denom_weighted,
+        pruned_weight=tally.pruned_weight,
     )
 
 
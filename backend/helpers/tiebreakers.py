@@ -6,6 +6,8 @@ games -> coin flip). No Prefect or database dependencies.
 """
 
 from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
 
 from backend.helpers.data_helpers import normalize_pair
 
@@ -14,7 +16,9 @@ from backend.helpers.data_helpers import normalize_pair
 # -------------------------
 
 
-def standings_from_mask(teams, completed, remaining, outcome_mask, pa_win, margins, base_margin_default=7):
+def standings_from_mask(
+    teams, completed, remaining, outcome_mask, pa_win, margins, base_margin_default=7, completed_totals=None
+):
     """Compute W/L/T and PA for all teams for a given outcome mask.
 
     Implements Step 5 (PA accumulation) by tallying completed game results and
@@ -31,46 +35,99 @@ def standings_from_mask(teams, completed, remaining, outcome_mask, pa_win, margi
             (always positive); used for Step 3/4 PD calculations.
         base_margin_default: Assumed winning margin when a game's margin is not
             in `margins`.
+        completed_totals: Optional ``standings_from_mask(teams, completed, [],
+            0, pa_win, {})`` result.  The completed-game tallies do not depend
+            on the mask, so callers resolving many masks build them once and
+            pass them here; they are copied, never mutated.
 
     Returns:
         A dict mapping each team name to a sub-dict with keys
         ``{"w", "l", "t", "pa"}``.
     """
-    wl_totals = {t: {"w": 0, "l": 0, "t": 0, "pa": 0} for t in teams}
-    # Completed region games
+    if completed_totals is not None:
+        wl_totals = {t: rec.copy() for t, rec in completed_totals.items()}
+        completed = ()
+    else:
+        wl_totals = {t: {"w": 0, "l": 0, "t": 0, "pa": 0} for t in teams}
+    # Completed region games.  Each team's record dict is looked up once per
+    # game and updated through the local reference.
     for comp_game in completed:
-        if comp_game.a not in wl_totals or comp_game.b not in wl_totals:
+        rec_a = wl_totals.get(comp_game.a)
+        rec_b = wl_totals.get(comp_game.b)
+        if rec_a is None or rec_b is None:
             continue
         if comp_game.res_a == 1:
-            wl_totals[comp_game.a]["w"] += 1
-            wl_totals[comp_game.b]["l"] += 1
+            rec_a["w"] += 1
+            rec_b["l"] += 1
         elif comp_game.res_a == -1:
-            wl_totals[comp_game.b]["w"] += 1
-            wl_totals[comp_game.a]["l"] += 1
+            rec_b["w"] += 1
+            rec_a["l"] += 1
         else:
-            wl_totals[comp_game.a]["t"] += 1
-            wl_totals[comp_game.b]["t"] += 1
+            rec_a["t"] += 1
+            rec_b["t"] += 1
         # Step 5 – PA from completed games
-        wl_totals[comp_game.a]["pa"] += comp_game.pa_a
-        wl_totals[comp_game.b]["pa"] += comp_game.pa_b
+        rec_a["pa"] += comp_game.pa_a
+        rec_b["pa"] += comp_game.pa_b
     # Remaining region games (winner/loser by mask; PA includes margin for loser)
     for i, rem_game in enumerate(remaining):
         bit = (outcome_mask >> i) & 1
         winner, loser = (rem_game.a, rem_game.b) if bit == 1 else (rem_game.b, rem_game.a)
         m = margins.get((rem_game.a, rem_game.b), base_margin_default)
-        wl_totals[winner]["w"] += 1
-        wl_totals[loser]["l"] += 1
-        wl_totals[winner]["pa"] += pa_win
-        wl_totals[loser]["pa"] += pa_win + m
+        rec_w = wl_totals[winner]
+        rec_l = wl_totals[loser]
+        rec_w["w"] += 1
+        rec_l["l"] += 1
+        rec_w["pa"] += pa_win
+        rec_l["pa"] += pa_win + m
     return wl_totals
 
 
+def record_ids_for_masks(teams, completed, remaining, mask_lo, mask_hi):
+    """Group a span of outcome masks by the W/L/T record vector they produce.
+
+    Remaining games never end in a tie and every team plays the same number of
+    games under any mask, so a mask's record vector is fixed by its win counts.
+    Each mask only adds one win per remaining game to the completed-game win
+    counts, which is far cheaper than a full ``standings_from_mask`` call.
+
+    Args:
+        teams: List of all team names in the region.
+        completed: List of CompletedGame instances for finished region games.
+        remaining: List of RemainingGame instances for unplayed region games.
+        mask_lo: First outcome mask (inclusive).
+        mask_hi: Last outcome mask (exclusive).
+
+    Returns:
+        A list of ints of length ``mask_hi - mask_lo``.  Two masks share an id
+        exactly when every team has the same W/L/T record under both.
+    """
+    idx = {t: i for i, t in enumerate(teams)}
+    base_wins = [0] * len(teams)
+    for comp_game in completed:
+        if comp_game.a not in idx or comp_game.b not in idx:
+            continue
+        if comp_game.res_a == 1:
+            base_wins[idx[comp_game.a]] += 1
+        elif comp_game.res_a == -1:
+            base_wins[idx[comp_game.b]] += 1
+    # (winner index when bit i is set, winner index when it is clear) per game.
+    winners = [(idx[rem_game.a], idx[rem_game.b]) for rem_game in remaining]
+    ids: dict[tuple[int, ...], int] = {}
+    record_ids = []
+    for mask in range(mask_lo, mask_hi):
+        wins = base_wins[:]
+        for i, (a_idx, b_idx) in enumerate(winners):
+            wins[a_idx if (mask >> i) & 1 else b_idx] += 1
+        record_ids.append(ids.setdefault(tuple(wins), len(ids)))
+    return record_ids
+
+
 # -------------------------
 # Steps 1 & 3: H2H maps
 # -------------------------
 
 
-def build_h2h_maps(completed, remaining, outcome_mask, margins, base_margin_default=7):
+def build_h2h_maps(completed, remaining, outcome_mask, margins, base_margin_default=7, completed_maps=None):
     """Build head-to-head maps used by tiebreaker Steps 1 and 3.
 
     Constructs three defaultdicts indexed by (team_a, team_b):
@@ -86,14 +143,22 @@ def build_h2h_maps(completed, remaining, outcome_mask, margins, base_margin_defa
             (always positive).
         base_margin_default: Assumed winning margin when a game's margin is not
             in `margins`.
+        completed_maps: Optional ``build_h2h_maps(completed, [], 0, {})``
+            result.  The completed-game tallies do not depend on the mask, so
+            callers resolving many masks build them once and pass them here;
+            they are copied, never mutated.
 
     Returns:
         A 3-tuple ``(h2h_points, capped_pd_map, pd_uncap)`` where each is a
         defaultdict keyed by (team_a, team_b).
     """
-    h2h_points = defaultdict(float)
-    capped_pd_map = defaultdict(int)
-    pd_uncap = defaultdict(int)
+    if completed_maps is not None:
+        h2h_points, capped_pd_map, pd_uncap = (m.copy() for m in completed_maps)
+        completed = ()
+    else:
+        h2h_points = defaultdict(float)
+        capped_pd_map = defaultdict(int)
+        pd_uncap = defaultdict(int)
     # Completed H2H
     for comp_game in completed:
         # Step 1: H2H points tally
@@ -111,22 +176,19 @@ def build_h2h_maps(completed, remaining, outcome_mask, margins, base_margin_defa
         # Raw margin (not used in sort, kept for reference)
         pd_uncap[(comp_game.a, comp_game.b)] += comp_game.pd_a
         pd_uncap[(comp_game.b, comp_game.a)] -= comp_game.pd_a
-    # Remaining H2H (driven by mask & margins)
+    # Remaining H2H (driven by mask & margins).  Each game credits its
+    # winner the same way whichever side won, so only the key order depends
+    # on the mask bit.
     for i, rem_game in enumerate(remaining):
-        bit = (outcome_mask >> i) & 1
-        m = margins.get((rem_game.a, rem_game.b), base_margin_default)
-        if bit == 1:
-            h2h_points[(rem_game.a, rem_game.b)] += 1.0
-            capped_pd_map[(rem_game.a, rem_game.b)] += min(m, 12)
-            capped_pd_map[(rem_game.b, rem_game.a)] -= min(m, 12)
-            pd_uncap[(rem_game.a, rem_game.b)] += m
-            pd_uncap[(rem_game.b, rem_game.a)] -= m
-        else:
-            h2h_points[(rem_game.b, rem_game.a)] += 1.0
-            capped_pd_map[(rem_game.a, rem_game.b)] -= min(m, 12)
-            capped_pd_map[(rem_game.b, rem_game.a)] += min(m, 12)
-            pd_uncap[(rem_game.a, rem_game.b)] -= m
-            pd_uncap[(rem_game.b, rem_game.a)] += m
+        pair = (rem_game.a, rem_game.b)
+        m = margins.get(pair, base_margin_default)
+        won, lost = (pair, (rem_game.b, rem_game.a)) if (outcome_mask >> i) & 1 else ((rem_game.b, rem_game.a), pair)
+        capped = min(m, 12)
+        h2h_points[won] += 1.0
+        capped_pd_map[won] += capped
+        capped_pd_map[lost] -= capped
+        pd_uncap[won] += m
+        pd_uncap[lost] -= m
     return h2h_points, capped_pd_map, pd_uncap
 
 
@@ -135,6 +197,45 @@ def build_h2h_maps(completed, remaining, outcome_mask, margins, base_margin_defa
 # -------------------------
 
 
+def build_vs_index(completed, remaining):
+    """Index every region game by ``(team, opponent)`` for Step 2/4 lookups.
+
+    Completed games are stored from each team's point of view as the
+    ``(result, capped_pd)`` pair ``step2_step4_arrays`` reports, since neither
+    depends on the mask.  Remaining games are stored as
+    ``(game_index, (a, b), team_is_a)`` so the mask bit and margin can be read
+    directly.  A pair is found only under its canonical ``(a, b)`` orientation
+    (see ``normalize_pair``), and a completed game shadows a remaining game
+    between the same teams.
+
+    Args:
+        completed: List of CompletedGame instances for finished region games.
+        remaining: List of RemainingGame instances for unplayed region games.
+
+    Returns:
+        A 2-tuple ``(completed_vs, remaining_vs)`` of dicts keyed by
+        ``(team, opponent)``.
+    """
+    completed_vs: dict = {}
+    for cg in {(cg.a, cg.b): cg for cg in completed}.values():
+        if cg.a > cg.b:
+            continue
+        pd = max(-12, min(12, cg.pd_a))
+        res_a = 2 if cg.res_a == 1 else 0 if cg.res_a == -1 else 1  # 1 = split/"tie" in our encoding
+        completed_vs[(cg.a, cg.b)] = (res_a, pd)
+        if cg.b != cg.a:
+            completed_vs[(cg.b, cg.a)] = (2 - res_a, max(-12, min(12, -cg.pd_a)))
+    remaining_vs: dict = {}
+    for pair, i in {(rg.a, rg.b): i for i, rg in enumerate(remaining)}.items():
+        a, b = pair
+        if a > b or (a, b) in completed_vs:
+            continue
+        remaining_vs[(a, b)] = (i, pair, True)
+        if b != a:
+            remaining_vs[(b, a)] = (i, pair, False)
+    return completed_vs, remaining_vs
+
+
 def step2_step4_arrays(
     _teams,
     bucket,
@@ -144,6 +245,7 @@ def step2_step4_arrays(
     outcome_mask,
     margins,
     base_margin_default=7,
+    vs_index=None,
 ):
     """Compute Step 2 and Step 4 arrays for each tied team.
 
@@ -165,6 +267,9 @@ def step2_step4_arrays(
             (always positive).
         base_margin_default: Assumed winning margin when a game's margin is not
             in `margins`.
+        vs_index: Optional ``build_vs_index(completed, remaining)`` result.  It
+            does not depend on the mask, so callers resolving many masks build
+            it once and pass it here.
 
     Returns:
         A 2-tuple ``(step2, step4)`` where each is a dict mapping team name to
@@ -173,46 +278,33 @@ def step2_step4_arrays(
     bucket_set = set(bucket)
     outside = [s for s in base_order if s not in bucket_set]
 
-    comp_idx = {(cg.a, cg.b): cg for cg in completed}
-    rem_idx = {(rg.a, rg.b): i for i, rg in enumerate(remaining)}
-
-    def res_vs(team, opp):
-        """Return the encoded result (2/1/0/None) for team vs opp."""
-        a, b, _ = normalize_pair(team, opp)
-        comp_game = comp_idx.get((a, b))
-        if comp_game is not None:
-            if comp_game.res_a == 1:
-                return 2 if team == a else 0
-            if comp_game.res_a == -1:
-                return 0 if team == a else 2
-            return 1  # split/"tie" in our encoding
-        idx = rem_idx.get((a, b))
-        if idx is None:
-            return None
-        bit = (outcome_mask >> idx) & 1
-        winner = a if bit == 1 else b
-        return 2 if team == winner else 0
-
-    def pd_vs(team, opp):
-        """Capped PD vs outside (±12)."""
-        a, b, _ = normalize_pair(team, opp)
-        comp_game = comp_idx.get((a, b))
-        if comp_game is not None:
-            raw = comp_game.pd_a if team == a else -comp_game.pd_a
-            return max(-12, min(12, raw))
-        idx = rem_idx.get((a, b))
-        if idx is None:
-            return None
-        bit = (outcome_mask >> idx) & 1
-        m = margins.get((a, b), base_margin_default)
-        m_capped = max(-12, min(12, m))
-        if bit == 1:  # a defeats b by m
-            return m_capped if team == a else -m_capped
-        else:  # b defeats a by m
-            return -m_capped if team == a else m_capped
-
-    step2 = {s: [res_vs(s, o) for o in outside] for s in bucket}
-    step4 = {s: [pd_vs(s, o) for o in outside] for s in bucket}
+    completed_vs, remaining_vs = vs_index if vs_index is not None else build_vs_index(completed, remaining)
+
+    def vs(team, opp):
+        """Return ``(result, capped_pd)`` for team vs opp, or ``(None, None)`` if they don't meet.
+
+        Both arrays read the same game, so it is looked up once and shared
+        between the Step 2 result and the Step 4 differential.
+        """
+        known = completed_vs.get((team, opp))
+        if known is not None:
+            return known
+        game = remaining_vs.get((team, opp))
+        if game is None:
+            return None, None
+        idx, pair, team_is_a = game
+        m_capped = max(-12, min(12, margins.get(pair, base_margin_default)))
+        # Bit i = 1 means the game's ``a`` side won.
+        if ((outcome_mask >> idx) & 1) == team_is_a:
+            return 2, m_capped
+        return 0, -m_capped
+
+    step2 = {}
+    step4 = {}
+    for s in bucket:
+        pairs = [vs(s, o) for o in outside]
+        step2[s] = [res for res, _ in pairs]
+        step4[s] = [pd for _, pd in pairs]
     return step2, step4
 
 
@@ -224,57 +316,72 @@ def step2_step4_arrays(
 def _key_step2(step2_row):
     """Return a sortable key for a Step 2 result vector.
 
-    Higher result is better (2>1>0), None sorts last (worst). Values are
-    negated so that a lexicographically smaller tuple represents a better
-    record in Python's default ascending sort.
+    Higher result is better (2>1>0), None sorts last (worst).  Each entry
+    becomes a base-4 digit (win 0, tie 1, loss 2, no game 3) of a single int,
+    most significant first, so a smaller key is a better record.  Every row
+    of one bucket has the same length (one entry per outside team), so the
+    packed ints compare exactly like the rows themselves without building a
+    tuple per team.
 
     Args:
         step2_row: List of encoded results (2, 1, 0, or None) vs outside teams.
 
     Returns:
-        A tuple of negated integers suitable for lexicographic comparison.
+        An int key; lower is better.
     """
-    return tuple(-(x if x is not None else -(10**9)) for x in step2_row)
+    key = 0
+    for x in step2_row:
+        key = key * 4 + (3 if x is None else 2 - x)
+    return key
 
 
 def _key_step4(step4_row):
     """Return a sortable key for a Step 4 point-differential vector.
 
-    Higher PD is better; None sorts last (worst). Values are negated so that a
-    lexicographically smaller tuple represents a better differential in Python's
-    default ascending sort.
+    Higher PD is better; None sorts last (worst).  Each capped differential
+    becomes a base-26 digit (+12 is 0 through -12 is 24, no game 25) of a
+    single int, packed like ``_key_step2``.
 
     Args:
         step4_row: List of capped (±12) point differentials vs outside teams,
             or None when no game was played.
 
     Returns:
-        A tuple of negated integers suitable for lexicographic comparison.
+        An int key; lower is better.
     """
-    return tuple(-(x if x is not None else -(10**9)) for x in step4_row)
+    key = 0
+    for x in step4_row:
+        key = key * 26 + (25 if x is None else 12 - x)
+    return key
 
 
 def _partition_by(items, key_func):
     """Partition a list of teams into groups with equal keys.
 
-    Groups are returned in ascending key order; teams within each group are
-    sorted alphabetically for determinism.
+    Groups are returned in ascending key order; teams within each group keep
+    their order in *items*.  ``resolve_bucket`` only ever passes
+    alphabetically sorted groups, so every part comes out sorted without
+    re-sorting it.
 
     Args:
-        items: List of team names to partition.
+        items: Alphabetically sorted list of team names to partition.
         key_func: Callable that maps a team name to a comparable key.
 
     Returns:
         A list of groups (each group is a sorted list of team names), ordered
         by ascending key value.
     """
+    if len(items) == 2:
+        # Most ties are two teams: compare the two keys directly.
+        a, b = items
+        key_a, key_b = key_func(a), key_func(b)
+        if key_a == key_b:
+            return [list(items)]
+        return [[a], [b]] if key_a < key_b else [[b], [a]]
     buckets: dict = defaultdict(list)
     for t in items:
         buckets[key_func(t)].append(t)
-    out = []
-    for k in sorted(buckets.keys()):
-        out.append(sorted(buckets[k]))  # alphabetical within equal key
-    return out
+    return [buckets[k] for k in sorted(buckets.keys())]
 
 
 # -------------------------
@@ -294,6 +401,9 @@ def resolve_bucket(
     base_margin_default=7,
     coin_flip_collector: list[list[str]] | None = None,
     step_trace_collector: dict | None = None,
+    h2h_maps: tuple | None = None,
+    last_step: int = 5,
+    vs_index: tuple | None = None,
 ):
     """Apply tiebreaker Steps 1-6 to order a single tied group of teams.
 
@@ -321,6 +431,15 @@ def resolve_bucket(
             ``{tuple(sorted(bucket)): (step2, step4)}`` for this bucket and
             any sub-buckets resolved by recursive calls.  Pass the same dict
             to ``resolve_standings_with_trace`` to avoid recomputing step data.
+        h2h_maps: Optional ``build_h2h_maps`` result for the same mask and
+            margins.  The maps cover every pair in the region, so one build is
+            shared by all buckets and by the recursive sub-bucket calls.
+        last_step: Stop after this deterministic step (1-5).  Groups still
+            tied at that point are reported through ``coin_flip_collector``,
+            so with ``last_step < 5`` it collects the groups that later steps
+            would have to break rather than true coin flips.
+        vs_index: Optional ``build_vs_index`` result for the same games,
+            forwarded to ``step2_step4_arrays`` and the recursive calls.
 
     Returns:
         An ordered list of team names (highest seed first) for this bucket.
@@ -328,7 +447,9 @@ def resolve_bucket(
     if len(bucket) == 1:
         return bucket[:]
 
-    h2h_pts, h2h_pd_cap, _ = build_h2h_maps(completed, remaining, outcome_mask, margins, base_margin_default)
+    if h2h_maps is None:
+        h2h_maps = build_h2h_maps(completed, remaining, outcome_mask, margins, base_margin_default)
+    h2h_pts, h2h_pd_cap, _ = h2h_maps
     # Step 1 tally across the bucket
     step1 = dict.fromkeys(bucket, 0.0)
     for s in bucket:
@@ -337,23 +458,20 @@ def resolve_bucket(
                 continue
             step1[s] += h2h_pts.get((s, o), 0.0)
 
-    # Step 3 (capped H2H PD) across the bucket
-    step3 = dict.fromkeys(bucket, 0)
-    for s in bucket:
-        for o in bucket:
-            if s == o:
-                continue
-            step3[s] += h2h_pd_cap.get((s, o), 0)
-
-    step2, step4 = step2_step4_arrays(
-        teams, bucket, base_order, completed, remaining, outcome_mask, margins, base_margin_default
-    )
+    # Steps 2-4 are built only once the bucket reaches them (see the loop
+    # below), except that a step trace always records the Step 2/4 arrays.
+    step2 = step4 = step3 = None
+    ordered = sorted(bucket)
     if step_trace_collector is not None:
-        step_trace_collector[tuple(sorted(bucket))] = (step2, step4)
+        step2, step4 = step2_step4_arrays(
+            teams, bucket, base_order, completed, remaining, outcome_mask, margins, base_margin_default, vs_index
+        )
+        step_trace_collector[tuple(ordered)] = (step2, step4)
 
     # ``pending`` is a list of groups still needing resolution.  Each entry is
-    # either a singleton [team] (already placed) or a multi-team tied group.
-    pending: list[list[str]] = [sorted(bucket)]
+    # either a singleton [team] (already placed) or a multi-team tied group,
+    # always in alphabetical order (``_partition_by`` preserves it).
+    pending: list[list[str]] = [ordered]
 
     def push_coinflip(groups):
         """Append multi-team groups to the coin_flip_collector if present."""
@@ -365,13 +483,33 @@ def resolve_bucket(
     # Steps 1–5: apply each key in sequence.  When a step splits a group, each
     # resulting sub-group restarts from Step 1 via a recursive call; the
     # resolved sub-sequence is broken into singletons so it is not re-processed.
-    for key_builder in [
-        lambda t: -step1[t],
-        lambda t: _key_step2(step2[t]),
-        lambda t: -step3[t],
-        lambda t: _key_step4(step4[t]),
-        lambda t: wl_totals[t]["pa"],
-    ]:
+    # So ``pending`` is either still the whole bucket or, after the first
+    # split, nothing but singletons, and a step's tallies are needed only in
+    # the first case.
+    for step_no, key_builder in enumerate(
+        [
+            lambda t: -step1[t],
+            lambda t: _key_step2(step2[t]),
+            lambda t: -step3[t],
+            lambda t: _key_step4(step4[t]),
+            lambda t: wl_totals[t]["pa"],
+        ][:last_step],
+        start=1,
+    ):
+        if len(pending) > 1:
+            break
+        if step_no == 2 and step2 is None:
+            step2, step4 = step2_step4_arrays(
+                teams, bucket, base_order, completed, remaining, outcome_mask, margins, base_margin_default, vs_index
+            )
+        elif step_no == 3:
+            # Step 3 (capped H2H PD) across the bucket
+            step3 = dict.fromkeys(bucket, 0)
+            for s in bucket:
+                for o in bucket:
+                    if s == o:
+                        continue
+                    step3[s] += h2h_pd_cap.get((s, o), 0)
         next_pending: list[list[str]] = []
         for g in pending:
             if len(g) <= 1:
@@ -401,11 +539,15 @@ def resolve_bucket(
                             base_margin_default,
                             coin_flip_collector,
                             step_trace_collector=step_trace_collector,
+                            h2h_maps=h2h_maps,
+                            last_step=last_step,
+                            vs_index=vs_index,
                         )
                         next_pending.extend([[t] for t in resolved])
         pending = next_pending
 
-    # Step 6: any group that survived all 5 steps unresolved is a coin flip.
+    # Step 6: any group that survived all 5 steps unresolved is a coin flip
+    # (or, with last_step < 5, a group the remaining steps would have to break).
     push_coinflip([g for g in pending if len(g) > 1])
 
     return [t for g in pending for t in g]
@@ -432,7 +574,8 @@ def base_bucket_order(teams, wl_totals):
 
     def key(s):
         """Sort key: (-win_pct, losses, name) so best record sorts first."""
-        w, l, t = wl_totals[s]["w"], wl_totals[s]["l"], wl_totals[s]["t"]
+        rec = wl_totals[s]
+        w, l, t = rec["w"], rec["l"], rec["t"]
         gp = w + l + t
         wp = (w + 0.5 * t) / gp if gp > 0 else 0.0
         return (-wp, l, s)
@@ -454,25 +597,22 @@ def tie_bucket_groups(teams, wl_totals):
         A list of groups (each group is a sorted list of team names that are
         tied with each other), in base seeding order across groups.
     """
-    buckets: dict = defaultdict(list)
+    # Each bucket is emitted once, keyed by its (win%, losses) tuple.  Members
+    # of a bucket share win% and losses, so ordering buckets by the
+    # ``base_bucket_order`` key (-win%, losses) gives the same group order as
+    # walking every team in base order without re-sorting the teams.
+    buckets: dict = {}
     for s in teams:
-        w, l, t = wl_totals[s]["w"], wl_totals[s]["l"], wl_totals[s]["t"]
-        gp = w + l + t
-        wp = (w + 0.5 * t) / gp if gp > 0 else 0.0
-        buckets[(round(wp, 6), l)].append(s)
-    order = base_bucket_order(teams, wl_totals)
-    seen: set = set()
-    out = []
-    for s in order:
-        if s in seen:
-            continue
-        w, l, t = wl_totals[s]["w"], wl_totals[s]["l"], wl_totals[s]["t"]
+        rec = wl_totals[s]
+        w, l, t = rec["w"], rec["l"], rec["t"]
         gp = w + l + t
         wp = (w + 0.5 * t) / gp if gp > 0 else 0.0
-        group = buckets[(round(wp, 6), l)]
-        out.append(sorted(group))
-        seen.update(group)
-    return out
+        key = (round(wp, 6), l)
+        bucket = buckets.get(key)
+        if bucket is None:
+            buckets[key] = bucket = ((-wp, l), [])
+        bucket[1].append(s)
+    return [sorted(group) for _, group in sorted(buckets.values(), key=itemgetter(0))]
 
 
 def resolve_standings_for_mask(
@@ -485,6 +625,10 @@ def resolve_standings_for_mask(
     pa_win=14,
     coin_flip_collector: list[list[str]] | None = None,
     step_trace_collector: dict | None = None,
+    completed_h2h: tuple | None = None,
+    mask_standings: tuple | None = None,
+    vs_index: tuple | None = None,
+    h2h_maps: tuple | None = None,
 ):
     """Resolve the full region seeding order for a single outcome mask.
 
@@ -506,15 +650,32 @@ def resolve_standings_for_mask(
         step_trace_collector: If provided, populated with per-bucket step data
             via ``resolve_bucket``.  Prefer ``resolve_standings_with_trace``
             over passing this directly.
+        completed_h2h: Optional completed-game H2H maps, forwarded to
+            ``build_h2h_maps`` as ``completed_maps``.
+        mask_standings: Optional ``(wl_totals, base_order, tie_buckets)``
+            already computed for this mask and these margins, used instead of
+            rebuilding them from the game lists.
+        vs_index: Optional ``build_vs_index(completed, remaining)`` result,
+            forwarded to ``resolve_bucket``.
+        h2h_maps: Optional H2H maps already built for this mask and these
+            margins (see ``resolve_bucket``); built on first use otherwise.
 
     Returns:
         An ordered list of all team names (seed 1 first through seed N last).
     """
-    wl_totals = standings_from_mask(teams, completed, remaining, outcome_mask, pa_win, margins, base_margin_default)
-    base_order = base_bucket_order(teams, wl_totals)
+    if mask_standings is not None:
+        wl_totals, base_order, tie_buckets = mask_standings
+    else:
+        wl_totals = standings_from_mask(teams, completed, remaining, outcome_mask, pa_win, margins, base_margin_default)
+        base_order = base_bucket_order(teams, wl_totals)
+        tie_buckets = tie_bucket_groups(teams, wl_totals)
     final = []
     coinflip_events: list[list[str]] = [] if coin_flip_collector is None else coin_flip_collector
-    for bucket in tie_bucket_groups(teams, wl_totals):
+    for bucket in tie_buckets:
+        if len(bucket) > 1 and h2h_maps is None:
+            h2h_maps = build_h2h_maps(
+                completed, remaining, outcome_mask, margins, base_margin_default, completed_maps=completed_h2h
+            )
         final.extend(
             resolve_bucket(
                 bucket,
@@ -528,6 +689,8 @@ def resolve_standings_for_mask(
                 base_margin_default,
                 coin_flip_collector=coinflip_events,
                 step_trace_collector=step_trace_collector,
+                h2h_maps=h2h_maps,
+                vs_index=vs_index,
             )
         )
     return final
@@ -584,6 +747,168 @@ def resolve_standings_with_trace(
     return order, step_trace
 
 
+def make_cached_resolver(teams, completed, remaining, base_margin_default=7, pa_win=14, maxsize=1 << 16):
+    """Return a memoized ``resolve(outcome_mask, margins)`` for one region.
+
+    ``teams``, ``completed`` and ``remaining`` are fixed for the lifetime of the
+    resolver, so a resolution depends only on the outcome mask and the margin
+    of each remaining game.  Results are cached on
+    ``(outcome_mask, per-game margin vector)``; margins for pairs that are not
+    remaining games never influence the standings and are ignored.
+
+    Within a mask, only games with a team in a multi-team tie bucket can
+    change the order: every tiebreaker step reads games of the tied teams
+    and nothing else margin-dependent.  The other entries of the margin
+    vector are set to ``base_margin_default`` before the cache lookup, so
+    vectors differing only there share one resolution.
+
+    The same holds per bucket: a tied group's order reads only the games of
+    its own teams, so each multi-team bucket is resolved and cached on
+    ``(outcome_mask, bucket, margins of the bucket's games)``.  A vector that
+    changes one bucket's games re-resolves that bucket alone and reuses the
+    cached order of every other bucket.
+
+    Args:
+        teams: List of all team names in the region.
+        completed: List of CompletedGame instances for finished region games.
+        remaining: List of RemainingGame instances for unplayed region games.
+        base_margin_default: Assumed winning margin when a game's margin is not
+            in ``margins``.
+        pa_win: Points assumed scored against the winner in a remaining game.
+        maxsize: LRU bound on the number of cached resolutions.
+
+    Returns:
+        A callable ``resolve(outcome_mask, margins) -> (order, coin_flips)``
+        where ``order`` is a tuple of team names (seed 1 first) and
+        ``coin_flips`` is a tuple of team-name tuples, one per tied group that
+        needed a coin flip.  Both are tuples so cached values cannot be
+        mutated by callers.
+
+        ``resolve.by_vector(outcome_mask, margin_vector)`` takes the margins as
+        a tuple aligned with ``remaining`` instead, skipping the dict lookups.
+    """
+    pairs = [(rg.a, rg.b) for rg in remaining]
+    completed_h2h = build_h2h_maps(completed, [], 0, {})
+    completed_wl = standings_from_mask(teams, completed, [], 0, pa_win, {})
+    all_games = frozenset(range(len(pairs)))
+    vs_index = build_vs_index(completed, remaining)
+
+    @lru_cache(maxsize=256)
+    def _mask_base(outcome_mask):
+        """Standings for *outcome_mask* with every remaining-game margin at zero.
+
+        W/L/T records, base order and tie buckets do not depend on margins, so
+        they are shared by every margin vector of the mask; only each loser's
+        PA still needs its game margin added.  Likewise the Step 1 H2H points
+        are fixed by the mask, leaving only the Step 3 capped PD of the
+        remaining games per vector.  The points map is built only when some
+        bucket is actually tied.  ``irrelevant`` holds the indices of the
+        games whose margin cannot change the order (see the resolver
+        docstring).  ``bucket_games`` lists, per tie bucket, the indices of
+        the games touching it with the bucket's completed-game capped PD, or
+        ``None`` for a lone team.
+        """
+        wl_totals = standings_from_mask(
+            teams, completed, remaining, outcome_mask, pa_win, {}, 0, completed_totals=completed_wl
+        )
+        results = [(a, b) if (outcome_mask >> i) & 1 else (b, a) for i, (a, b) in enumerate(pairs)]
+        tie_buckets = tie_bucket_groups(teams, wl_totals)
+        bucket_games = [_bucket_games(tuple(bucket)) if len(bucket) > 1 else None for bucket in tie_buckets]
+        relevant = {i for info in bucket_games if info is not None for i in info[0]}
+        irrelevant = all_games.difference(relevant)
+        h2h_points = None
+        if any(len(bucket) > 1 for bucket in tie_buckets):
+            # The completed-game points plus one point per remaining-game
+            # winner: the Step 1 map of ``build_h2h_maps`` without building
+            # the PD maps it would discard.
+            h2h_points = completed_h2h[0].copy()
+            for won in results:
+                h2h_points[won] += 1.0
+        base_order = base_bucket_order(teams, wl_totals)
+        return wl_totals, results, base_order, tie_buckets, bucket_games, h2h_points, irrelevant
+
+    @lru_cache(maxsize=256)
+    def _bucket_games(bucket):
+        """Games touching *bucket* and the completed-game capped PD between its teams.
+
+        Both depend only on which teams are tied, not on the mask, so every
+        mask producing the same bucket shares one entry.
+        """
+        games = tuple(i for i, (a, b) in enumerate(pairs) if a in bucket or b in bucket)
+        return games, {(s, o): completed_h2h[1].get((s, o), 0) for s in bucket for o in bucket if s != o}
+
+    def _resolve(outcome_mask, margin_key):
+        """Resolve one (mask, margin vector), sharing the entry of vectors that differ only in irrelevant games."""
+        irrelevant = _mask_base(outcome_mask)[6]
+        if irrelevant:
+            margin_key = tuple(base_margin_default if i in irrelevant else m for i, m in enumerate(margin_key))
+        return _resolve_relevant(outcome_mask, margin_key)
+
+    @lru_cache(maxsize=maxsize)
+    def _resolve_relevant(outcome_mask, margin_key):
+        """Resolve one (mask, canonical margin vector) and freeze the result."""
+        _, _, _, tie_buckets, bucket_games, _, _ = _mask_base(outcome_mask)
+        order: list[str] = []
+        flips: list[tuple[str, ...]] = []
+        for bucket_idx, (bucket, games) in enumerate(zip(tie_buckets, bucket_games)):
+            if games is None:
+                order.extend(bucket)
+                continue
+            bucket_order, bucket_flips = _resolve_bucket(
+                outcome_mask, bucket_idx, tuple(margin_key[i] for i in games[0])
+            )
+            order.extend(bucket_order)
+            flips.extend(bucket_flips)
+        return tuple(order), tuple(flips)
+
+    @lru_cache(maxsize=maxsize)
+    def _resolve_bucket(outcome_mask, bucket_idx, bucket_margins):
+        """Order one multi-team tie bucket given the margins of its own games."""
+        base_wl, results, base_order, tie_buckets, bucket_games, h2h_points, _ = _mask_base(outcome_mask)
+        bucket = tie_buckets[bucket_idx]
+        games, completed_pd = bucket_games[bucket_idx]
+        margins = {pairs[i]: m for i, m in zip(games, bucket_margins)}
+        # Nothing downstream mutates the standings, so teams outside the
+        # bucket keep the mask's record dicts; only bucket teams that lost a
+        # remaining game get a fresh record carrying their margin-dependent
+        # PA.  Likewise only the capped PD between bucket teams is read.
+        wl_totals = dict(base_wl)
+        capped_pd_map = completed_pd.copy()
+        for i, m in zip(games, bucket_margins):
+            winner, loser = results[i]
+            if loser in bucket:
+                wl_totals[loser] = {**wl_totals[loser], "pa": wl_totals[loser]["pa"] + m}
+            if (winner, loser) in capped_pd_map:
+                m = min(m, 12)
+                capped_pd_map[(winner, loser)] += m
+                capped_pd_map[(loser, winner)] -= m
+        flips: list[list[str]] = []
+        bucket_order = resolve_bucket(
+            bucket,
+            teams,
+            wl_totals,
+            base_order,
+            completed,
+            remaining,
+            outcome_mask,
+            margins,
+            base_margin_default,
+            coin_flip_collector=flips,
+            h2h_maps=(h2h_points, capped_pd_map, None),
+            vs_index=vs_index,
+        )
+        return tuple(bucket_order), tuple(tuple(group) for group in flips)
+
+    def resolve(outcome_mask, margins):
+        """Return ``(order, coin_flips)`` for *outcome_mask* under *margins*."""
+        return _resolve(outcome_mask, tuple(margins.get(pair, base_margin_default) for pair in pairs))
+
+    resolve.by_vector = _resolve
+    resolve.cache_info = _resolve_relevant.cache_info
+    resolve.bucket_cache_info = _resolve_bucket.cache_info
+    return resolve
+
+
 def rank_to_slots(order) -> dict[str, tuple[int, int]]:
     """Convert a strict seeding order into (lo, hi) seed slot pairs.
 
@@ -627,7 +952,9 @@ def unique_intra_bucket_games(buckets, remaining):
     return out
 
 
-def sensitive_boundary_games(buckets, remaining, intra_games, teams, completed, outcome_mask, base_margins, pa_win):
+def sensitive_boundary_games(
+    buckets, remaining, intra_games, teams, completed, outcome_mask, base_margins, pa_win, resolver=None
+):
     """Return remaining boundary games whose margin affects any bucket tiebreaker.
 
     A *boundary game* is a remaining game where exactly one team is in a
@@ -650,6 +977,9 @@ def sensitive_boundary_games(buckets, remaining, intra_games, teams, completed,
         outcome_mask: The binary outcome mask for this scenario.
         base_margins: Base margins dict keyed by ``(team_a, team_b)``.
         pa_win: Points-advantage awarded to the winner.
+        resolver: Optional memoized resolver from ``make_cached_resolver``
+            for the same region; probes are served from (and added to) its
+            cache instead of being recomputed.
 
     Returns:
         List of additional RemainingGame instances (boundary games) whose
@@ -678,6 +1008,10 @@ def sensitive_boundary_games(buckets, remaining, intra_games, teams, completed,
         margins_lo[key] = 1
         margins_hi = dict(capped_margins)
         margins_hi[key] = 12
+        if resolver is not None:
+            if resolver(outcome_mask, margins_lo)[0] != resolver(outcome_mask, margins_hi)[0]:
+                result.append(rg)
+            continue
         order_lo = resolve_standings_for_mask(
             teams,
             completed,
@@ -708,6 +1042,105 @@ def sensitive_boundary_games(buckets, remaining, intra_games, teams, completed,
 # -------------------------
 
 
+def results_across_margin_range(resolve_at, lo=1, hi=12):
+    """Return ``resolve_at(m)`` for every margin ``m`` in ``[lo, hi]``.
+
+    Each tiebreaker comparison is linear in a single game's margin, so when
+    both ends of an interval resolve to the same result, every margin between
+    them does too and is filled in without being resolved.  Intervals whose
+    ends disagree are bisected until each change point is isolated, which
+    costs about ``2 + 2k·log2(hi - lo)`` resolutions for ``k`` change points
+    instead of one per margin.
+
+    Args:
+        resolve_at: Callable mapping a margin to a comparable, hashable result.
+        lo: Smallest margin to consider.
+        hi: Largest margin to consider.
+
+    Returns:
+        A list of ``hi - lo + 1`` results, the first for margin *lo*.
+    """
+    seen: dict[int, object] = {}
+
+    def result_at(m):
+        """Resolve (once) the result at margin *m*."""
+        if m not in seen:
+            seen[m] = resolve_at(m)
+        return seen[m]
+
+    def bisect(a, b):
+        """Fill the interior of ``[a, b]``, probing only where the ends differ."""
+        if result_at(a) == result_at(b):
+            for m in range(a + 1, b):
+                seen[m] = seen[a]
+            return
+        if b - a <= 1:
+            return
+        mid = (a + b) // 2
+        bisect(a, mid)
+        bisect(mid, b)
+
+    bisect(lo, hi)
+    return [seen[m] for m in range(lo, hi + 1)]
+
+
+def _orders_across_margin_range(resolve_at, lo=1, hi=12):
+    """Return every distinct seeding produced as one game's margin runs over ``[lo, hi]``.
+
+    Probes only the margins ``results_across_margin_range`` needs, so ``k``
+    change points cost about ``2 + 2k·log2(hi - lo)`` resolutions.
+
+    Args:
+        resolve_at: Callable mapping a margin to the resulting seeding list.
+        lo: Smallest margin to consider.
+        hi: Largest margin to consider.
+
+    Returns:
+        A set of seeding tuples, one per distinct ordering across the range.
+    """
+    return set(results_across_margin_range(lambda m: tuple(resolve_at(m)), lo, hi))
+
+
+def teams_tied_after_margin_free_steps(teams, completed, remaining, outcome_mask, margins, wl_totals, buckets):
+    """Return the teams left in a tied group once Steps 1-2 have been applied.
+
+    Steps 1 (H2H record) and 2 (record vs outside teams) never read a margin,
+    so the split structure they produce is the same for every margin.  Only
+    teams still tied afterwards reach the margin-dependent Steps 3-5.
+
+    Args:
+        teams: List of all team names in the region.
+        completed: List of CompletedGame instances for finished region games.
+        remaining: List of RemainingGame instances for unplayed region games.
+        outcome_mask: Bitmask where bit i=1 means remaining[i].a wins.
+        margins: Margins dict used for the (margin-free) step evaluation.
+        wl_totals: Per-team W/L/T/PA totals for *outcome_mask*.
+        buckets: Tie bucket groups for *outcome_mask*.
+
+    Returns:
+        The set of team names in a group that Steps 1-2 leave tied.
+    """
+    base_order = base_bucket_order(teams, wl_totals)
+    h2h_maps = build_h2h_maps(completed, remaining, outcome_mask, margins)
+    still_tied: list[list[str]] = []
+    for bucket in buckets:
+        if len(bucket) > 1:
+            resolve_bucket(
+                bucket,
+                teams,
+                wl_totals,
+                base_order,
+                completed,
+                remaining,
+                outcome_mask,
+                margins,
+                coin_flip_collector=still_tied,
+                h2h_maps=h2h_maps,
+                last_step=2,
+            )
+    return {t for group in still_tied for t in group}
+
+
 def resolve_with_results(
     teams: list,
     completed: list,
@@ -776,19 +1209,31 @@ def resolve_with_results(
     wl_totals = standings_from_mask(teams, completed, remaining, outcome_mask, pa_win=14, margins=norm_margins)
     buckets = tie_bucket_groups(teams, wl_totals)
     intra = unique_intra_bucket_games(buckets, remaining)
+    # Steps 1-2 ignore margins.  Groups still tied after them (at any recursion
+    # level) are the only ones a margin can reorder; computed lazily, once.
+    margin_tied: set[str] | None = None
 
     for rem_game in intra:
         key = (rem_game.a, rem_game.b)
         if key in norm_margins:
             continue
+        if margin_tied is None:
+            margin_tied = teams_tied_after_margin_free_steps(
+                teams, completed, remaining, outcome_mask, norm_margins, wl_totals, buckets
+            )
+        # A game's margin only enters the keys of its own two teams, so if both
+        # are already placed by Steps 1-2 no margin can change the seeding.
+        if rem_game.a not in margin_tied and rem_game.b not in margin_tied:
+            continue
         # Test margins 1–12 to see whether the seeding would change
-        seedings_by_margin = {
-            m: resolve_standings_for_mask(teams, completed, remaining, outcome_mask, {**norm_margins, key: m})
-            for m in range(1, 13)
-        }
-        if len({tuple(s) for s in seedings_by_margin.values()}) > 1:
+        seedings = _orders_across_margin_range(
+            lambda m, key=key: resolve_standings_for_mask(
+                teams, completed, remaining, outcome_mask, {**norm_margins, key: m}
+            )
+        )
+        if len(seedings) > 1:
             all_positions: dict[str, set] = {t: set() for t in teams}
-            for s in seedings_by_margin.values():
+            for s in seedings:
                 for idx, name in enumerate(s):
                     all_positions[name].add(idx + 1)
             affected = sorted(t for t, pos in all_positions.items() if len(pos) > 1)
@@ -6,6 +6,7 @@ and ``determine_odds()`` from ``scenarios.py``, and writes results to the
 """
 
 import bisect
+import os
 from dataclasses import dataclass as _dataclass
 from datetime import date
 from typing import TypeVar
@@ -37,8 +38,9 @@ from backend.helpers.data_classes import (
 from backend.helpers.data_helpers import get_completed_games
 from backend.helpers.database_helpers import get_database_connection
 from backend.helpers.insights import extract_insights, serialize_insights
+from backend.helpers.scenario_engine import determine_scenarios_external
 from backend.helpers.scenario_serializers import (
-    serialize_complete_scenarios,
+    dumps_complete_scenarios,
     serialize_remaining_games,
     serialize_scenario_atoms,
 )
@@ -113,16 +115,90 @@ class RegionSeedingData:
 # -------------------------
 
 
+def _select_region_teams(cur, clazz: int, region: int, season: int) -> list[str]:
+    """Run the region-teams query on an open cursor (see ``fetch_region_teams``)."""
+    cur.execute(
+        "SELECT school FROM school_seasons WHERE class=%s AND region=%s AND season=%s AND is_active=TRUE ORDER BY school",
+        (clazz, region, season),
+    )
+    return [r[0] for r in cur.fetchall()]
+
+
+def _select_completed_pairs(cur, teams: list[str], season: int, cutoff_date: date | None) -> list[RawCompletedGame]:
+    """Run the completed-region-games query on an open cursor (see ``fetch_completed_pairs``)."""
+    base_query = (
+        "SELECT school, opponent, date, result, points_for, points_against "
+        "FROM games_effective "
+        "WHERE season=%s AND final=TRUE AND region_game=TRUE"
+    )
+    if cutoff_date is not None:
+        base_query += " AND date <= %s"
+        params: tuple = (season, cutoff_date, teams, teams)
+    else:
+        params = (season, teams, teams)
+    base_query += " AND school = ANY(%s) AND opponent = ANY(%s)"
+    cur.execute(base_query, params)
+    return [
+        {
+            "school": s,
+            "opponent": o,
+            "date": d,
+            "result": r,
+            "points_for": pf,
+            "points_against": pa,
+        }
+        for (s, o, d, r, pf, pa) in cur.fetchall()
+    ]
+
+
+def _select_remaining_pairs(cur, teams: list[str], season: int, cutoff_date: date | None) -> list[RemainingGame]:
+    """Run the remaining-region-games query on an open cursor (see ``fetch_remaining_pairs``)."""
+    if cutoff_date is not None:
+        date_filter = "date > %s AND region_game=TRUE"
+        params: tuple = (season, cutoff_date, teams, teams)
+    else:
+        date_filter = "final=FALSE AND region_game=TRUE"
+        params = (season, teams, teams)
+
+    base_query = (
+        "WITH cand AS ("
+        "  SELECT"
+        "    LEAST(school, opponent) AS a,"
+        "    GREATEST(school, opponent) AS b,"
+        "    CASE"
+        "      WHEN school < opponent THEN location"
+        "      WHEN school > opponent THEN"
+        "        CASE location"
+        "          WHEN 'home' THEN 'away'"
+        "          WHEN 'away' THEN 'home'"
+        "          ELSE 'neutral'"
+        "        END"
+        "      ELSE 'neutral'"
+        "    END AS location_a"
+        "  FROM games_effective"
+        "  WHERE season=%s AND " + date_filter + "    AND school = ANY(%s) AND opponent = ANY(%s)"
+        ") SELECT DISTINCT ON (a, b) a, b, location_a FROM cand"
+    )
+    cur.execute(base_query, params)
+    return [RemainingGame(a, b, loc) for a, b, loc in cur.fetchall()]
+
+
+def _completed_from_raw(raw_results: list[RawCompletedGame]) -> list[CompletedGame]:
+    """Log the fetched completed-game rows and normalize them into ``CompletedGame`` pairs."""
+    logger = get_run_logger()
+    logger.info(f"Fetched rows for completed region games: {raw_results}")
+
+    completed = get_completed_games(raw_results)
+    logger.info(f"Completed Games: {completed}")
+    return completed
+
+
 @task(retries=2, retry_delay_seconds=10, task_run_name="Fetch {season} Region Teams for {region}-{clazz}A")
 def fetch_region_teams(clazz: int, region: int, season: int) -> list[str]:
     """Fetch alphabetically sorted school names for a given class/region/season."""
     with get_database_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                "SELECT school FROM school_seasons WHERE class=%s AND region=%s AND season=%s AND is_active=TRUE ORDER BY school",
-                (clazz, region, season),
-            )
-            return [r[0] for r in cur.fetchall()]
+            return _select_region_teams(cur, clazz, region, season)
 
 
 @task(retries=2, retry_delay_seconds=10, task_run_name="Fetch {season} All Season Games for Win Probability")
@@ -408,40 +484,10 @@ def fetch_completed_pairs(teams: list[str], season: int, cutoff_date: date | Non
         cutoff_date: When provided, only games on or before this date are returned.
                      Used by the historical backfill flow to reconstruct past state.
     """
-    base_query = (
-        "SELECT school, opponent, date, result, points_for, points_against "
-        "FROM games_effective "
-        "WHERE season=%s AND final=TRUE AND region_game=TRUE"
-    )
-    if cutoff_date is not None:
-        base_query += " AND date <= %s"
-        params: tuple = (season, cutoff_date, teams, teams)
-    else:
-        params = (season, teams, teams)
-    base_query += " AND school = ANY(%s) AND opponent = ANY(%s)"
     with get_database_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(base_query, params)
-            rows = cur.fetchall()
-
-    raw_results: list[RawCompletedGame] = [
-        {
-            "school": s,
-            "opponent": o,
-            "date": d,
-            "result": r,
-            "points_for": pf,
-            "points_against": pa,
-        }
-        for (s, o, d, r, pf, pa) in rows
-    ]
-
-    logger = get_run_logger()
-    logger.info(f"Fetched rows for completed region games: {raw_results}")
-
-    completed = get_completed_games(raw_results)
-    logger.info(f"Completed Games: {completed}")
-    return completed
+            raw_results = _select_completed_pairs(cur, teams, season, cutoff_date)
+    return _completed_from_raw(raw_results)
 
 
 @task(retries=2, retry_delay_seconds=10, task_run_name="Fetch {season} Remaining Region Games for {teams}")
@@ -456,36 +502,38 @@ def fetch_remaining_pairs(teams: list[str], season: int, cutoff_date: date | Non
                      remaining (historical reconstruction mode). Without it,
                      fetches games currently marked final=FALSE.
     """
-    if cutoff_date is not None:
-        date_filter = "date > %s AND region_game=TRUE"
-        params: tuple = (season, cutoff_date, teams, teams)
-    else:
-        date_filter = "final=FALSE AND region_game=TRUE"
-        params = (season, teams, teams)
+    with get_database_connection() as conn:
+        with conn.cursor() as cur:
+            return _select_remaining_pairs(cur, teams, season, cutoff_date)
 
-    base_query = (
-        "WITH cand AS ("
-        "  SELECT"
-        "    LEAST(school, opponent) AS a,"
-        "    GREATEST(school, opponent) AS b,"
-        "    CASE"
-        "      WHEN school < opponent THEN location"
-        "      WHEN school > opponent THEN"
-        "        CASE location"
-        "          WHEN 'home' THEN 'away'"
-        "          WHEN 'away' THEN 'home'"
-        "          ELSE 'neutral'"
-        "        END"
-        "      ELSE 'neutral'"
-        "    END AS location_a"
-        "  FROM games_effective"
-        "  WHERE season=%s AND " + date_filter + "    AND school = ANY(%s) AND opponent = ANY(%s)"
-        ") SELECT DISTINCT ON (a, b) a, b, location_a FROM cand"
-    )
+
+@task(retries=2, retry_delay_seconds=10, task_run_name="Fetch {season} Region Games for {region}-{clazz}A")
+def fetch_region_games(
+    clazz: int, region: int, season: int, cutoff_date: date | None = None
+) -> tuple[list[str], list[CompletedGame], list[RemainingGame]]:
+    """Fetch a region's teams, completed games and remaining games over one connection.
+
+    Same results as ``fetch_region_teams``, ``fetch_completed_pairs`` and
+    ``fetch_remaining_pairs`` in turn, but the three queries share a single
+    connection and cursor instead of each opening its own, which matters
+    when every region of a class is fetched back to back.  The game queries
+    are skipped when the region has no teams.
+
+    Args:
+        cutoff_date: Forwarded to the completed/remaining game queries (see
+                     ``fetch_completed_pairs`` and ``fetch_remaining_pairs``).
+
+    Returns:
+        ``(teams, completed, remaining)``.
+    """
     with get_database_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(base_query, params)
-            return [RemainingGame(a, b, loc) for a, b, loc in cur.fetchall()]
+            teams = _select_region_teams(cur, clazz, region, season)
+            if not teams:
+                return teams, [], []
+            raw_results = _select_completed_pairs(cur, teams, season, cutoff_date)
+            remaining = _select_remaining_pairs(cur, teams, season, cutoff_date)
+    return teams, _completed_from_raw(raw_results), remaining
 
 
 @task(retries=2, retry_delay_seconds=10, task_run_name="Fetch {season} Region Standings for {region}-{clazz}A")
@@ -810,7 +858,8 @@ def write_region_scenarios(
 
     remaining_json = Json(serialize_remaining_games(remaining))
     atoms_json = Json(serialize_scenario_atoms(scenario_atoms))
-    scenarios_json = Json(serialize_complete_scenarios(complete_scenarios))
+    # Encoded one scenario at a time rather than via a serialized copy of the list.
+    scenarios_json = Json(complete_scenarios, dumps=dumps_complete_scenarios)
     insights_json = Json(serialize_insights(key_insights or []))
 
     scenarios_sql = """
@@ -867,6 +916,14 @@ _R_ALWAYS_MARGIN = 5  # R ≤ this: always full margin, synchronous
 _R_MAX_COMPUTE = 15  # R > this: Monte Carlo odds, skip scenario enumeration entirely
 # R > _R_ALWAYS_MARGIN and R ≤ _R_MAX_COMPUTE: win/loss enumeration, no margin
 
+# Worker processes for the per-region enumeration (``max_workers``); set per
+# deployment to the cores the Prefect worker may use.  1 keeps it in-process.
+_SCENARIO_MAX_WORKERS = int(os.getenv("SCENARIO_MAX_WORKERS", "1"))
+# Interpreter for the seeding-odds enumeration (e.g. ``pypy3``); unset runs it
+# in this process.  Deployment config only: it names an executable the worker
+# runs, so it is never taken from a flow-run parameter.
+_SCENARIO_PYTHON = os.getenv("SCENARIO_PYTHON") or None
+
 
 @task(retries=2, retry_delay_seconds=10, task_run_name="Seeding Odds {season} {region}-{clazz}A")
 def get_region_seeding_odds(
@@ -883,7 +940,9 @@ def get_region_seeding_odds(
     Fetches all game data for the region, runs ``determine_scenarios``, and
     converts raw counts to ``StandingsOdds`` probabilities.  Results are
     returned as a ``RegionSeedingData`` bundle for consumption by
-    ``get_region_finish_scenarios`` in Phase 2.
+    ``get_region_finish_scenarios`` in Phase 2.  When the ``SCENARIO_PYTHON``
+    environment variable names an interpreter, the enumeration runs under it
+    through ``determine_scenarios_external``.
 
     Args:
         clazz:         MHSAA classification (1–7).
@@ -903,11 +962,9 @@ def get_region_seeding_odds(
         A ``RegionSeedingData`` containing unweighted and weighted seeding
         odds, coinflip teams, and the fetched game lists.
     """
-    teams = fetch_region_teams.fn(clazz, region, season)
+    teams, completed, remaining = fetch_region_games.fn(clazz, region, season, cutoff_date=cutoff_date)
     if not teams:
         raise SystemExit("No teams found.")
-    completed = fetch_completed_pairs.fn(teams, season, cutoff_date=cutoff_date)
-    remaining = fetch_remaining_pairs.fn(teams, season, cutoff_date=cutoff_date)
 
     win_prob_fn: WinProbFn | None = None
     if elo_ratings is not None:
@@ -915,14 +972,29 @@ def get_region_seeding_odds(
 
     R = len(remaining)
     use_sampling = R > _R_MAX_COMPUTE
-    r = determine_scenarios(
-        teams,
-        completed,
-        remaining,
-        win_prob_fn=win_prob_fn,
-        ignore_margins=use_sampling or (R > _R_ALWAYS_MARGIN),
-        n_samples=50_000 if use_sampling else None,
-    )
+    ignore_margins = use_sampling or (R > _R_ALWAYS_MARGIN)
+    n_samples = 50_000 if use_sampling else None
+    if _SCENARIO_PYTHON:
+        r = determine_scenarios_external(
+            _SCENARIO_PYTHON,
+            teams,
+            completed,
+            remaining,
+            win_prob_fn=win_prob_fn,
+            ignore_margins=ignore_margins,
+            n_samples=n_samples,
+            max_workers=_SCENARIO_MAX_WORKERS,
+        )
+    else:
+        r = determine_scenarios(
+            teams,
+            completed,
+            remaining,
+            win_prob_fn=win_prob_fn,
+            ignore_margins=ignore_margins,
+            n_samples=n_samples,
+            max_workers=_SCENARIO_MAX_WORKERS,
+        )
 
     odds = determine_odds(teams, r.first_counts, r.second_counts, r.third_counts, r.fourth_counts, r.denom)
     odds_weighted = determine_odds(
@@ -1157,7 +1229,7 @@ def get_region_finish_scenarios(
 
     if R <= _R_ALWAYS_MARGIN:
         # Full margin-sensitive computation synchronously.
-        precomputed = enumerate_outcomes(teams, completed, remaining)
+        precomputed = enumerate_outcomes(teams, completed, remaining, max_workers=_SCENARIO_MAX_WORKERS)
         scenario_atoms = build_scenario_atoms(teams, completed, remaining, precomputed=precomputed)
         complete_scenarios = enumerate_division_scenarios(
             teams, completed, remaining, scenario_atoms=scenario_atoms, precomputed=precomputed
@@ -1195,7 +1267,9 @@ def get_region_finish_scenarios(
         return {}
     else:
         # R > _R_ALWAYS_MARGIN and R ≤ _R_MAX_COMPUTE: win/loss-only, no margin.
-        precomputed_wl = enumerate_outcomes(teams, completed, remaining, ignore_margins=True)
+        precomputed_wl = enumerate_outcomes(
+            teams, completed, remaining, ignore_margins=True, max_workers=_SCENARIO_MAX_WORKERS
+        )
         scenario_atoms = build_scenario_atoms(teams, completed, remaining, precomputed=precomputed_wl)
         complete_scenarios = enumerate_division_scenarios(
             teams, completed, remaining, scenario_atoms=scenario_atoms, precomputed=precomputed_wl
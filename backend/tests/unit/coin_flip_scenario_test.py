@@ -15,7 +15,7 @@ This fixture exercises:
   Step 3b in build_scenario_atoms (scenario_viewer.py)
   "coinflip" branch of enumerate_division_scenarios (scenario_viewer.py)
   CoinFlipResult dispatch in _render_condition (scenario_renderer.py)
-  _accumulate_slots with flip_groups (scenarios.py lines 105–134)
+  _SeedTally.accumulate with flip_groups (scenarios.py)
 """
 
 import pytest
@@ -274,7 +274,7 @@ class TestEnumerateDivisionScenariosCoinFlip:
 
 
 # ---------------------------------------------------------------------------
-# Integration tests: determine_scenarios (_accumulate_slots with flip_groups)
+# Integration tests: determine_scenarios (_SeedTally.accumulate with flip_groups)
 # ---------------------------------------------------------------------------
 
 
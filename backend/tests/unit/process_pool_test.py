@@ -0,0 +1,18 @@
+"""Unit tests for process_pool.py."""
+
+from backend.helpers.process_pool import map_chunks, split_range
+
+
+def test_split_range_covers_range_contiguously():
+    """Spans tile ``range(total)`` in order, longer spans first."""
+    assert split_range(10, 3) == [(0, 4), (4, 7), (7, 10)]
+
+
+def test_split_range_caps_chunks_at_total():
+    """No span is empty when more chunks are asked for than there are items."""
+    assert split_range(2, 8) == [(0, 1), (1, 2)]
+
+
+def test_map_chunks_yields_results_in_chunk_order():
+    """Shared arguments lead each call and results come back in chunk order."""
+    assert list(map_chunks(pow, (2,), [(3,), (5,), (1,)], max_workers=2)) == [8, 32, 2]
@@ -0,0 +1,79 @@
+"""Unit tests for scenario_engine.py.
+
+The child interpreter is the one running the tests, so these exercise the
+pickle round trip and the win-probability table rather than PyPy itself.
+"""
+
+import sys
+
+import pytest
+
+from backend.helpers.scenario_engine import _TableWinProb, determine_scenarios_external
+from backend.helpers.scenarios import determine_scenarios
+from backend.tests.data.standings_2025_3_7a import (
+    expected_3_7a_completed_games,
+    expected_3_7a_remaining_games,
+    teams_3_7a,
+)
+
+
+def _team_a_favored(team_a, team_b, date_str=None, location_a=None):
+    """Give team_a a 70% chance, so weighted odds differ from equal odds."""
+    return 0.7
+
+
+def test_external_engine_matches_in_process_results():
+    """A child interpreter returns the same ScenarioResults as an in-process call."""
+    expected = determine_scenarios(
+        teams_3_7a, expected_3_7a_completed_games, expected_3_7a_remaining_games, win_prob_fn=_team_a_favored
+    )
+    result = determine_scenarios_external(
+        sys.executable,
+        teams_3_7a,
+        expected_3_7a_completed_games,
+        expected_3_7a_remaining_games,
+        win_prob_fn=_team_a_favored,
+    )
+    assert result == expected
+
+
+def test_external_engine_forwards_options():
+    """Keyword options reach determine_scenarios in the child."""
+    expected = determine_scenarios(
+        teams_3_7a, expected_3_7a_completed_games, expected_3_7a_remaining_games, ignore_margins=True
+    )
+    result = determine_scenarios_external(
+        sys.executable, teams_3_7a, expected_3_7a_completed_games, expected_3_7a_remaining_games, ignore_margins=True
+    )
+    assert result == expected
+
+
+def test_external_engine_reports_child_errors():
+    """A failing child raises RuntimeError carrying its stderr."""
+    with pytest.raises(RuntimeError, match="unexpected keyword argument"):
+        determine_scenarios_external(
+            sys.executable,
+            teams_3_7a,
+            expected_3_7a_completed_games,
+            expected_3_7a_remaining_games,
+            no_such_option=True,
+        )
+
+
+def test_external_engine_ignores_child_stdout(tmp_path):
+    """Output the child prints does not reach the returned results."""
+    noisy = tmp_path / "noisy-python"
+    noisy.write_text(f'#!/bin/sh\necho "stray output"\nexec "{sys.executable}" "$@"\n')
+    noisy.chmod(0o755)
+    expected = determine_scenarios(teams_3_7a, expected_3_7a_completed_games, expected_3_7a_remaining_games)
+    result = determine_scenarios_external(
+        str(noisy), teams_3_7a, expected_3_7a_completed_games, expected_3_7a_remaining_games
+    )
+    assert result == expected
+
+
+def test_table_win_prob_looks_up_by_game_and_location():
+    """The table answers by (team_a, team_b, location_a) and ignores the date."""
+    table = _TableWinProb({("A", "B", None): 0.25, ("A", "B", "home"): 0.6})
+    assert table("A", "B") == 0.25
+    assert table("A", "B", "2025-10-01", "home") == 0.6
@@ -1,5 +1,7 @@
 """Tests for scenario_serializers: round-trip fidelity for all serialization functions."""
 
+import json
+
 from backend.helpers.data_classes import (
     GameResult,
     HomeGameCondition,
@@ -15,6 +17,7 @@ from backend.helpers.scenario_serializers import (
     deserialize_home_game_scenario,
     deserialize_remaining_games,
     deserialize_scenario_atoms,
+    dumps_complete_scenarios,
     serialize_atom,
     serialize_complete_scenarios,
     serialize_condition,
@@ -426,6 +429,19 @@ def test_render_scenarios_from_deserialized_matches_direct():
     assert direct_text == roundtrip_text
 
 
+def test_dumps_complete_scenarios_matches_serialized_list():
+    """dumps_complete_scenarios() decodes to serialize_complete_scenarios() output."""
+    complete_scenarios = enumerate_division_scenarios(
+        teams_3_7a,
+        expected_3_7a_completed_games,
+        expected_3_7a_remaining_games,
+        scenario_atoms=expected_3_7a_scenarios,
+    )
+
+    assert json.loads(dumps_complete_scenarios(complete_scenarios)) == serialize_complete_scenarios(complete_scenarios)
+    assert dumps_complete_scenarios([]) == "[]"
+
+
 def test_scenario_atoms_from_deserialized_matches_original():
     """scenario_atoms round-trips preserve equality of all conditions."""
     atoms = expected_3_7a_scenarios
@@ -21,9 +21,11 @@ from backend.helpers.scenario_viewer import (
     _find_combined_atom,
     _find_tiebreaker_groups,
     _format_team_list,
+    _may_pair,
     _minimize_game_winner_atom,
     _simplify_atom_list,
     _split_non_rectangular_atom,
+    _valid_merge_groups,
     build_pre_playoff_home_scenarios,
     build_scenario_atoms,
     compute_odds_from_precomputed,
@@ -1061,6 +1063,31 @@ def test_precomputed_non_sensitive_masks_nonempty():
     assert len(_PRECOMPUTED.non_sensitive_masks) > 0
 
 
+def test_enumerate_outcomes_max_workers_matches_serial():
+    """Chunked process-pool enumeration reproduces the single-process result exactly."""
+    parallel = enumerate_outcomes(_4_4A_TEAMS, _4_4A_COMPLETED, _4_4A_REMAINING, max_workers=2)
+    assert list(parallel.groups.items()) == list(_PRECOMPUTED.groups.items())
+    assert parallel.non_sensitive_masks == _PRECOMPUTED.non_sensitive_masks
+    assert parallel.coin_flips == _PRECOMPUTED.coin_flips
+    assert parallel.margin_tiebreaker_masks == _PRECOMPUTED.margin_tiebreaker_masks
+
+
+def test_enumerate_outcomes_sensitive_margins_match_direct_resolution():
+    """Margin vectors sharing a resolution are grouped under the seeding a direct resolve gives."""
+    pairs = _PRECOMPUTED.pairs
+    checked = 0
+    for (mask, order), margin_list in _PRECOMPUTED.groups.items():
+        if mask in _PRECOMPUTED.non_sensitive_masks:
+            continue
+        for margin_combo in margin_list[::97]:
+            direct = resolve_standings_for_mask(
+                _4_4A_TEAMS, _4_4A_COMPLETED, _4_4A_REMAINING, mask, dict(zip(pairs, margin_combo))
+            )
+            assert tuple(direct) == order, f"mask {mask} margins {margin_combo}"
+            checked += 1
+    assert checked > 0
+
+
 def test_precomputed_r_and_pairs():
     """enumerate_outcomes metadata matches remaining game structure."""
     assert _PRECOMPUTED.R == 4
@@ -1519,6 +1546,30 @@ class TestSimplifyAtomListRule4Guards:
         assert len(result) == 2
 
 
+class TestMayPairWinnerMask:
+    """Rules 3/4 are only tried on atoms whose winners differ in exactly one game."""
+
+    def test_requires_one_flipped_winner(self):
+        """Same pairs and two differing conditions still need a single winner-mask bit apart."""
+        assert _may_pair((0b11, 0b0011, 0b01), (0b11, 0b1100, 0b00), 2)
+        assert not _may_pair((0b11, 0b0011, 0b01), (0b11, 0b1100, 0b01), 2)
+        assert not _may_pair((0b11, 0b0011, 0b11), (0b11, 0b1100, 0b00), 2)
+
+    def test_rule3_still_lifts_across_a_flipped_winner(self):
+        """A beats B / B beats A with G beating H by 1+ and 5+: the second atom lifts to G by 5+."""
+        atom1 = [GameResult("A", "B", 1, None), GameResult("G", "H", 1, None)]
+        atom2 = [GameResult("B", "A", 1, None), GameResult("G", "H", 5, None)]
+
+        assert _simplify_atom_list([atom1, atom2]) == [atom1, [GameResult("G", "H", 5, None)]]
+
+    def test_same_winners_are_left_alone(self):
+        """Two atoms differing only in margins (no flipped winner) match neither Rule 3 nor Rule 4."""
+        atom1 = [GameResult("A", "B", 1, 5), GameResult("G", "H", 1, None)]
+        atom2 = [GameResult("A", "B", 5, None), GameResult("G", "H", 5, None)]
+
+        assert _simplify_atom_list([atom1, atom2]) == [atom1, atom2]
+
+
 # ---------------------------------------------------------------------------
 # Coin flip under margin-sensitive mask (lines 1132, 1299, 1528)
 #
@@ -2802,3 +2853,26 @@ class TestFindTiebreakerGroups:
         runs off the end of the list without converging and no group is formed."""
         groups = _find_tiebreaker_groups(["A", "B", "C"], ["A", "B", "D"])
         assert groups == []
+
+
+class TestValidMergeGroups:
+    """_valid_merge_groups partitions masks into maximal aligned hypercubes."""
+
+    def test_full_cube_is_one_group(self):
+        """All 8 masks over 3 games collapse into a single prime implicant."""
+        assert _valid_merge_groups(list(range(8))) == [list(range(8))]
+
+    def test_single_bit_neighbours_merge(self):
+        """Masks differing in one bit merge; an isolated mask stays on its own."""
+        assert _valid_merge_groups([0b000, 0b001, 0b110]) == [[0b000, 0b001], [0b110]]
+
+    def test_groups_partition_input(self):
+        """Every input mask lands in exactly one group and each group is an aligned cube."""
+        masks = [0, 1, 2, 3, 5, 7, 8, 12, 13, 15]
+        groups = _valid_merge_groups(masks)
+        assert sorted(m for g in groups for m in g) == sorted(masks)
+        for g in groups:
+            free = 0
+            for m in g:
+                free |= m ^ g[0]
+            assert len(g) == 1 << bin(free).count("1")
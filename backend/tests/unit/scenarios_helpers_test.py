@@ -4,17 +4,23 @@ These tests require no game data — they exercise formatting utilities
 and playoff probability calculators directly.
 """
 
+import random
+
 import pytest
 
-from backend.helpers.data_classes import BracketOdds, StandingsOdds
+from backend.helpers.data_classes import BracketOdds, CompletedGame, RemainingGame, StandingsOdds
+from backend.helpers.process_pool import split_range
 from backend.helpers.scenarios import (
+    _mask_weights,
     compute_bracket_odds,
     compute_first_round_home_odds,
     determine_scenarios,
     pct_str,
 )
 from backend.tests.data.standings_2025_3_7a import (
+    expected_3_7a_completed_games,
     expected_3_7a_completed_games_full,
+    expected_3_7a_remaining_games,
     expected_3_7a_remaining_games_full,
     teams_3_7a,
 )
@@ -285,7 +291,7 @@ class TestDetermineScenariosMonteCarlo:
                 games.append(RemainingGame(a=a, b=b))
         return games
 
-    def _run(self, n_samples: int = 2_000):
+    def _run(self, n_samples: int = 2_000, max_workers: int | None = None):
         """Run determine_scenarios with all remaining games and return the result."""
         remaining = self._make_remaining()
         return determine_scenarios(
@@ -293,6 +299,7 @@ class TestDetermineScenariosMonteCarlo:
             completed=[],
             remaining=remaining,
             n_samples=n_samples,
+            max_workers=max_workers,
         )
 
     def test_denom_equals_n_samples(self):
@@ -327,3 +334,162 @@ class TestDetermineScenariosMonteCarlo:
         r = self._run(n_samples=2_000)
         for team in self.TEAMS:
             assert r.first_counts[team] > 0, f"{team} never seeded 1st in 2000 samples"
+
+    def test_max_workers_matches_single_process(self):
+        """Samples are drawn before the pool starts, so a seeded run gives the same totals in parallel."""
+        random.seed(2025)
+        serial = self._run(n_samples=500)
+        random.seed(2025)
+        parallel = self._run(n_samples=500, max_workers=2)
+        assert parallel.denom_weighted == serial.denom_weighted
+        assert parallel.coinflip_teams == serial.coinflip_teams
+        for team in self.TEAMS:
+            assert parallel.first_counts[team] == pytest.approx(serial.first_counts[team])
+            assert parallel.fourth_counts_weighted[team] == pytest.approx(serial.fourth_counts_weighted[team])
+
+
+# ---------------------------------------------------------------------------
+# Parallel mask enumeration
+# ---------------------------------------------------------------------------
+
+
+class TestDetermineScenariosParallel:
+    """max_workers > 1 splits the 2^R loop across processes without changing the totals."""
+
+    def test_matches_single_process(self):
+        """Chunked process-pool enumeration reproduces the sequential seed counts."""
+        serial = determine_scenarios(teams_3_7a, expected_3_7a_completed_games, expected_3_7a_remaining_games)
+        parallel = determine_scenarios(
+            teams_3_7a, expected_3_7a_completed_games, expected_3_7a_remaining_games, max_workers=2
+        )
+        assert parallel.denom == serial.denom
+        assert parallel.denom_weighted == pytest.approx(serial.denom_weighted)
+        assert parallel.coinflip_teams == serial.coinflip_teams
+        for team in teams_3_7a:
+            assert parallel.first_counts[team] == pytest.approx(serial.first_counts[team])
+            assert parallel.second_counts[team] == pytest.approx(serial.second_counts[team])
+            assert parallel.third_counts[team] == pytest.approx(serial.third_counts[team])
+            assert parallel.fourth_counts_weighted[team] == pytest.approx(serial.fourth_counts_weighted[team])
+
+
+# ---------------------------------------------------------------------------
+# Coin flips below the playoff seeds
+# ---------------------------------------------------------------------------
+
+
+def _seven_team_region():
+    """A-D beat everyone below them by 5; E beat F and F beat G by 5; E-G remains.
+
+    When G beats E, E/F/G finish 1-5 in a perfect H2H cycle at seeds 5-7, and
+    only a 5-point G win leaves their capped H2H PD level, so the coin flip
+    happens at a non-default margin.
+    """
+    teams = list("ABCDEFG")
+    completed = []
+    for i, winner in enumerate(teams):
+        for loser in teams[i + 1 :]:
+            if winner in "ABCD" or (winner, loser) in {("E", "F"), ("F", "G")}:
+                completed.append(CompletedGame(winner, loser, 1, 5, 14, 19))
+    return teams, completed, [RemainingGame("E", "G")]
+
+
+class TestDetermineScenariosNonPlayoffCoinFlips:
+    """Tie buckets below seed 4 skip seed crediting but still report their coin flips."""
+
+    def test_flip_at_non_default_margin_is_reported(self):
+        """The E/F/G flip needs a 5-point margin and is still recorded."""
+        teams, completed, remaining = _seven_team_region()
+        r = determine_scenarios(teams, completed, remaining)
+        assert r.coinflip_teams == {"E", "F", "G"}
+
+    def test_seed_counts_unaffected(self):
+        """A-D hold seeds 1-4 in every outcome."""
+        teams, completed, remaining = _seven_team_region()
+        r = determine_scenarios(teams, completed, remaining)
+        assert r.first_counts == {"A": 2.0}
+        assert r.fourth_counts == {"D": 2.0}
+
+
+# ---------------------------------------------------------------------------
+# odds_epsilon pruning
+# ---------------------------------------------------------------------------
+
+
+class TestDetermineScenariosOddsEpsilon:
+    """odds_epsilon resolves low-weight masks at the default margin and reports their weight."""
+
+    def test_default_is_exact(self):
+        """Without odds_epsilon nothing is pruned."""
+        r = determine_scenarios(teams_3_7a, expected_3_7a_completed_games, expected_3_7a_remaining_games)
+        assert r.pruned_weight == 0.0
+
+    def test_pruned_weight_reported(self):
+        """Masks below odds_epsilon are counted once each and their weight is reported."""
+        n_masks = 1 << len(expected_3_7a_remaining_games)
+        r = determine_scenarios(
+            teams_3_7a,
+            expected_3_7a_completed_games,
+            expected_3_7a_remaining_games,
+            odds_epsilon=1.0,
+        )
+        assert r.pruned_weight == pytest.approx(1.0)
+        assert r.denom == n_masks
+        for team in teams_3_7a:
+            total = r.first_counts[team] + r.second_counts[team] + r.third_counts[team] + r.fourth_counts[team]
+            assert total <= n_masks + 1e-9
+        assert sum(r.first_counts.values()) == pytest.approx(n_masks)
+
+    def test_ignore_margins_prunes_nothing(self):
+        """With ignore_margins no mask would enumerate margins, so no weight is reported as pruned."""
+        r = determine_scenarios(
+            teams_3_7a,
+            expected_3_7a_completed_games,
+            expected_3_7a_remaining_games,
+            ignore_margins=True,
+            odds_epsilon=1.0,
+        )
+        expected = determine_scenarios(
+            teams_3_7a, expected_3_7a_completed_games, expected_3_7a_remaining_games, ignore_margins=True
+        )
+        assert r.pruned_weight == 0.0
+        assert r == expected
+
+    def test_masks_without_contending_ties_are_not_counted(self):
+        """A mask whose only ties sit below the playoff seeds would not enumerate margins, so it is not counted."""
+        teams, completed, remaining = _seven_team_region()
+        r = determine_scenarios(teams, completed, remaining, odds_epsilon=1.0)
+        expected = determine_scenarios(teams, completed, remaining)
+        assert r.pruned_weight == 0.0
+        assert r.first_counts_weighted == expected.first_counts_weighted
+        assert r.fourth_counts_weighted == expected.fourth_counts_weighted
+
+
+# ---------------------------------------------------------------------------
+# _mask_weights
+# ---------------------------------------------------------------------------
+
+
+class TestMaskWeights:
+    """The doubling weight table matches a per-mask product of game probabilities."""
+
+    def test_matches_per_mask_product_exactly(self):
+        """Every weight equals the in-order product of win/loss factors, bit for bit."""
+        game_probs = [0.37, 0.81, 0.5, 0.123]
+        weights = _mask_weights(game_probs, 0, 1 << len(game_probs))
+        for mask, weight in enumerate(weights):
+            expected = 1.0
+            for bit_index, p in enumerate(game_probs):
+                expected *= p if (mask >> bit_index) & 1 else 1.0 - p
+            assert weight == expected
+
+    def test_returns_requested_span(self):
+        """A chunk ``[mask_lo, mask_hi)`` gets the same weights as the full table's slice."""
+        game_probs = [0.6, 0.25, 0.9]
+        assert _mask_weights(game_probs, 3, 7) == _mask_weights(game_probs, 0, 8)[3:7]
+
+    def test_pool_chunks_match_full_table(self):
+        """Every process-pool chunk, aligned or not, reproduces its slice of the full table."""
+        game_probs = [0.3, 0.55, 0.9, 0.12, 0.71, 0.5, 0.66]
+        full = _mask_weights(game_probs, 0, 1 << len(game_probs))
+        for lo, hi in split_range(len(full), 12):
+            assert _mask_weights(game_probs, lo, hi) == full[lo:hi]
@@ -1,11 +1,16 @@
 """Direct unit tests for tiebreaker internals.
 
 Covers:
-- standings_from_mask and build_h2h_maps tie-game branches.
-- step2_step4_arrays None-return branches (no game vs outside opponent).
+- standings_from_mask and build_h2h_maps tie-game branches and prebuilt completed maps.
+- step2_step4_arrays None-return branches (no game vs outside opponent) and prebuilt vs index.
+- _key_step2 / _key_step4 packed sort keys.
 - unique_intra_bucket_games and sensitive_boundary_games.
 - resolve_with_results (public API for human-readable results entry).
-- resolve_standings_for_mask coin_flip_collector population.
+- resolve_standings_for_mask coin_flip_collector population and precomputed mask standings.
+- resolve_bucket building Steps 2-4 only for buckets that reach them.
+- make_cached_resolver memoization, including vectors differing only in untied teams' games.
+- record_ids_for_masks batched record grouping.
+- results_across_margin_range / _orders_across_margin_range change-point bisection.
 
 All tests use a 4-team "diamond" setup unless noted:
     Teams: Alpha, Beta, Gamma, Delta
@@ -13,17 +18,28 @@ All tests use a 4-team "diamond" setup unless noted:
     Gamma and Delta serve as outside-team opponents.
 """
 
+from itertools import product
+
 from backend.helpers.data_classes import CompletedGame, RemainingGame
 from backend.helpers.tiebreakers import (
+    _key_step2,
+    _key_step4,
+    _orders_across_margin_range,
+    _partition_by,
     base_bucket_order,
     build_h2h_maps,
+    build_vs_index,
+    make_cached_resolver,
+    record_ids_for_masks,
     resolve_bucket,
     resolve_standings_for_mask,
     resolve_standings_with_trace,
     resolve_with_results,
+    results_across_margin_range,
     sensitive_boundary_games,
     standings_from_mask,
     step2_step4_arrays,
+    tie_bucket_groups,
     unique_intra_bucket_games,
 )
 
@@ -95,6 +111,23 @@ def test_build_h2h_maps_tie_game():
     assert capped_pd[("Beta", "Alpha")] == -4
 
 
+def test_build_h2h_maps_from_completed_maps_matches_full_build():
+    """Starting from prebuilt completed-game maps gives the same tallies and leaves them untouched."""
+    completed = [
+        CompletedGame(a="Alpha", b="Beta", res_a=0, pd_a=4, pa_a=14, pa_b=18),
+        CompletedGame(a="Alpha", b="Gamma", res_a=1, pd_a=20, pa_a=27, pa_b=7),
+    ]
+    remaining = [RemainingGame(a="Alpha", b="Beta"), RemainingGame(a="Beta", b="Gamma")]
+    margins = {("Alpha", "Beta"): 15}
+    completed_maps = build_h2h_maps(completed, [], 0, {})
+    snapshot = [dict(m) for m in completed_maps]
+    for mask in range(4):
+        assert build_h2h_maps(completed, remaining, mask, margins, completed_maps=completed_maps) == build_h2h_maps(
+            completed, remaining, mask, margins
+        )
+    assert [dict(m) for m in completed_maps] == snapshot
+
+
 # ---------------------------------------------------------------------------
 # step2_step4_arrays — None branches (lines 186, 189, 203)
 # These fire when a tied team has no game (completed or remaining) vs an
@@ -103,7 +136,7 @@ def test_build_h2h_maps_tie_game():
 
 
 def test_step2_step4_arrays_no_game_vs_outside():
-    """res_vs and pd_vs return None when a tied team never played an outside team."""
+    """step2_step4_arrays reports None in both arrays when a tied team never played an outside team."""
     # 4-team setup: Alpha and Beta tied; Gamma and Delta are outside.
     # Only Alpha has a game vs Gamma; neither team has a game vs Delta.
     teams = ["Alpha", "Beta", "Delta", "Gamma"]
@@ -131,7 +164,7 @@ def test_step2_step4_arrays_no_game_vs_outside():
 
 
 def test_step2_step4_arrays_tie_vs_outside():
-    """res_vs returns 1 (tie encoding) when a completed game has res_a == 0."""
+    """step2_step4_arrays encodes 1 (tie encoding) when a completed game has res_a == 0."""
     teams = ["Alpha", "Beta", "Gamma"]
     completed = [
         CompletedGame(a="Alpha", b="Gamma", res_a=0, pd_a=0, pa_a=14, pa_b=14),
@@ -141,15 +174,58 @@ def test_step2_step4_arrays_tie_vs_outside():
 
     step2, _ = step2_step4_arrays(teams, pair, base_order, completed, [], 0, {})
 
-    # outside = ["Gamma"]; Alpha vs Gamma is a tie → res_vs == 1
+    # outside = ["Gamma"]; Alpha vs Gamma is a tie → Step 2 entry == 1
     assert step2["Alpha"] == [1]
 
 
+def test_step2_step4_arrays_with_vs_index_matches_rebuilt_index():
+    """A prebuilt build_vs_index gives the same arrays for both orientations of every game."""
+    teams = ["Alpha", "Beta", "Delta", "Gamma"]
+    completed = [
+        CompletedGame(a="Alpha", b="Gamma", res_a=-1, pd_a=-20, pa_a=27, pa_b=7),
+        CompletedGame(a="Beta", b="Delta", res_a=0, pd_a=0, pa_a=14, pa_b=14),
+    ]
+    remaining = [RemainingGame(a="Alpha", b="Delta"), RemainingGame(a="Beta", b="Gamma")]
+    margins = {("Alpha", "Delta"): 15, ("Beta", "Gamma"): 3}
+    vs_index = build_vs_index(completed, remaining)
+    for bucket, base_order in ((["Alpha", "Beta"], teams), (["Delta", "Gamma"], teams[::-1])):
+        for mask in range(4):
+            assert step2_step4_arrays(
+                teams, bucket, base_order, completed, remaining, mask, margins, vs_index=vs_index
+            ) == step2_step4_arrays(teams, bucket, base_order, completed, remaining, mask, margins)
+    # Gamma beat Alpha by 20: capped to ±12 from each side.
+    assert vs_index[0][("Alpha", "Gamma")] == (0, -12)
+    assert vs_index[0][("Gamma", "Alpha")] == (2, 12)
+
+
 # ---------------------------------------------------------------------------
 # unique_intra_bucket_games
 # ---------------------------------------------------------------------------
 
 
+def test_packed_step_keys_order_rows_lexicographically():
+    """Packed Step 2/4 keys rank equal-length rows like comparing them entry by entry.
+
+    Better values come first and a missing game (None) is worst in every slot.
+    """
+
+    def worst_last(row, best_first):
+        """Reference key: rank each entry by its position in *best_first*."""
+        return tuple(best_first.index(x) for x in row)
+
+    step2_values = [2, 1, 0, None]
+    step4_values = [*range(12, -13, -1), None]
+    cases = (
+        (_key_step2, step2_values, step2_values),
+        (_key_step4, step4_values, [12, 3, 0, -1, -12, None]),
+    )
+    for key_func, values, sample in cases:
+        rows = [list(r) for r in product(sample, repeat=3)]
+        by_packed = sorted(rows, key=key_func)
+        assert by_packed == sorted(rows, key=lambda r, v=values: worst_last(r, v))
+        assert len({key_func(r) for r in rows}) == len({tuple(r) for r in rows})
+
+
 def test_unique_intra_bucket_games_returns_shared_games():
     """Games between teams in the same multi-team bucket are returned."""
     # Alpha and Beta are in a 2-team tie bucket; Gamma is solo.
@@ -395,6 +471,53 @@ def test_resolve_bucket_no_collector_runs_silently():
     assert len(result) == 2
 
 
+def test_resolve_bucket_last_step_reports_groups_still_tied():
+    """With last_step=2 a group that only Steps 3-5 could break is reported, not resolved by PA.
+
+    Alpha and Beta split their games 2-0 vs outside with no H2H meeting, so
+    Steps 1-2 cannot separate them even though Step 3/4 (PD) later could.
+    """
+    teams = ["Alpha", "Beta", "Delta", "Gamma"]
+    completed = [
+        CompletedGame(a="Alpha", b="Delta", res_a=1, pd_a=10, pa_a=14, pa_b=24),
+        CompletedGame(a="Alpha", b="Gamma", res_a=1, pd_a=10, pa_a=14, pa_b=24),
+        CompletedGame(a="Beta", b="Delta", res_a=1, pd_a=3, pa_a=14, pa_b=17),
+        CompletedGame(a="Beta", b="Gamma", res_a=1, pd_a=3, pa_a=14, pa_b=17),
+    ]
+    wl_totals = standings_from_mask(teams, completed, [], 0, pa_win=14, margins={})
+    base_order = base_bucket_order(teams, wl_totals)
+    still_tied: list[list[str]] = []
+    full_flips: list[list[str]] = []
+
+    args = (["Alpha", "Beta"], teams, wl_totals, base_order, completed, [], 0, {})
+    resolve_bucket(*args, coin_flip_collector=still_tied, last_step=2)
+    resolve_bucket(*args, coin_flip_collector=full_flips)
+
+    assert still_tied == [["Alpha", "Beta"]]
+    assert full_flips == []
+
+
+def test_resolve_bucket_split_at_step1_skips_step2_step4_arrays(monkeypatch):
+    """A bucket Step 1 breaks never builds the Step 2/4 arrays.
+
+    Alpha beat Beta head-to-head, so Step 1 resolves the bucket outright and
+    the later steps' tallies are never needed.
+    """
+    teams = ["Alpha", "Beta", "Delta", "Gamma"]
+    completed = [*_BASE_COMPLETED, CompletedGame(a="Alpha", b="Beta", res_a=1, pd_a=3, pa_a=14, pa_b=17)]
+    wl_totals = _make_wl_totals(Alpha={"w": 3}, Beta={"w": 2, "l": 1})
+    base_order = base_bucket_order(teams, wl_totals)
+
+    def _fail(*args, **kwargs):
+        """Stand-in for step2_step4_arrays that must not be reached."""
+        raise AssertionError("Step 2/4 arrays built for a bucket Step 1 resolved")
+
+    monkeypatch.setattr("backend.helpers.tiebreakers.step2_step4_arrays", _fail)
+    result = resolve_bucket(["Alpha", "Beta"], teams, wl_totals, base_order, completed, [], 0, {})
+
+    assert result == ["Alpha", "Beta"]
+
+
 # ---------------------------------------------------------------------------
 # resolve_standings_with_trace — step_trace_collector populated
 # ---------------------------------------------------------------------------
@@ -508,3 +631,204 @@ def test_standings_from_mask_skips_game_with_non_region_team():
     assert result["Alpha"]["w"] == 1
     assert result["Beta"]["l"] == 1
     assert "External" not in result
+
+
+# ---------------------------------------------------------------------------
+# make_cached_resolver
+# ---------------------------------------------------------------------------
+
+_CACHE_COMPLETED = [
+    CompletedGame(a="Alpha", b="Beta", res_a=1, pd_a=7, pa_a=14, pa_b=21),
+    CompletedGame(a="Alpha", b="Delta", res_a=1, pd_a=7, pa_a=14, pa_b=21),
+    CompletedGame(a="Beta", b="Gamma", res_a=1, pd_a=7, pa_a=14, pa_b=21),
+]
+_CACHE_REMAINING = [RemainingGame(a="Alpha", b="Gamma"), RemainingGame(a="Beta", b="Delta")]
+
+
+def test_cached_resolver_matches_direct_resolution():
+    """Every (mask, margins) pair resolves to the same order and coin flips as the uncached call."""
+    resolve = make_cached_resolver(_TEAMS, _CACHE_COMPLETED, _CACHE_REMAINING)
+    for mask in range(4):
+        for m in (1, 7, 12):
+            margins = {("Alpha", "Gamma"): m, ("Beta", "Delta"): 13 - m}
+            flips: list[list[str]] = []
+            expected = resolve_standings_for_mask(
+                _TEAMS, _CACHE_COMPLETED, _CACHE_REMAINING, mask, margins, coin_flip_collector=flips
+            )
+            order, coin_flips = resolve(mask, margins)
+            assert order == tuple(expected)
+            assert coin_flips == tuple(tuple(g) for g in flips)
+
+
+def test_cached_resolver_caps_margins_like_direct_resolution():
+    """Margins past the ±12 cap feed Step 3 through the resolver's own capped-PD tally unchanged."""
+    resolve = make_cached_resolver(_TEAMS, _CACHE_COMPLETED, _CACHE_REMAINING)
+    for mask in range(4):
+        for m in (12, 13, 30):
+            margins = {("Alpha", "Gamma"): m, ("Beta", "Delta"): 40 - m}
+            expected = resolve_standings_for_mask(_TEAMS, _CACHE_COMPLETED, _CACHE_REMAINING, mask, margins)
+            assert resolve(mask, margins)[0] == tuple(expected)
+
+
+def test_cached_resolver_keys_on_remaining_game_margins_only():
+    """Omitted margins fall back to the default and unrelated keys are ignored, so both hit the cache."""
+    resolve = make_cached_resolver(_TEAMS, _CACHE_COMPLETED, _CACHE_REMAINING)
+    first = resolve(3, {("Alpha", "Gamma"): 7})
+    second = resolve(3, {("Alpha", "Gamma"): 7, ("Beta", "Delta"): 7, ("Alpha", "Beta"): 3})
+    assert first == second
+    info = resolve.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
+def test_cached_resolver_by_vector_shares_the_dict_cache():
+    """A margin tuple aligned with remaining resolves to the same cached entry as the equivalent dict."""
+    resolve = make_cached_resolver(_TEAMS, _CACHE_COMPLETED, _CACHE_REMAINING)
+    by_dict = resolve(2, {("Alpha", "Gamma"): 3, ("Beta", "Delta"): 11})
+    assert resolve.by_vector(2, (3, 11)) == by_dict
+    assert resolve.cache_info().hits == 1
+
+
+def test_cached_resolver_shares_vectors_differing_only_in_untied_games():
+    """Margins of games without a tied team are ignored by the cache key; tied-team margins are not.
+
+    Mask 1 leaves no two teams level, so no margin matters; under mask 3
+    Gamma and Delta tie and both games involve one of them.
+    """
+    resolve = make_cached_resolver(_TEAMS, _CACHE_COMPLETED, _CACHE_REMAINING)
+    assert resolve.by_vector(1, (3, 11)) == resolve.by_vector(1, (12, 1))
+    assert resolve.cache_info().hits == 1
+    resolve.by_vector(3, (3, 11))
+    resolve.by_vector(3, (12, 1))
+    info = resolve.cache_info()
+    assert (info.hits, info.misses) == (1, 3)
+
+
+_SPLIT_TEAMS = ["Alpha", "Beta", "Delta", "Epsilon", "Gamma", "Zeta"]
+_SPLIT_COMPLETED = [
+    CompletedGame(a="Alpha", b="Delta", res_a=1, pd_a=3, pa_a=14, pa_b=17),
+    CompletedGame(a="Delta", b="Epsilon", res_a=0, pd_a=-7, pa_a=21, pa_b=14),
+    CompletedGame(a="Epsilon", b="Gamma", res_a=1, pd_a=3, pa_a=14, pa_b=17),
+    CompletedGame(a="Epsilon", b="Zeta", res_a=1, pd_a=14, pa_a=14, pa_b=28),
+    CompletedGame(a="Alpha", b="Zeta", res_a=1, pd_a=3, pa_a=14, pa_b=17),
+    CompletedGame(a="Beta", b="Epsilon", res_a=0, pd_a=-14, pa_a=28, pa_b=14),
+]
+_SPLIT_REMAINING = [RemainingGame(a="Alpha", b="Beta"), RemainingGame(a="Alpha", b="Gamma")]
+
+
+def test_cached_resolver_re_resolves_only_the_bucket_whose_games_changed():
+    """Two independent ties are cached separately, so changing one game re-resolves one bucket.
+
+    Under mask 3 Alpha wins both games, leaving Beta/Delta and Gamma/Zeta
+    tied at 0-2; each tie is settled on PA by the margin of its own game.
+    """
+    resolve = make_cached_resolver(_SPLIT_TEAMS, _SPLIT_COMPLETED, _SPLIT_REMAINING)
+    for m0, m1 in [(1, 1), (12, 1), (12, 12), (1, 12)]:
+        margins = {("Alpha", "Beta"): m0, ("Alpha", "Gamma"): m1}
+        expected = resolve_standings_for_mask(_SPLIT_TEAMS, _SPLIT_COMPLETED, _SPLIT_REMAINING, 3, margins)
+        assert list(resolve(3, margins)[0]) == expected
+    info = resolve.bucket_cache_info()
+    assert (info.hits, info.misses) == (4, 4)
+
+
+def test_resolve_with_mask_standings_matches_rebuilt_standings():
+    """Passing precomputed (wl_totals, base_order, tie_buckets) resolves exactly like rebuilding them."""
+    for mask in range(4):
+        margins = {("Alpha", "Gamma"): 3, ("Beta", "Delta"): 10}
+        wl = standings_from_mask(_TEAMS, _CACHE_COMPLETED, _CACHE_REMAINING, mask, 14, margins)
+        standings = (wl, base_bucket_order(_TEAMS, wl), tie_bucket_groups(_TEAMS, wl))
+        expected = resolve_standings_for_mask(_TEAMS, _CACHE_COMPLETED, _CACHE_REMAINING, mask, margins)
+        assert (
+            resolve_standings_for_mask(
+                _TEAMS, _CACHE_COMPLETED, _CACHE_REMAINING, mask, margins, mask_standings=standings
+            )
+            == expected
+        )
+
+
+# ---------------------------------------------------------------------------
+# record_ids_for_masks
+# ---------------------------------------------------------------------------
+
+
+def test_record_ids_match_per_mask_records():
+    """Masks share a record id exactly when standings_from_mask gives every team the same W/L/T."""
+    completed = _CACHE_COMPLETED + [CompletedGame(a="Delta", b="Gamma", res_a=0, pd_a=0, pa_a=10, pa_b=10)]
+    remaining = _CACHE_REMAINING + [RemainingGame(a="Alpha", b="Beta")]
+    ids = record_ids_for_masks(_TEAMS, completed, remaining, 1, 8)
+    assert len(ids) == 7
+    records = []
+    for mask in range(1, 8):
+        wl = standings_from_mask(_TEAMS, completed, remaining, mask, 14, {})
+        records.append(tuple((wl[t]["w"], wl[t]["l"], wl[t]["t"]) for t in _TEAMS))
+    for i in range(7):
+        for j in range(7):
+            assert (ids[i] == ids[j]) == (records[i] == records[j])
+
+
+# ---------------------------------------------------------------------------
+# _orders_across_margin_range
+# ---------------------------------------------------------------------------
+
+
+def test_margin_range_constant_order_probes_only_endpoints():
+    """A margin-insensitive game is settled by the two endpoint resolutions."""
+    probed: list[int] = []
+
+    def resolve_at(m):
+        probed.append(m)
+        return ["Alpha", "Beta"]
+
+    assert _orders_across_margin_range(resolve_at) == {("Alpha", "Beta")}
+    assert sorted(probed) == [1, 12]
+
+
+def test_margin_range_finds_every_knife_edge():
+    """Both change points of a three-step ordering are found without probing all 12 margins."""
+    probed: list[int] = []
+
+    def resolve_at(m):
+        probed.append(m)
+        if m < 4:
+            return ["Alpha", "Beta", "Gamma"]
+        if m < 9:
+            return ["Beta", "Alpha", "Gamma"]
+        return ["Beta", "Gamma", "Alpha"]
+
+    orders = _orders_across_margin_range(resolve_at)
+    assert orders == {("Alpha", "Beta", "Gamma"), ("Beta", "Alpha", "Gamma"), ("Beta", "Gamma", "Alpha")}
+    assert len(probed) == len(set(probed)) < 12
+
+
+def test_margin_range_keeps_order_between_adjacent_change_points():
+    """An ordering held at a single margin between two change points is still found."""
+
+    def resolve_at(m):
+        if m < 11:
+            return ["Alpha", "Beta", "Gamma"]
+        if m == 11:
+            return ["Beta", "Alpha", "Gamma"]
+        return ["Beta", "Gamma", "Alpha"]
+
+    orders = _orders_across_margin_range(resolve_at)
+    assert orders == {("Alpha", "Beta", "Gamma"), ("Beta", "Alpha", "Gamma"), ("Beta", "Gamma", "Alpha")}
+
+
+def test_results_across_margin_range_matches_every_margin():
+    """The per-margin results equal a probe of all 12 margins, with the flat runs filled in."""
+    probed: list[int] = []
+
+    def resolve_at(m):
+        probed.append(m)
+        return "low" if m <= 5 else "high"
+
+    assert results_across_margin_range(resolve_at) == ["low"] * 5 + ["high"] * 7
+    assert len(probed) == len(set(probed)) < 12
+
+
+def test_partition_by_two_team_tie_returns_a_new_list():
+    """A two-team tie comes back as a fresh group, never the caller's own list."""
+    items = ["Alpha", "Beta"]
+    (group,) = _partition_by(items, lambda t: 0)
+    assert group == items
+    assert group is not items